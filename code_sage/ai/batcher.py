@@ -0,0 +1,96 @@
+"""Background write-through batching for enriched issues."""
+
+import queue
+import threading
+from typing import Callable, List, Optional
+
+from code_sage.core.logger import get_logger
+from code_sage.core.models import Issue
+
+_SENTINEL = object()
+
+
+class EnrichmentBatcher:
+    """
+    Hand enriched issues to a sink in batches from a background thread.
+
+    Producers only pay for a queue put. The worker blocks for the first
+    issue, drains whatever else is already queued (up to ``batch_size``,
+    waiting at most ``flush_interval`` seconds for more) and passes the batch
+    to the sink in one call.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[List[Issue]], None],
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+    ):
+        """
+        Initialize the batcher and start its worker thread.
+
+        Args:
+            sink: Callable that persists a batch of issues
+            batch_size: Maximum issues per sink call
+            flush_interval: Seconds to wait for more issues before flushing
+        """
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.logger = get_logger()
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="code-sage-enrichment-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, issue: Issue) -> None:
+        """
+        Queue an enriched issue for persistence.
+
+        Args:
+            issue: Enriched issue
+        """
+        self._queue.put(issue)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush pending issues and stop the worker thread.
+
+        Args:
+            timeout: Seconds to wait for the worker to finish
+        """
+        self._queue.put(_SENTINEL)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        """Worker loop: block for the first issue, drain the rest, flush."""
+        while True:
+            first = self._queue.get()
+            if first is _SENTINEL:
+                return
+
+            batch: List[Issue] = [first]  # type: ignore[list-item]
+            stop = self._drain(batch)
+            self._flush(batch)
+            if stop:
+                return
+
+    def _drain(self, batch: List[Issue]) -> bool:
+        """Fill a batch from the queue; returns True if the sentinel was seen."""
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                return False
+            if item is _SENTINEL:
+                return True
+            batch.append(item)  # type: ignore[arg-type]
+        return False
+
+    def _flush(self, batch: List[Issue]) -> None:
+        """Pass a batch to the sink, logging rather than raising on failure."""
+        try:
+            self.sink(batch)
+        except Exception as e:
+            self.logger.warning("Failed to persist %d enriched issues: %s", len(batch), e)
@@ -0,0 +1,226 @@
+"""Response caching for AI providers."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from code_sage.core.exceptions import CacheError
+from code_sage.core.logger import get_logger
+
+
+class LLMCache:
+    """Persistent cache for LLM responses backed by SQLite."""
+
+    def __init__(self, cache_dir: Path, ttl_seconds: int = 86400):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            ttl_seconds: Time-to-live for cached responses
+
+        Raises:
+            CacheError: If the cache database cannot be opened
+        """
+        self.ttl_seconds = ttl_seconds
+        self.logger = get_logger()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(cache_dir / "llm_responses.sqlite"), check_same_thread=False
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            raise CacheError(f"Cannot open LLM cache in {cache_dir}: {e}")
+
+    @staticmethod
+    def make_key(provider: str, model: str, temperature: float, system: str, prompt: str) -> str:
+        """
+        Build a deterministic cache key for a request.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            temperature: Sampling temperature
+            system: System prompt
+            prompt: User prompt
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "temperature": temperature,
+                "system": system,
+                "prompt": prompt,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response or None on miss/expiry
+        """
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT value, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and time.time() - row[1] > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                    row = None
+            except sqlite3.Error as e:
+                self.logger.warning(f"LLM cache read failed: {e}")
+                row = None
+
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["hits"] += 1
+            value: str = row[0]
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_key()
+            value: Response text
+        """
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                    (key, value, time.time()),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self.logger.warning(f"LLM cache write failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._conn.close()
+
+
+class SemanticLLMCache:
+    """
+    In-memory cache that reuses responses for semantically similar prompts.
+
+    Prompts are embedded locally with sentence-transformers and compared by
+    cosine similarity against all stored prompts in a single matrix-vector
+    product. Requires the optional ``numpy`` and ``sentence-transformers``
+    packages.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        model_name: str = "all-MiniLM-L6-v2",
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a hit
+            model_name: sentence-transformers model used for embeddings
+
+        Raises:
+            CacheError: If the optional dependencies are not installed
+        """
+        try:
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise CacheError(
+                f"Semantic cache requires numpy and sentence-transformers: {e}"
+            )
+
+        self._np = np
+        self._model = SentenceTransformer(model_name)
+        self.similarity_threshold = similarity_threshold
+        self.logger = get_logger()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+        # namespace -> (contiguous float32 embedding matrix, row count, responses)
+        self._entries: Dict[str, Tuple[Any, int, List[str]]] = {}
+
+    def _embed(self, text: str) -> Any:
+        """Embed and L2-normalize a prompt."""
+        vector = self._model.encode(text, normalize_embeddings=True)
+        return self._np.ascontiguousarray(vector, dtype=self._np.float32)
+
+    def get(self, namespace: str, prompt: str) -> Optional[str]:
+        """
+        Look up a response for a similar prompt.
+
+        Args:
+            namespace: Partition key (provider, model and system prompt)
+            prompt: User prompt
+
+        Returns:
+            Cached response or None if nothing is similar enough
+        """
+        query = self._embed(prompt)
+
+        with self._lock:
+            entry = self._entries.get(namespace)
+            if entry is not None and entry[1] > 0:
+                matrix, count, responses = entry
+                similarities = matrix[:count] @ query
+                best = int(similarities.argmax())
+                if similarities[best] >= self.similarity_threshold:
+                    self.stats["hits"] += 1
+                    return responses[best]
+
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, namespace: str, prompt: str, response: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            namespace: Partition key (provider, model and system prompt)
+            prompt: User prompt
+            response: Response text
+        """
+        np = self._np
+        vector = self._embed(prompt)
+
+        with self._lock:
+            matrix, count, responses = self._entries.get(
+                namespace, (np.empty((16, vector.shape[0]), dtype=np.float32), 0, [])
+            )
+            if count == matrix.shape[0]:
+                # Grow geometrically so the matrix stays one contiguous block
+                grown = np.empty((count * 2, matrix.shape[1]), dtype=np.float32)
+                grown[:count] = matrix
+                matrix = grown
+
+            matrix[count] = vector
+            responses.append(response)
+            self._entries[namespace] = (matrix, count + 1, responses)
@@ -1,58 +1,151 @@
 """AI-powered issue enrichment."""
 
-from typing import List, Optional
+import asyncio
+import heapq
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from code_sage.core.models import Issue, FileAnalysis
+from code_sage.core.models import Issue, FileAnalysis, IssueSeverity, IssueCategory
 from code_sage.core.config import Config
+from code_sage.ai.batcher import EnrichmentBatcher
+from code_sage.ai.cache import LLMCache, SemanticLLMCache
 from code_sage.ai.provider import get_ai_provider
+from code_sage.ai.tokens import estimate_tokens
+from code_sage.core.exceptions import AIProviderError, CacheError
 from code_sage.core.logger import get_logger
 from code_sage.utils.file_utils import read_file
 from pathlib import Path
 
 
+_LANGUAGE_MAP = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".java": "java",
+    ".go": "go",
+    ".rs": "rust",
+    ".rb": "ruby",
+    ".php": "php",
+}
+
+# Category ranks (weighted as in IssueAggregator.rank_issues) break ties
+# between issues of equal severity so the priority sort compares plain ints.
+_CATEGORY_RANK = {
+    IssueCategory.SECURITY: 20,
+    IssueCategory.BUG: 15,
+    IssueCategory.TYPE_ERROR: 10,
+    IssueCategory.PERFORMANCE: 8,
+    IssueCategory.BEST_PRACTICE: 5,
+    IssueCategory.COMPLEXITY: 4,
+    IssueCategory.CODE_SMELL: 3,
+    IssueCategory.MAINTAINABILITY: 3,
+    IssueCategory.DUPLICATION: 2,
+    IssueCategory.STYLE: 1,
+}
+
+
+def _priority(issue: Issue) -> int:
+    """Sort key ranking issues for enrichment, highest first."""
+    return issue.severity_rank * 32 + _CATEGORY_RANK[issue.category]
+
+
 class AIEnrichment:
     """Enrich issues with AI-powered explanations and fixes."""
 
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        sink: Optional[Callable[[List[Issue]], None]] = None,
+    ):
         """
         Initialize AI enrichment.
 
         Args:
             config: Configuration object
+            sink: Optional callable that persists batches of enriched issues;
+                it runs on a background thread so enrichment never waits on it
         """
         self.config = config or Config()
         self.logger = get_logger()
-        self.provider = get_ai_provider(self.config.ai)
+        self.batcher = EnrichmentBatcher(sink) if sink else None
+        self.cache = self._create_cache()
+        self.semantic_cache = self._create_semantic_cache()
+        self.provider = get_ai_provider(
+            self.config.ai, cache=self.cache, semantic_cache=self.semantic_cache
+        )
+
+    def close(self) -> None:
+        """Flush pending enriched issues to the sink and release the response cache."""
+        if self.batcher:
+            self.batcher.close()
+            self.batcher = None
+        if self.cache:
+            self.cache.close()
+            self.cache = None
+
+    def _publish(self, issue: Issue) -> None:
+        """Hand an enriched issue to the background batcher, if any."""
+        if self.batcher:
+            self.batcher.submit(issue)
+
+    def _create_cache(self) -> Optional[LLMCache]:
+        """Create the response cache, or None if caching is disabled or unavailable."""
+        if not self.config.cache.enabled:
+            return None
+
+        try:
+            return LLMCache(
+                Path(self.config.cache.cache_dir) / "llm", ttl_seconds=self.config.ai.cache_ttl
+            )
+        except CacheError as e:
+            self.logger.warning(f"LLM response cache disabled: {e}")
+            return None
+
+    def _create_semantic_cache(self) -> Optional[SemanticLLMCache]:
+        """Create the semantic cache if enabled and its dependencies are installed."""
+        if not (self.config.ai.enabled and self.config.ai.semantic_cache):
+            return None
+
+        try:
+            return SemanticLLMCache(self.config.ai.similarity_threshold)
+        except CacheError as e:
+            self.logger.warning(f"Semantic cache disabled: {e}")
+            return None
 
-    def _add_ai_explanation(self, issue: Issue) -> None:
+    def _add_ai_explanation(self, issue: Issue, language: str) -> None:
         """Add AI explanation to an issue."""
         if not issue.ai_explanation and self.provider:
             issue.ai_explanation = self.provider.explain_issue(
                 issue_description=issue.description,
-                code=issue.code_snippet or "",
-                language=self._infer_language(issue),
+                code=issue.get_snippet() or "",
+                language=language,
             )
 
-    def _add_ai_fix_suggestion(self, issue: Issue) -> None:
+    def _needs_fix(self, issue: Issue) -> bool:
+        """Check whether an issue should get an AI fix suggestion."""
+        return not issue.suggested_fix and issue.severity.value in ["critical", "high", "medium"]
+
+    def _add_ai_fix_suggestion(self, issue: Issue, language: str) -> None:
         """Add AI fix suggestion to an issue."""
-        if (not issue.suggested_fix and 
-            issue.severity.value in ["critical", "high", "medium"] and 
-            self.provider):
+        if self._needs_fix(issue) and self.provider:
             fix_result = self.provider.suggest_fix(
                 issue_description=issue.description,
-                code=issue.code_snippet or "",
-                language=self._infer_language(issue),
+                code=issue.get_snippet() or "",
+                language=language,
             )
             issue.suggested_fix = fix_result.get("fixed_code", "")
             issue.fix_description = fix_result.get("explanation", "")
 
-    def _enrich_single_issue(self, issue: Issue) -> Issue:
+    def _enrich_single_issue(self, issue: Issue, language: str) -> Issue:
         """Enrich a single issue with AI analysis."""
         try:
-            self._add_ai_explanation(issue)
-            self._add_ai_fix_suggestion(issue)
+            self._add_ai_explanation(issue, language)
+            self._add_ai_fix_suggestion(issue, language)
             self.logger.debug(f"Enriched issue: {issue.title}")
+            self._publish(issue)
         except Exception as e:
             self.logger.warning(f"Failed to enrich issue {issue.id}: {e}")
         return issue
@@ -72,22 +165,277 @@ class AIEnrichment:
             self.logger.info("AI provider not enabled, skipping enrichment")
             return issues
 
+        if max_issues <= 0 or not issues:
+            return issues
+
         # Prioritize critical/high severity issues
-        sorted_issues = sorted(
-            issues, key=lambda x: (x.severity.value, x.category.value), reverse=True
-        )
-        
-        issues_to_enrich = sorted_issues[:max_issues]
+        issues_to_enrich, remaining = self._select_for_enrichment(issues, max_issues)
         self.logger.info(f"Enriching {len(issues_to_enrich)} issues with AI")
 
-        # Enrich selected issues
-        enriched = [self._enrich_single_issue(issue) for issue in issues_to_enrich]
-        
+        # Enrich selected issues concurrently; the calls are network-bound
+        enriched = self._enrich_parallel(issues_to_enrich)
+
         # Add remaining issues without enrichment
-        enriched.extend(sorted_issues[max_issues:])
+        enriched.extend(remaining)
 
         return enriched
 
+    @staticmethod
+    def _select_for_enrichment(
+        issues: List[Issue], max_issues: int
+    ) -> Tuple[List[Issue], List[Issue]]:
+        """
+        Pick the highest-priority issues to enrich.
+
+        Uses a bounded heap, O(N log K), rather than sorting every issue
+        when only the top few are sent to the provider.
+
+        Args:
+            issues: Candidate issues
+            max_issues: Maximum number of issues to enrich
+
+        Returns:
+            Tuple of (issues to enrich in priority order, remaining issues in input order)
+        """
+        if max_issues >= len(issues):
+            return sorted(issues, key=_priority, reverse=True), []
+
+        top = heapq.nlargest(max_issues, issues, key=_priority)
+        selected = {id(issue) for issue in top}
+        return top, [issue for issue in issues if id(issue) not in selected]
+
+    def _batch_item(self, issue: Issue, language: str) -> dict:
+        """Build the provider batch payload for an issue."""
+        return {
+            "description": issue.description,
+            "code": issue.get_snippet() or "",
+            "language": language,
+            "needs_fix": self._needs_fix(issue),
+        }
+
+    def _apply_batch_results(self, issues: List[Issue], results: List[dict]) -> None:
+        """Copy batch explanations and fixes onto their issues."""
+        for issue, result in zip(issues, results):
+            if not issue.ai_explanation:
+                issue.ai_explanation = result["explanation"]
+            if self._needs_fix(issue) and result["fixed_code"]:
+                issue.suggested_fix = result["fixed_code"]
+                issue.fix_description = result["explanation"]
+            self._publish(issue)
+
+    async def enrich_issues_async(self, issues: List[Issue], max_issues: int = 10) -> List[Issue]:
+        """
+        Enrich issues with AI explanations using the providers' async clients.
+
+        All batches are in flight at once on a single event loop, bounded by
+        ``ai.concurrency``.
+
+        Args:
+            issues: List of issues to enrich
+            max_issues: Maximum number of issues to enrich (for API cost control)
+
+        Returns:
+            Enriched issues
+        """
+        if not self.provider:
+            self.logger.info("AI provider not enabled, skipping enrichment")
+            return issues
+
+        if max_issues <= 0 or not issues:
+            return issues
+
+        issues_to_enrich, remaining = self._select_for_enrichment(issues, max_issues)
+        self.logger.info(f"Enriching {len(issues_to_enrich)} issues with AI")
+
+        if issues_to_enrich:
+            groups = self._group_duplicates(issues_to_enrich)
+            semaphore = asyncio.Semaphore(self.config.ai.concurrency or 8)
+            results = await asyncio.gather(
+                *[
+                    self._enrich_chunk_async(chunk, semaphore)
+                    for chunk in self._chunk_by_tokens(self._representatives(groups))
+                ],
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.warning(f"Failed to enrich issue batch: {result}")
+            self._fan_out(groups)
+
+        # Issues are enriched in place
+        return issues_to_enrich + remaining
+
+    def _enrich_parallel(self, issues: List[Issue]) -> List[Issue]:
+        """Enrich issues in batches on a thread pool, preserving input order."""
+        if not issues:
+            return []
+
+        # Only one issue per identical prompt goes to the provider
+        groups = self._group_duplicates(issues)
+        chunks = self._chunk_by_tokens(self._representatives(groups))
+        max_workers = min(self.config.ai.concurrency or 8, len(chunks))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._enrich_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.warning(f"Failed to enrich issue batch: {e}")
+
+        self._fan_out(groups)
+
+        # Issues are enriched in place
+        return list(issues)
+
+    def _group_duplicates(self, issues: List[Issue]) -> List[Tuple[str, List[Issue]]]:
+        """
+        Group issues that would send byte-identical prompts, keeping first-seen order.
+
+        Returns:
+            (language, issues) pairs; the language is inferred once per issue here
+            and carried through batching and the per-issue fallback
+        """
+        groups: Dict[Tuple[str, str, str, bool], List[Issue]] = defaultdict(list)
+        for issue in issues:
+            key = (
+                issue.description,
+                issue.get_snippet() or "",
+                self._infer_language(issue),
+                self._needs_fix(issue),
+            )
+            groups[key].append(issue)
+        return [(key[2], group) for key, group in groups.items()]
+
+    @staticmethod
+    def _representatives(groups: List[Tuple[str, List[Issue]]]) -> List[Tuple[str, Issue]]:
+        """Pick the first issue of each group, with the group's language."""
+        return [(language, group[0]) for language, group in groups]
+
+    def _fan_out(self, groups: List[Tuple[str, List[Issue]]]) -> None:
+        """Copy each group representative's enrichment onto its duplicates."""
+        for _, (representative, *duplicates) in groups:
+            for issue in duplicates:
+                if not issue.ai_explanation:
+                    issue.ai_explanation = representative.ai_explanation
+                if self._needs_fix(issue) and representative.suggested_fix:
+                    issue.suggested_fix = representative.suggested_fix
+                    issue.fix_description = representative.fix_description
+                self._publish(issue)
+
+    def _chunk_by_tokens(
+        self, items: List[Tuple[str, Issue]]
+    ) -> List[List[Tuple[str, Issue]]]:
+        """Split (language, issue) pairs into chunks that fit the batch prompt token budget."""
+        budget = self.config.ai.batch_token_budget
+        chunks: List[List[Tuple[str, Issue]]] = []
+        current: List[Tuple[str, Issue]] = []
+        used = 0
+
+        for item in items:
+            issue = item[1]
+            # Per-issue prompt framing adds roughly 50 tokens
+            snippet_tokens = estimate_tokens(issue.get_snippet() or "")
+            if self.config.ai.max_snippet_tokens > 0:
+                snippet_tokens = min(snippet_tokens, self.config.ai.max_snippet_tokens)
+            cost = estimate_tokens(issue.description) + snippet_tokens + 50
+            if current and used + cost > budget:
+                chunks.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += cost
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _pending(self, chunk: List[Tuple[str, Issue]]) -> List[Tuple[str, Issue]]:
+        """Keep the chunk's issues that still lack an explanation or a fix."""
+        return [
+            (language, issue)
+            for language, issue in chunk
+            if not issue.ai_explanation or self._needs_fix(issue)
+        ]
+
+    def _enrich_chunk(self, chunk: List[Tuple[str, Issue]]) -> None:
+        """Enrich a chunk with one batched request, falling back to per-issue calls."""
+        provider = self.provider
+        if not provider:
+            return
+
+        pending = self._pending(chunk)
+        if len(pending) > 1:
+            try:
+                results = provider.batch_enrich(
+                    [self._batch_item(issue, language) for language, issue in pending]
+                )
+            except AIProviderError as e:
+                self.logger.debug(f"Batch enrichment failed, retrying per issue: {e}")
+            else:
+                self._apply_batch_results([issue for _, issue in pending], results)
+                return
+
+        for language, issue in pending:
+            self._enrich_single_issue(issue, language)
+
+    async def _enrich_chunk_async(
+        self, chunk: List[Tuple[str, Issue]], semaphore: asyncio.Semaphore
+    ) -> None:
+        """Async variant of _enrich_chunk(); each request holds a semaphore slot."""
+        provider = self.provider
+        if not provider:
+            return
+
+        pending = self._pending(chunk)
+        if len(pending) > 1:
+            try:
+                async with semaphore:
+                    results = await provider.batch_enrich_async(
+                        [self._batch_item(issue, language) for language, issue in pending]
+                    )
+            except AIProviderError as e:
+                self.logger.debug(f"Batch enrichment failed, retrying per issue: {e}")
+            else:
+                self._apply_batch_results([issue for _, issue in pending], results)
+                return
+
+        await asyncio.gather(
+            *[
+                self._enrich_single_issue_async(issue, language, semaphore)
+                for language, issue in pending
+            ]
+        )
+
+    async def _enrich_single_issue_async(
+        self, issue: Issue, language: str, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Enrich a single issue with the async provider API."""
+        provider = self.provider
+        if not provider:
+            return
+
+        try:
+            if not issue.ai_explanation:
+                async with semaphore:
+                    issue.ai_explanation = await provider.explain_issue_async(
+                        issue_description=issue.description,
+                        code=issue.get_snippet() or "",
+                        language=language,
+                    )
+            if self._needs_fix(issue):
+                async with semaphore:
+                    fix_result = await provider.suggest_fix_async(
+                        issue_description=issue.description,
+                        code=issue.get_snippet() or "",
+                        language=language,
+                    )
+                issue.suggested_fix = fix_result.get("fixed_code", "")
+                issue.fix_description = fix_result.get("explanation", "")
+            self.logger.debug(f"Enriched issue: {issue.title}")
+            self._publish(issue)
+        except Exception as e:
+            self.logger.warning(f"Failed to enrich issue {issue.id}: {e}")
+
     def enrich_file_analysis(self, file_analysis: FileAnalysis) -> FileAnalysis:
         """
         Enrich a file analysis with AI.
@@ -104,22 +452,7 @@ class AIEnrichment:
         file_analysis.issues = self.enrich_issues(file_analysis.issues)
         return file_analysis
 
-    def _infer_language(self, issue: Issue) -> str:
+    @staticmethod
+    def _infer_language(issue: Issue) -> str:
         """Infer language from file path."""
-        file_path = Path(issue.location.file_path)
-        ext = file_path.suffix.lower()
-
-        language_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".jsx": "javascript",
-            ".ts": "typescript",
-            ".tsx": "typescript",
-            ".java": "java",
-            ".go": "go",
-            ".rs": "rust",
-            ".rb": "ruby",
-            ".php": "php",
-        }
-
-        return language_map.get(ext, "unknown")
+        return _LANGUAGE_MAP.get(Path(issue.location.file_path).suffix.lower(), "unknown")
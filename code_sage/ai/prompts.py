@@ -0,0 +1,87 @@
+"""Prompt templates shared by all AI providers.
+
+Templates use ``str.format`` fields; literal braces are doubled.
+"""
+
+ANALYZE_SYSTEM_PROMPT = "You are an expert code reviewer and static analysis tool."
+EXPLAIN_SYSTEM_PROMPT = "You are an expert software engineer explaining code issues."
+FIX_SYSTEM_PROMPT = "You are an expert programmer fixing code issues."
+BATCH_SYSTEM_PROMPT = (
+    "You are an expert software engineer reviewing static analysis findings. "
+    "Respond only with JSON."
+)
+
+ANALYZE_TEMPLATE = """Analyze this {language} code and identify potential issues, bugs, or improvements:
+
+Context: {context}
+
+Code:
+```{language}
+{code}
+```
+
+Provide a concise analysis focusing on:
+1. Potential bugs or errors
+2. Security vulnerabilities
+3. Performance issues
+4. Best practice violations
+5. Suggested improvements
+"""
+
+EXPLAIN_TEMPLATE = """Explain this code issue in detail:
+
+Issue: {description}
+
+Code ({language}):
+```{language}
+{code}
+```
+
+Provide:
+1. Why this is an issue
+2. Potential impact
+3. How to fix it
+4. Best practices to avoid it
+
+Keep the explanation clear and concise."""
+
+FIX_TEMPLATE = """Suggest a fix for this code issue:
+
+Issue: {description}
+
+Original Code ({language}):
+```{language}
+{code}
+```
+
+Provide:
+1. Brief explanation of the fix
+2. Fixed code
+
+Format your response as:
+EXPLANATION:
+[your explanation]
+FIXED_CODE:
+```{language}
+[fixed code]
+```
+"""
+
+BATCH_HEADER_TEMPLATE = "Below are {count} code issues numbered 1..{count}.\n\n"
+
+BATCH_ITEM_TEMPLATE = """### Issue {number} ({mode})
+Issue: {description}
+
+Code ({language}):
+```{language}
+{code}
+```"""
+
+BATCH_FOOTER = """
+
+For each issue, explain why it is a problem, its potential impact and how to fix it.
+For issues marked "explain and fix", also provide the fixed code.
+
+Return a JSON object of the form:
+{"results": [{"id": <issue number>, "explanation": "...", "fixed_code": "..."}]}
+Use an empty string for fixed_code when no fix was requested."""
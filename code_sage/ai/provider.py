@@ -1,47 +1,236 @@
 """AI provider abstraction layer."""
 
+import asyncio
+import json
+import re
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
-import openai
-from anthropic import Anthropic
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Type
 
+from code_sage.ai import prompts
+from code_sage.ai.cache import LLMCache, SemanticLLMCache
+from code_sage.ai.rate_limiter import get_rate_limiter
+from code_sage.ai.tokens import estimate_tokens, truncate_tokens
 from code_sage.core.config import AIConfig
 from code_sage.core.exceptions import AIProviderError
 from code_sage.core.logger import get_logger
 
+# The SDKs are imported where the providers use them; both are slow to import
+if TYPE_CHECKING:
+    import openai
+    from anthropic import AsyncAnthropic
+
+
+# Opening fences with a language tag (longest names first) or bare closing fences
+_FENCE_RE = re.compile(r"```(?:javascript|typescript|python|java|tsx|jsx|go|ts|js)?")
+
+
 
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
 
-    def __init__(self, config: AIConfig):
+    name = "base"
+
+    def __init__(
+        self,
+        config: AIConfig,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticLLMCache] = None,
+    ):
         """
         Initialize AI provider.
 
         Args:
             config: AI configuration
+            cache: Optional response cache
+            semantic_cache: Optional cache for near-duplicate prompts
         """
         self.config = config
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.model = ""
         self.logger = get_logger()
 
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Response cache hit/miss counters."""
+        return dict(self.cache.stats) if self.cache else {"hits": 0, "misses": 0}
+
     @abstractmethod
-    def analyze_code(self, code: str, context: str, language: str) -> str:
+    def _create(self, system_prompt: str, prompt: str, json_mode: bool = False) -> str:
         """
-        Analyze code and provide suggestions.
+        Send a single completion request to the provider.
 
         Args:
-            code: Code snippet to analyze
-            context: Additional context
-            language: Programming language
+            system_prompt: System instructions
+            prompt: User prompt
+            json_mode: Whether to request a JSON object response
 
         Returns:
-            AI analysis and suggestions
+            Response text
         """
         pass
 
-    @abstractmethod
-    def explain_issue(self, issue_description: str, code: str, language: str) -> str:
+    async def _acreate(self, system_prompt: str, prompt: str, json_mode: bool = False) -> str:
         """
-        Explain an issue in detail.
+        Send a single completion request without blocking the event loop.
+
+        Providers with an async SDK client override this; the default runs
+        the synchronous request in the loop's executor.
+
+        Args:
+            system_prompt: System instructions
+            prompt: User prompt
+            json_mode: Whether to request a JSON object response
+
+        Returns:
+            Response text
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self._create, system_prompt, prompt, json_mode)
+        )
+
+    def _complete(
+        self, system_prompt: str, prompt: str, semantic: bool = False, json_mode: bool = False
+    ) -> str:
+        """
+        Get a completion, serving deterministic requests from the cache.
+
+        Only requests with temperature 0 are cached exactly, since sampled
+        responses are expected to vary between calls. When ``semantic`` is set
+        and a semantic cache is configured, a response to a sufficiently
+        similar earlier prompt is reused as well.
+
+        Args:
+            system_prompt: System instructions
+            prompt: User prompt
+            semantic: Whether near-duplicate prompts may share a response
+            json_mode: Whether to request a JSON object response
+
+        Returns:
+            Response text
+        """
+        cached, key, namespace = self._cache_lookup(system_prompt, prompt, semantic)
+        if cached is not None:
+            return cached
+
+        self._throttle(system_prompt, prompt)
+        content = self._create(system_prompt, prompt, json_mode=json_mode)
+        self._cache_store(key, namespace, prompt, content)
+        return content
+
+    async def _acomplete(
+        self, system_prompt: str, prompt: str, semantic: bool = False, json_mode: bool = False
+    ) -> str:
+        """
+        Async variant of _complete() sharing the same caches and rate limiter.
+
+        Args:
+            system_prompt: System instructions
+            prompt: User prompt
+            semantic: Whether near-duplicate prompts may share a response
+            json_mode: Whether to request a JSON object response
+
+        Returns:
+            Response text
+        """
+        cached, key, namespace = self._cache_lookup(system_prompt, prompt, semantic)
+        if cached is not None:
+            return cached
+
+        await self._throttle_async(system_prompt, prompt)
+        content = await self._acreate(system_prompt, prompt, json_mode=json_mode)
+        self._cache_store(key, namespace, prompt, content)
+        return content
+
+    def _cache_lookup(
+        self, system_prompt: str, prompt: str, semantic: bool
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Look a request up in the exact and semantic caches.
+
+        Returns:
+            Tuple of (cached response, exact cache key, semantic namespace);
+            the key and namespace are None when that cache does not apply
+        """
+        key = None
+        if self.cache is not None and self.config.temperature == 0:
+            key = LLMCache.make_key(
+                self.name, self.model, self.config.temperature, system_prompt, prompt
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached, key, None
+
+        namespace = None
+        if semantic and self.semantic_cache is not None:
+            namespace = LLMCache.make_key(
+                self.name, self.model, self.config.temperature, system_prompt, ""
+            )
+            cached = self.semantic_cache.get(namespace, prompt)
+            if cached is not None:
+                return cached, key, namespace
+
+        return None, key, namespace
+
+    def _cache_store(
+        self, key: Optional[str], namespace: Optional[str], prompt: str, content: str
+    ) -> None:
+        """Store a fresh response in whichever caches the lookup selected."""
+        if key is not None and self.cache is not None:
+            self.cache.set(key, content)
+        if namespace is not None and self.semantic_cache is not None:
+            self.semantic_cache.set(namespace, prompt, content)
+
+    def _throttle(self, system_prompt: str, prompt: str) -> None:
+        """Block until the shared rate limiter for this model admits a request."""
+        if self.config.requests_per_minute <= 0 or self.config.tokens_per_minute <= 0:
+            return
+
+        limiter = get_rate_limiter(
+            self.name, self.model, self.config.requests_per_minute, self.config.tokens_per_minute
+        )
+        # Completion tokens count against the quota too; budget for the maximum
+        tokens = estimate_tokens(system_prompt + prompt, self.model) + self.config.max_tokens
+        limiter.acquire(tokens)
+
+    async def _throttle_async(self, system_prompt: str, prompt: str) -> None:
+        """Wait without blocking the event loop until the rate limiter admits a request."""
+        if self.config.requests_per_minute <= 0 or self.config.tokens_per_minute <= 0:
+            return
+
+        limiter = get_rate_limiter(
+            self.name, self.model, self.config.requests_per_minute, self.config.tokens_per_minute
+        )
+        tokens = estimate_tokens(system_prompt + prompt, self.model) + self.config.max_tokens
+        await limiter.acquire_async(tokens)
+
+    def _truncate(self, code: str) -> str:
+        """Bound a code snippet to the configured prompt token budget."""
+        return truncate_tokens(code, self.config.max_snippet_tokens, self.model)
+
+    def _build_explain_prompt(self, issue_description: str, code: str, language: str) -> str:
+        """Build the prompt asking for an issue explanation."""
+        return prompts.EXPLAIN_TEMPLATE.format(
+            description=issue_description, code=self._truncate(code), language=language
+        )
+
+    def _build_fix_prompt(self, issue_description: str, code: str, language: str) -> str:
+        """Build the prompt asking for a fix in EXPLANATION/FIXED_CODE format."""
+        return prompts.FIX_TEMPLATE.format(
+            description=issue_description, code=self._truncate(code), language=language
+        )
+
+    def _build_analyze_prompt(self, code: str, context: str, language: str) -> str:
+        """Build the prompt asking for a general code review."""
+        return prompts.ANALYZE_TEMPLATE.format(
+            context=context, code=self._truncate(code), language=language
+        )
+
+    async def explain_issue_async(self, issue_description: str, code: str, language: str) -> str:
+        """
+        Explain an issue in detail without blocking the event loop.
 
         Args:
             issue_description: Issue description
@@ -51,12 +240,18 @@ class AIProvider(ABC):
         Returns:
             Detailed explanation
         """
-        pass
+        try:
+            prompt = self._build_explain_prompt(issue_description, code, language)
+            return await self._acomplete(prompts.EXPLAIN_SYSTEM_PROMPT, prompt, semantic=True)
+        except Exception as e:
+            self.logger.error(f"{self.name} API error: {e}")
+            raise AIProviderError(f"Failed to explain issue: {e}")
 
-    @abstractmethod
-    def suggest_fix(self, issue_description: str, code: str, language: str) -> Dict[str, str]:
+    async def suggest_fix_async(
+        self, issue_description: str, code: str, language: str
+    ) -> Dict[str, str]:
         """
-        Suggest a fix for an issue.
+        Suggest a fix for an issue without blocking the event loop.
 
         Args:
             issue_description: Issue description
@@ -66,303 +261,352 @@ class AIProvider(ABC):
         Returns:
             Dictionary with 'explanation' and 'fixed_code' keys
         """
-        pass
+        try:
+            prompt = self._build_fix_prompt(issue_description, code, language)
+            content = await self._acomplete(prompts.FIX_SYSTEM_PROMPT, prompt, semantic=True)
+            return self._parse_fix_response(content)
+        except Exception as e:
+            self.logger.error(f"{self.name} API error: {e}")
+            raise AIProviderError(f"Failed to suggest fix: {e}")
 
+    def batch_enrich(self, issues: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        Explain (and optionally fix) several issues in a single request.
 
-class OpenAIProvider(AIProvider):
-    """OpenAI GPT provider."""
+        Args:
+            issues: Dictionaries with 'description', 'code', 'language' and
+                'needs_fix' keys
 
-    def __init__(self, config: AIConfig):
-        """Initialize OpenAI provider."""
-        super().__init__(config)
-        
-        if not config.openai_api_key:
-            raise AIProviderError("OpenAI API key not configured")
-        
-        openai.api_key = config.openai_api_key
-        self.model = config.openai_model
+        Returns:
+            One dictionary per input issue, in order, with 'explanation' and
+            'fixed_code' keys
 
-    def analyze_code(self, code: str, context: str, language: str) -> str:
-        """Analyze code using GPT."""
+        Raises:
+            AIProviderError: If the request fails or the response is not
+                valid JSON covering every issue
+        """
+        prompt = self._build_batch_prompt(issues)
         try:
-            prompt = f"""Analyze this {language} code and identify potential issues, bugs, or improvements:
-
-Context: {context}
-
-Code:
-```{language}
-{code}
-```
-
-Provide a concise analysis focusing on:
-1. Potential bugs or errors
-2. Security vulnerabilities
-3. Performance issues
-4. Best practice violations
-5. Suggested improvements
-"""
-
-            response = openai.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert code reviewer and static analysis tool."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                timeout=self.config.timeout,
-            )
-
-            return response.choices[0].message.content
-
+            content = self._complete(prompts.BATCH_SYSTEM_PROMPT, prompt, json_mode=True)
         except Exception as e:
-            self.logger.error(f"OpenAI API error: {e}")
-            raise AIProviderError(f"Failed to analyze code: {e}")
+            self.logger.error(f"{self.name} API error: {e}")
+            raise AIProviderError(f"Failed to enrich batch: {e}")
 
-    def explain_issue(self, issue_description: str, code: str, language: str) -> str:
-        """Explain issue using GPT."""
-        try:
-            prompt = f"""Explain this code issue in detail:
-
-Issue: {issue_description}
-
-Code ({language}):
-```{language}
-{code}
-```
-
-Provide:
-1. Why this is an issue
-2. Potential impact
-3. How to fix it
-4. Best practices to avoid it
-
-Keep the explanation clear and concise."""
-
-            response = openai.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert software engineer explaining code issues."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                timeout=self.config.timeout,
-            )
+        return self._parse_batch_response(content, len(issues))
 
-            return response.choices[0].message.content
+    async def batch_enrich_async(self, issues: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        Async variant of batch_enrich().
 
-        except Exception as e:
-            self.logger.error(f"OpenAI API error: {e}")
-            raise AIProviderError(f"Failed to explain issue: {e}")
+        Args:
+            issues: Dictionaries with 'description', 'code', 'language' and
+                'needs_fix' keys
 
-    def suggest_fix(self, issue_description: str, code: str, language: str) -> Dict[str, str]:
-        """Suggest fix using GPT."""
-        try:
-            prompt = f"""Suggest a fix for this code issue:
-
-Issue: {issue_description}
-
-Original Code ({language}):
-```{language}
-{code}
-```
-
-Provide:
-1. Brief explanation of the fix
-2. Fixed code
-
-Format your response as:
-EXPLANATION:
-[your explanation]
-
-FIXED_CODE:
-```{language}
-[fixed code]
-```
-"""
-
-            response = openai.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert programmer fixing code issues."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                timeout=self.config.timeout,
-            )
+        Returns:
+            One dictionary per input issue, in order, with 'explanation' and
+            'fixed_code' keys
 
-            content = response.choices[0].message.content
-            return self._parse_fix_response(content)
+        Raises:
+            AIProviderError: If the request fails or the response is not
+                valid JSON covering every issue
+        """
+        prompt = self._build_batch_prompt(issues)
 
+        try:
+            content = await self._acomplete(prompts.BATCH_SYSTEM_PROMPT, prompt, json_mode=True)
         except Exception as e:
-            self.logger.error(f"OpenAI API error: {e}")
-            raise AIProviderError(f"Failed to suggest fix: {e}")
+            self.logger.error(f"{self.name} API error: {e}")
+            raise AIProviderError(f"Failed to enrich batch: {e}")
+
+        return self._parse_batch_response(content, len(issues))
+
+    def _build_batch_prompt(self, issues: List[Dict[str, Any]]) -> str:
+        """Build the numbered multi-issue prompt used by batch enrichment."""
+        sections = [
+            prompts.BATCH_ITEM_TEMPLATE.format(
+                number=i,
+                mode="explain and fix" if issue.get("needs_fix") else "explain only",
+                description=issue["description"],
+                language=issue["language"],
+                code=self._truncate(issue["code"]),
+            )
+            for i, issue in enumerate(issues, 1)
+        ]
+        return (
+            prompts.BATCH_HEADER_TEMPLATE.format(count=len(issues))
+            + "\n\n".join(sections)
+            + prompts.BATCH_FOOTER
+        )
 
     def _parse_fix_response(self, response: str) -> Dict[str, str]:
-        """Parse fix response."""
-        parts = response.split("FIXED_CODE:")
-        explanation = parts[0].replace("EXPLANATION:", "").strip()
-        
-        fixed_code = ""
-        if len(parts) > 1:
-            fixed_code = parts[1].strip()
-            # Remove code fence markers
-            fixed_code = fixed_code.replace("```python", "").replace("```javascript", "")
-            fixed_code = fixed_code.replace("```typescript", "").replace("```", "")
-            fixed_code = fixed_code.strip()
-
+        """Parse an EXPLANATION/FIXED_CODE fix response."""
+        explanation, _, fixed_code = response.partition("FIXED_CODE:")
         return {
-            "explanation": explanation,
-            "fixed_code": fixed_code
+            "explanation": explanation.replace("EXPLANATION:", "").strip(),
+            # Remove code fence markers in one pass
+            "fixed_code": _FENCE_RE.sub("", fixed_code).strip(),
         }
 
+    def _parse_batch_response(self, response: str, count: int) -> List[Dict[str, str]]:
+        """Parse a batch response into per-issue results ordered by id."""
+        text = response.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
 
-class ClaudeProvider(AIProvider):
-    """Anthropic Claude provider."""
-
-    def __init__(self, config: AIConfig):
-        """Initialize Claude provider."""
-        super().__init__(config)
-        
-        if not config.anthropic_api_key:
-            raise AIProviderError("Anthropic API key not configured")
-        
-        self.client = Anthropic(api_key=config.anthropic_api_key)
-        self.model = config.anthropic_model
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise AIProviderError(f"Invalid JSON in batch response: {e}")
+
+        items = data.get("results", []) if isinstance(data, dict) else data
+        by_id: Dict[int, Dict[str, str]] = {}
+        for item in items if isinstance(items, list) else []:
+            try:
+                by_id[int(item["id"])] = {
+                    "explanation": str(item.get("explanation") or ""),
+                    "fixed_code": str(item.get("fixed_code") or ""),
+                }
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        missing = [i for i in range(1, count + 1) if i not in by_id]
+        if missing:
+            raise AIProviderError(f"Batch response missing results for issues {missing}")
+
+        return [by_id[i] for i in range(1, count + 1)]
 
     def analyze_code(self, code: str, context: str, language: str) -> str:
-        """Analyze code using Claude."""
-        try:
-            prompt = f"""Analyze this {language} code and identify potential issues, bugs, or improvements:
-
-Context: {context}
-
-Code:
-```{language}
-{code}
-```
-
-Provide a concise analysis focusing on:
-1. Potential bugs or errors
-2. Security vulnerabilities
-3. Performance issues
-4. Best practice violations
-5. Suggested improvements
-"""
-
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature,
-                messages=[{"role": "user", "content": prompt}]
-            )
+        """
+        Analyze code and provide suggestions.
 
-            return response.content[0].text
+        Args:
+            code: Code snippet to analyze
+            context: Additional context
+            language: Programming language
 
+        Returns:
+            AI analysis and suggestions
+        """
+        try:
+            prompt = self._build_analyze_prompt(code, context, language)
+            return self._complete(prompts.ANALYZE_SYSTEM_PROMPT, prompt)
         except Exception as e:
-            self.logger.error(f"Claude API error: {e}")
+            self.logger.error(f"{self.name} API error: {e}")
             raise AIProviderError(f"Failed to analyze code: {e}")
 
     def explain_issue(self, issue_description: str, code: str, language: str) -> str:
-        """Explain issue using Claude."""
-        try:
-            prompt = f"""Explain this code issue in detail:
-
-Issue: {issue_description}
-
-Code ({language}):
-```{language}
-{code}
-```
-
-Provide:
-1. Why this is an issue
-2. Potential impact
-3. How to fix it
-4. Best practices to avoid it
-
-Keep the explanation clear and concise."""
-
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature,
-                messages=[{"role": "user", "content": prompt}]
-            )
+        """
+        Explain an issue in detail.
 
-            return response.content[0].text
+        Args:
+            issue_description: Issue description
+            code: Code snippet
+            language: Programming language
 
+        Returns:
+            Detailed explanation
+        """
+        try:
+            prompt = self._build_explain_prompt(issue_description, code, language)
+            return self._complete(prompts.EXPLAIN_SYSTEM_PROMPT, prompt, semantic=True)
         except Exception as e:
-            self.logger.error(f"Claude API error: {e}")
+            self.logger.error(f"{self.name} API error: {e}")
             raise AIProviderError(f"Failed to explain issue: {e}")
 
     def suggest_fix(self, issue_description: str, code: str, language: str) -> Dict[str, str]:
-        """Suggest fix using Claude."""
-        try:
-            prompt = f"""Suggest a fix for this code issue:
-
-Issue: {issue_description}
-
-Original Code ({language}):
-```{language}
-{code}
-```
-
-Provide:
-1. Brief explanation of the fix
-2. Fixed code
-
-Format your response as:
-EXPLANATION:
-[your explanation]
-
-FIXED_CODE:
-```{language}
-[fixed code]
-```
-"""
-
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature,
-                messages=[{"role": "user", "content": prompt}]
-            )
+        """
+        Suggest a fix for an issue.
 
-            content = response.content[0].text
-            return self._parse_fix_response(content)
+        Args:
+            issue_description: Issue description
+            code: Code snippet
+            language: Programming language
 
+        Returns:
+            Dictionary with 'explanation' and 'fixed_code' keys
+        """
+        try:
+            prompt = self._build_fix_prompt(issue_description, code, language)
+            content = self._complete(prompts.FIX_SYSTEM_PROMPT, prompt, semantic=True)
+            return self._parse_fix_response(content)
         except Exception as e:
-            self.logger.error(f"Claude API error: {e}")
+            self.logger.error(f"{self.name} API error: {e}")
             raise AIProviderError(f"Failed to suggest fix: {e}")
 
-    def _parse_fix_response(self, response: str) -> Dict[str, str]:
-        """Parse fix response."""
-        parts = response.split("FIXED_CODE:")
-        explanation = parts[0].replace("EXPLANATION:", "").strip()
+
+class OpenAIProvider(AIProvider):
+    """OpenAI GPT provider."""
+
+    name = "openai"
+
+    def __init__(
+        self,
+        config: AIConfig,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticLLMCache] = None,
+    ):
+        """Initialize OpenAI provider."""
+        import openai
+
+        super().__init__(config, cache, semantic_cache)
+        
+        if not config.openai_api_key:
+            raise AIProviderError("OpenAI API key not configured")
         
-        fixed_code = ""
-        if len(parts) > 1:
-            fixed_code = parts[1].strip()
-            # Remove code fence markers
-            for lang in ["python", "javascript", "typescript", "java", "go"]:
-                fixed_code = fixed_code.replace(f"```{lang}", "")
-            fixed_code = fixed_code.replace("```", "").strip()
+        openai.api_key = config.openai_api_key
+        self.model = config.openai_model
+        self._aclient: Optional["openai.AsyncOpenAI"] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _create(self, system_prompt: str, prompt: str, json_mode: bool = False) -> str:
+        """Send a chat completion request to OpenAI."""
+        import openai
+
+        kwargs: Dict[str, Any] = {}
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+
+        stream = openai.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+            timeout=self.config.timeout,
+            stream=True,
+            **kwargs,
+        )
+
+        # Accumulate streamed deltas so long responses are read as they arrive
+        parts = []
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
+    async def _acreate(self, system_prompt: str, prompt: str, json_mode: bool = False) -> str:
+        """Send a chat completion request with the async OpenAI client."""
+        import openai
+
+        # The async client's connection pool is bound to the loop that created it
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = openai.AsyncOpenAI(api_key=self.config.openai_api_key)
+            self._aclient_loop = loop
+
+        kwargs: Dict[str, Any] = {}
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+
+        stream = await self._aclient.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+            timeout=self.config.timeout,
+            stream=True,
+            **kwargs,
+        )
+
+        parts = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
 
-        return {
-            "explanation": explanation,
-            "fixed_code": fixed_code
-        }
 
+class ClaudeProvider(AIProvider):
+    """Anthropic Claude provider."""
+
+    name = "anthropic"
 
-def get_ai_provider(config: AIConfig) -> Optional[AIProvider]:
+    def __init__(
+        self,
+        config: AIConfig,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticLLMCache] = None,
+    ):
+        """Initialize Claude provider."""
+        from anthropic import Anthropic
+
+        super().__init__(config, cache, semantic_cache)
+        
+        if not config.anthropic_api_key:
+            raise AIProviderError("Anthropic API key not configured")
+        
+        self.client = Anthropic(api_key=config.anthropic_api_key)
+        self.model = config.anthropic_model
+        self._aclient: Optional["AsyncAnthropic"] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _create(self, system_prompt: str, prompt: str, json_mode: bool = False) -> str:
+        """Send a messages request to Claude."""
+        messages = [{"role": "user", "content": prompt}]
+        if json_mode:
+            # Prefill the assistant turn so the reply starts as a JSON object
+            messages.append({"role": "assistant", "content": "{"})
+
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=self.config.max_tokens,
+            temperature=self.config.temperature,
+            system=system_prompt,
+            messages=messages
+        )
+
+        text = response.content[0].text
+        return "{" + text if json_mode else text
+
+    async def _acreate(self, system_prompt: str, prompt: str, json_mode: bool = False) -> str:
+        """Send a messages request with the async Anthropic client."""
+        from anthropic import AsyncAnthropic
+
+        # The async client's connection pool is bound to the loop that created it
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = AsyncAnthropic(api_key=self.config.anthropic_api_key)
+            self._aclient_loop = loop
+
+        messages = [{"role": "user", "content": prompt}]
+        if json_mode:
+            messages.append({"role": "assistant", "content": "{"})
+
+        response = await self._aclient.messages.create(
+            model=self.model,
+            max_tokens=self.config.max_tokens,
+            temperature=self.config.temperature,
+            system=system_prompt,
+            messages=messages
+        )
+
+        text = response.content[0].text
+        return "{" + text if json_mode else text
+
+
+# Provider classes keyed by AIConfig.provider
+_PROVIDERS: Dict[str, Type[AIProvider]] = {
+    OpenAIProvider.name: OpenAIProvider,
+    ClaudeProvider.name: ClaudeProvider,
+}
+
+
+def get_ai_provider(
+    config: AIConfig,
+    cache: Optional[LLMCache] = None,
+    semantic_cache: Optional[SemanticLLMCache] = None,
+) -> Optional[AIProvider]:
     """
     Get AI provider based on configuration.
 
     Args:
         config: AI configuration
+        cache: Optional response cache shared by the provider
+        semantic_cache: Optional cache for near-duplicate prompts
 
     Returns:
         AIProvider instance or None if not enabled/configured
@@ -371,12 +615,10 @@ def get_ai_provider(config: AIConfig) -> Optional[AIProvider]:
         return None
 
     try:
-        if config.provider == "openai":
-            return OpenAIProvider(config)
-        elif config.provider == "anthropic":
-            return ClaudeProvider(config)
-        else:
+        provider_cls = _PROVIDERS.get(config.provider)
+        if provider_cls is None:
             raise AIProviderError(f"Unknown AI provider: {config.provider}")
+        return provider_cls(config, cache, semantic_cache)
     except AIProviderError as e:
         # Return None if provider can't be initialized (e.g., missing API key)
         # The caller can check for None and skip AI features gracefully
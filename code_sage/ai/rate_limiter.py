@@ -0,0 +1,127 @@
+"""Client-side rate limiting for AI provider requests."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Tuple
+
+
+class RateLimiter:
+    """
+    Token bucket limiter for requests-per-minute and tokens-per-minute quotas.
+
+    Both buckets refill continuously at ``limit / 60`` per second and are capped
+    at one minute's worth of capacity. Callers block until both buckets can
+    cover the request, which keeps throughput just under the provider limits
+    instead of recovering from 429 responses.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per minute
+            tokens_per_minute: Maximum tokens per minute
+        """
+        self.max_requests = float(requests_per_minute)
+        self.max_tokens = float(tokens_per_minute)
+        self.available_request_capacity = self.max_requests
+        self.available_token_capacity = self.max_tokens
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Replenish both buckets for the time elapsed since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+
+        self.available_request_capacity = min(
+            self.max_requests,
+            self.available_request_capacity + self.max_requests * elapsed / 60.0,
+        )
+        self.available_token_capacity = min(
+            self.max_tokens,
+            self.available_token_capacity + self.max_tokens * elapsed / 60.0,
+        )
+
+    def try_acquire(self, tokens: int) -> float:
+        """
+        Reserve capacity for one request if available.
+
+        Args:
+            tokens: Estimated tokens consumed by the request
+
+        Returns:
+            0.0 if capacity was reserved, otherwise seconds to wait before retrying
+        """
+        # A single request larger than the bucket could never be admitted
+        needed: float = min(float(tokens), self.max_tokens)
+
+        with self._lock:
+            self._refill()
+
+            if self.available_request_capacity >= 1 and self.available_token_capacity >= needed:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= needed
+                return 0.0
+
+            request_wait = (1 - self.available_request_capacity) * 60.0 / self.max_requests
+            token_wait = (needed - self.available_token_capacity) * 60.0 / self.max_tokens
+            return max(request_wait, token_wait, 0.001)
+
+    def acquire(self, tokens: int) -> None:
+        """
+        Block until capacity for one request is available, then reserve it.
+
+        Args:
+            tokens: Estimated tokens consumed by the request
+        """
+        wait = self.try_acquire(tokens)
+        while wait > 0:
+            time.sleep(wait)
+            wait = self.try_acquire(tokens)
+
+    async def acquire_async(self, tokens: int) -> None:
+        """
+        Wait without blocking the event loop until capacity is available, then reserve it.
+
+        Args:
+            tokens: Estimated tokens consumed by the request
+        """
+        wait = self.try_acquire(tokens)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self.try_acquire(tokens)
+
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    provider: str, model: str, requests_per_minute: int, tokens_per_minute: int
+) -> RateLimiter:
+    """
+    Get the shared rate limiter for a provider model.
+
+    Limiters are process-wide so that every thread calling the same model
+    draws from the same quota.
+
+    Args:
+        provider: Provider name
+        model: Model name
+        requests_per_minute: Maximum requests per minute
+        tokens_per_minute: Maximum tokens per minute
+
+    Returns:
+        RateLimiter instance
+    """
+    key = (provider, model)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+            _limiters[key] = limiter
+        return limiter
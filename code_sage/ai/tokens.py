@@ -0,0 +1,80 @@
+"""Token counting helpers for AI requests."""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+_TRUNCATION_MARKER = "\n... [truncated] ...\n"
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: Optional[str]) -> Any:
+    """Get the tiktoken encoding for a model, or None if unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding("cl100k_base")
+        except KeyError:
+            # Unknown model (e.g. Claude); cl100k_base is a close enough approximation
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encodings are downloaded on first use and may be unavailable offline
+        return None
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Uses tiktoken when installed, otherwise assumes ~4 characters per token.
+
+    Args:
+        text: Text to measure
+        model: Model name used to pick the tokenizer
+
+    Returns:
+        Estimated token count
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """
+    Shorten a text to roughly ``max_tokens`` tokens, keeping its head and tail.
+
+    Args:
+        text: Text to shorten
+        max_tokens: Token budget (0 or less disables truncation)
+        model: Model name used to pick the tokenizer
+
+    Returns:
+        The original text if within budget, otherwise head + marker + tail
+    """
+    if max_tokens <= 0:
+        return text
+
+    head_budget = max_tokens // 2
+    tail_budget = max_tokens - head_budget
+    encoding = _get_encoding(model)
+
+    if encoding is None:
+        # ~4 characters per token, matching estimate_tokens()
+        if len(text) <= max_tokens * 4:
+            return text
+        return text[:head_budget * 4] + _TRUNCATION_MARKER + text[-tail_budget * 4:]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    truncated: str = (
+        encoding.decode(tokens[:head_budget])
+        + _TRUNCATION_MARKER
+        + encoding.decode(tokens[-tail_budget:])
+    )
+    return truncated
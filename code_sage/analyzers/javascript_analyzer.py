@@ -2,8 +2,12 @@
 
 import hashlib
 import json
+import re
+import threading
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet, Set, Tuple, Union
 import subprocess
 import tempfile
 
@@ -20,9 +24,54 @@ from code_sage.core.config import Config
 from code_sage.utils.file_utils import read_file
 
 
+_JS_EXTS = frozenset({".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"})
+_TS_EXTS = frozenset({".ts", ".tsx"})
+
+# Line breaks str.splitlines() recognizes besides "\n" ("\r\n" counts as one);
+# the scanners rewrite them to "\n" so their line numbers match the snippets
+_OTHER_LINE_BREAKS = re.compile("\r\n?|[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+# The same breaks in UTF-8 encoded text
+_OTHER_LINE_BREAKS_UTF8 = re.compile(b"\r\n?|[\x0b\x0c\x1c\x1d\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+# Rule ids shared by the regex and Hyperscan scanners, in per-line reporting order
+_RULE_CONSOLE_LOG, _RULE_LOOSE_EQ, _RULE_VAR, _RULE_EVAL = range(4)
+
+_hs_local = threading.local()
+
+
+@lru_cache(maxsize=None)
+def _get_hyperscan_db() -> Any:
+    """Compile the common-issue rules into one Hyperscan database, or None if unavailable."""
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[rb"\bconsole\.log\b", rb"==", rb"\bvar[ \t]", rb"\beval\s*\("],
+        ids=[_RULE_CONSOLE_LOG, _RULE_LOOSE_EQ, _RULE_VAR, _RULE_EVAL],
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * 4,
+    )
+    return db
+
+
+def _hyperscan_scratch(db: Any) -> Any:
+    """Get this thread's Hyperscan scratch space (scratch cannot be shared across threads)."""
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        import hyperscan
+
+        scratch = hyperscan.Scratch(db)
+        _hs_local.scratch = scratch
+    return scratch
+
+
 class JavaScriptAnalyzer(BaseAnalyzer):
     """Analyzer for JavaScript and TypeScript code."""
 
+    accepts_content = True
+
     def __init__(self, config: Optional[Config] = None):
         """Initialize JavaScript/TypeScript analyzer."""
         super().__init__(config)
@@ -34,14 +83,19 @@ class JavaScriptAnalyzer(BaseAnalyzer):
 
     def can_analyze(self, file_path: Path) -> bool:
         """Check if file is JavaScript or TypeScript."""
-        return file_path.suffix in [".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"]
+        return file_path.suffix in _JS_EXTS
+
+    def get_extensions(self) -> FrozenSet[str]:
+        """Get JavaScript and TypeScript file extensions."""
+        return _JS_EXTS
 
-    def analyze_file(self, file_path: Path) -> FileAnalysis:
+    def analyze_file(self, file_path: Path, content: Optional[str] = None) -> FileAnalysis:
         """
         Analyze a JavaScript/TypeScript file.
 
         Args:
             file_path: Path to JavaScript/TypeScript file
+            content: File contents if already read
 
         Returns:
             FileAnalysis with issues and metrics
@@ -49,10 +103,11 @@ class JavaScriptAnalyzer(BaseAnalyzer):
         self.issues = []
 
         try:
-            content = read_file(file_path)
+            if content is None:
+                content = read_file(file_path)
 
             # Determine if TypeScript
-            is_typescript = file_path.suffix in [".ts", ".tsx"]
+            is_typescript = file_path.suffix in _TS_EXTS
 
             # Run various checks
             self._check_syntax(file_path, content, is_typescript)
@@ -71,7 +126,7 @@ class JavaScriptAnalyzer(BaseAnalyzer):
             )
 
         except Exception as e:
-            self.logger.error(f"Error analyzing {file_path}: {e}")
+            self.logger.error("Error analyzing %s: %s", file_path, e)
             return FileAnalysis(
                 file_path=str(file_path),
                 language="javascript",
@@ -102,7 +157,7 @@ class JavaScriptAnalyzer(BaseAnalyzer):
                             line_end=e.lineNumber,
                             column_start=e.column,
                         ),
-                        code_snippet=self.get_code_snippet(file_path, e.lineNumber, e.lineNumber),
+                        code_snippet=self.format_snippet(content.splitlines(), e.lineNumber, e.lineNumber),
                         auto_fixable=False,
                     )
                 )
@@ -112,87 +167,200 @@ class JavaScriptAnalyzer(BaseAnalyzer):
     def _create_issue(self, file_path: Path, line_num: int, issue_type: str, 
                       title: str, description: str, severity: IssueSeverity,
                       category: IssueCategory, suggested_fix: str, 
-                      auto_fixable: bool = False) -> Issue:
-        """Helper to create an issue with consistent structure."""
+                      auto_fixable: bool = False, snippet: Optional[str] = None,
+                      path_str: Optional[str] = None) -> Issue:
+        """Helper to create an issue with consistent structure.
+
+        Pass ``snippet`` when the caller already has the file's lines, to avoid
+        re-reading the file for every issue, and ``path_str`` to reuse a
+        precomputed ``str(file_path)``.
+        """
+        if snippet is None:
+            snippet = self.get_code_snippet(file_path, line_num, line_num)
+        if path_str is None:
+            path_str = str(file_path)
         return Issue(
-            id=self._generate_issue_id(file_path, issue_type, line_num),
+            id=self._generate_issue_id(path_str, issue_type, line_num),
             title=title,
             description=description,
             severity=severity,
             category=category,
             location=CodeLocation(
-                file_path=str(file_path),
+                file_path=path_str,
                 line_start=line_num,
                 line_end=line_num,
             ),
-            code_snippet=self.get_code_snippet(file_path, line_num, line_num),
+            code_snippet=snippet,
             suggested_fix=suggested_fix,
             auto_fixable=auto_fixable,
         )
 
-    def _check_console_log(self, file_path: Path, line: str, line_num: int) -> None:
-        """Check for console.log statements."""
-        if "console.log" in line and not line.strip().startswith("//"):
-            self.issues.append(self._create_issue(
-                file_path, line_num, "console_log",
-                "Console.log Statement",
-                "console.log statements should be removed in production code",
-                IssueSeverity.LOW, IssueCategory.BEST_PRACTICE,
-                "Remove console.log or use a proper logging library",
-                auto_fixable=True
-            ))
-
-    def _check_loose_equality(self, file_path: Path, line: str, line_num: int) -> None:
-        """Check for loose equality (==) instead of strict (===)."""
-        if " == " in line and " === " not in line and not line.strip().startswith("//"):
-            if "==" in line and "===" not in line:
-                self.issues.append(self._create_issue(
-                    file_path, line_num, "loose_equality",
-                    "Loose Equality Comparison",
-                    "Use === instead of == for comparison",
-                    IssueSeverity.MEDIUM, IssueCategory.BEST_PRACTICE,
-                    "Replace == with ===",
-                    auto_fixable=True
-                ))
-
-    def _check_var_usage(self, file_path: Path, line: str, line_num: int) -> None:
-        """Check for var declarations instead of let/const."""
-        if "var " in line and not line.strip().startswith("//"):
-            self.issues.append(self._create_issue(
-                file_path, line_num, "var_usage",
-                "Use of 'var' Keyword",
-                "Use 'let' or 'const' instead of 'var'",
-                IssueSeverity.LOW, IssueCategory.BEST_PRACTICE,
-                "Replace 'var' with 'let' or 'const'",
-                auto_fixable=True
-            ))
-
-    def _check_eval_usage(self, file_path: Path, line: str, line_num: int) -> None:
-        """Check for dangerous eval() usage."""
-        # Skip if this is pattern matching/checking code (context-aware detection)
-        if "eval(" in line and not line.strip().startswith("//"):
-            # Reduce false positives: skip if checking for eval or in string
-            if 'if "eval(' in line or "in line" in line or "'eval('" in line or '"eval("' in line:
-                return  # This is pattern matching code, not actual eval usage
-            
-            self.issues.append(self._create_issue(
-                file_path, line_num, "eval_usage",
-                "Use of eval()",
-                "eval() is dangerous and should be avoided",
-                IssueSeverity.HIGH, IssueCategory.SECURITY,
-                "Refactor to avoid eval()",
-                auto_fixable=False
-            ))
+    # All four rules fused into one line-anchored pattern applied to the whole
+    # buffer. It matches once per non-comment line on which any rule fires;
+    # each optional lookahead group (in rule-id order) records whether its rule
+    # fired, so one match yields the line's rule bitmask. ASCII word
+    # boundaries keep results identical to the Hyperscan scanner.
+    _FUSED_RE = re.compile(
+        r"(?m)^(?![ \t]*//)"
+        r"(?=[^\n]*?(?:console\.log|==|var[ \t]|eval))"
+        r"(?=([^\n]*?\bconsole\.log\b)?)"
+        r"(?=([^\n]*?(?<![=!])==(?!=))?)"
+        r"(?=([^\n]*?\bvar[ \t])?)"
+        r"(?=([^\n]*?\beval\s*\()?)",
+        re.ASCII,
+    )
+
+    def _console_log_issue(self, file_path: Path, line_num: int, snippet: str,
+                  path_str: str) -> Issue:
+        """Create an issue for a console.log statement."""
+        return self._create_issue(
+            file_path, line_num, "console_log",
+            "Console.log Statement",
+            "console.log statements should be removed in production code",
+            IssueSeverity.LOW, IssueCategory.BEST_PRACTICE,
+            "Remove console.log or use a proper logging library",
+            auto_fixable=True,
+            snippet=snippet,
+            path_str=path_str
+        )
+
+    def _loose_equality_issue(self, file_path: Path, line_num: int, snippet: str,
+                  path_str: str) -> Issue:
+        """Create an issue for loose equality (==) instead of strict (===)."""
+        return self._create_issue(
+            file_path, line_num, "loose_equality",
+            "Loose Equality Comparison",
+            "Use === instead of == for comparison",
+            IssueSeverity.MEDIUM, IssueCategory.BEST_PRACTICE,
+            "Replace == with ===",
+            auto_fixable=True,
+            snippet=snippet,
+            path_str=path_str
+        )
+
+    def _var_usage_issue(self, file_path: Path, line_num: int, snippet: str,
+                  path_str: str) -> Issue:
+        """Create an issue for var declarations instead of let/const."""
+        return self._create_issue(
+            file_path, line_num, "var_usage",
+            "Use of 'var' Keyword",
+            "Use 'let' or 'const' instead of 'var'",
+            IssueSeverity.LOW, IssueCategory.BEST_PRACTICE,
+            "Replace 'var' with 'let' or 'const'",
+            auto_fixable=True,
+            snippet=snippet,
+            path_str=path_str
+        )
+
+    def _eval_usage_issue(self, file_path: Path, line_num: int, snippet: str,
+                  path_str: str) -> Issue:
+        """Create an issue for dangerous eval() usage."""
+        return self._create_issue(
+            file_path, line_num, "eval_usage",
+            "Use of eval()",
+            "eval() is dangerous and should be avoided",
+            IssueSeverity.HIGH, IssueCategory.SECURITY,
+            "Refactor to avoid eval()",
+            auto_fixable=False,
+            snippet=snippet,
+            path_str=path_str
+        )
+
+    @staticmethod
+    def _is_eval_pattern_check(line: str) -> bool:
+        """Check if an eval( match is pattern matching code, not actual eval usage."""
+        return 'if "eval(' in line or "in line" in line or "'eval('" in line or '"eval("' in line
 
     def _check_common_issues(self, file_path: Path, content: str, is_typescript: bool) -> None:
         """Check for common JavaScript/TypeScript issues."""
+        db = _get_hyperscan_db()
+        if db is not None:
+            hits = self._scan_hyperscan(db, content.encode("utf-8"))
+        else:
+            hits = self._scan_regex(content)
+
+        factories = (
+            self._console_log_issue,
+            self._loose_equality_issue,
+            self._var_usage_issue,
+            self._eval_usage_issue,
+        )
+        # Sort by (line number, rule id) to keep the historical per-line ordering
         lines = content.splitlines()
+        path_str = str(file_path)
+        for line_num, rule_id in sorted(hits):
+            snippet = self.format_snippet(lines, line_num, line_num)
+            self.issues.append(factories[rule_id](file_path, line_num, snippet, path_str))
+
+    def _scan_regex(self, content: str) -> Set[Tuple[int, int]]:
+        """Find (line number, rule id) hits in one pass of the fused regex."""
+        if _OTHER_LINE_BREAKS.search(content):
+            content = _OTHER_LINE_BREAKS.sub("\n", content)
+
+        hits = set()
+        line_num = 1
+        last = 0
+
+        for match in self._FUSED_RE.finditer(content):
+            start = match.start()
+            # Matches arrive in line order, so count newlines incrementally
+            line_num += content.count("\n", last, start)
+            last = start
+
+            for rule_id, group in enumerate(match.groups()):
+                if group is None:
+                    continue
+                if rule_id == _RULE_EVAL:
+                    line_end = content.find("\n", start)
+                    line = content[start:line_end if line_end != -1 else len(content)]
+                    if self._is_eval_pattern_check(line):
+                        continue
+                hits.add((line_num, rule_id))
+        return hits
+
+    def _scan_hyperscan(self, db: Any, data: bytes) -> Set[Tuple[int, int]]:
+        """Find (line number, rule id) hits in one Hyperscan pass over the encoded content."""
+        if _OTHER_LINE_BREAKS_UTF8.search(data):
+            data = _OTHER_LINE_BREAKS_UTF8.sub(b"\n", data)
+
+        matches: List[Tuple[int, int]] = []
+
+        def on_match(rule_id: int, start: int, end: int, flags: int, context: Any) -> None:
+            matches.append((rule_id, start))
+
+        db.scan(data, match_event_handler=on_match, scratch=_hyperscan_scratch(db))
+
+        line_starts = [0]
+        line_starts.extend(m.end() for m in re.finditer(b"\n", data))
+
+        hits = set()
+        comment_lines: Dict[int, bool] = {}
+        for rule_id, start in matches:
+            line_num = bisect_right(line_starts, start)
+            if (line_num, rule_id) in hits:
+                continue
 
-        for line_num, line in enumerate(lines, start=1):
-            self._check_console_log(file_path, line, line_num)
-            self._check_loose_equality(file_path, line, line_num)
-            self._check_var_usage(file_path, line, line_num)
-            self._check_eval_usage(file_path, line, line_num)
+            if rule_id == _RULE_LOOSE_EQ:
+                # Hyperscan has no lookaround; exclude ===, !== and the tail of ===
+                if (start > 0 and data[start - 1] in b"=!") or data[start + 2:start + 3] == b"=":
+                    continue
+
+            line_start = line_starts[line_num - 1]
+            is_comment = comment_lines.get(line_num)
+            if is_comment is None:
+                is_comment = data[line_start:start].lstrip(b" \t").startswith(b"//")
+                comment_lines[line_num] = is_comment
+            if is_comment:
+                continue
+
+            if rule_id == _RULE_EVAL:
+                line_end = data.find(b"\n", start)
+                line = data[line_start:line_end if line_end != -1 else len(data)]
+                if self._is_eval_pattern_check(line.decode("utf-8", errors="replace")):
+                    continue
+
+            hits.add((line_num, rule_id))
+        return hits
 
     def _check_best_practices(self, file_path: Path, content: str) -> None:
         """Check for best practice violations."""
@@ -203,7 +371,7 @@ class JavaScriptAnalyzer(BaseAnalyzer):
             stripped = line.strip()
 
             # Check for arrow function without return type (TypeScript)
-            if "=>" in stripped and file_path.suffix in [".ts", ".tsx"]:
+            if "=>" in stripped and file_path.suffix in _TS_EXTS:
                 if ":" not in stripped or stripped.count(":") == 0:
                     # This is a simplified check
                     pass
@@ -215,45 +383,45 @@ class JavaScriptAnalyzer(BaseAnalyzer):
                 # This is a simplified check and may have false positives
 
     def _calculate_metrics(self, file_path: Path, content: str) -> CodeMetrics:
-        """Calculate code metrics."""
+        """Calculate code metrics in a single pass over the lines."""
         lines = content.splitlines()
-        total_lines = len(lines)
-        blank_lines = sum(1 for line in lines if not line.strip())
-
-        # Count comment lines (simplified)
+        blank_lines = 0
         comment_lines = 0
+        function_count = 0
         in_block_comment = False
+
         for line in lines:
+            # Count on the raw line; stripping could drop a trailing "function "
+            function_count += line.count("function ") + line.count("=>")
+
             stripped = line.strip()
             if not stripped:
+                blank_lines += 1
                 continue
+
+            # Count comment lines (simplified)
             if "/*" in stripped:
                 in_block_comment = True
             if "*/" in stripped:
                 in_block_comment = False
                 comment_lines += 1
-                continue
-            if in_block_comment or stripped.startswith("//"):
+            elif in_block_comment or stripped.startswith("//"):
                 comment_lines += 1
 
-        source_lines = total_lines - blank_lines - comment_lines
-
-        # Simple complexity estimate (count functions)
-        function_count = content.count("function ") + content.count("=>")
-        avg_complexity = min(function_count * 2, 20)  # Rough estimate
-
         return CodeMetrics(
-            lines_of_code=total_lines,
-            source_lines_of_code=source_lines,
+            lines_of_code=len(lines),
+            source_lines_of_code=len(lines) - blank_lines - comment_lines,
             comment_lines=comment_lines,
             blank_lines=blank_lines,
-            cyclomatic_complexity=avg_complexity,
+            # Simple complexity estimate (count functions)
+            cyclomatic_complexity=min(function_count * 2, 20),  # Rough estimate
         )
 
-    def _generate_issue_id(self, file_path: Path, issue_type: str, line: int) -> str:
+    def _generate_issue_id(self, file_path: Union[Path, str], issue_type: str, line: int) -> str:
         """Generate unique issue ID."""
-        data = f"{file_path}:{issue_type}:{line}"
-        return hashlib.md5(data.encode()).hexdigest()[:12]
+        # 6-byte BLAKE2b digest gives the same 12 hex characters without truncation
+        data = f"{file_path}:{issue_type}:{line}".encode()
+        return hashlib.blake2b(data, digest_size=6).hexdigest()
 
 
 class TypeScriptAnalyzer(JavaScriptAnalyzer):
@@ -265,4 +433,8 @@ class TypeScriptAnalyzer(JavaScriptAnalyzer):
 
     def can_analyze(self, file_path: Path) -> bool:
         """Check if file is TypeScript."""
-        return file_path.suffix in [".ts", ".tsx"]
+        return file_path.suffix in _TS_EXTS
+
+    def get_extensions(self) -> FrozenSet[str]:
+        """Get TypeScript file extensions."""
+        return _TS_EXTS
@@ -2,10 +2,12 @@
 
 import ast
 import hashlib
+from collections import defaultdict, deque
 from pathlib import Path
-from typing import List, Optional, Set, Dict, Any
-from radon.complexity import cc_visit
-from radon.metrics import mi_visit, h_visit
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+from radon.metrics import h_visit_ast, mi_compute
+from radon.raw import analyze as raw_analyze
+from radon.visitors import ComplexityVisitor
 
 from code_sage.core.analyzer import BaseAnalyzer
 from code_sage.core.models import (
@@ -18,11 +20,79 @@ from code_sage.core.models import (
 )
 from code_sage.core.config import Config
 from code_sage.utils.file_utils import read_file
+from code_sage.utils.line_counter import count_blank_and_comment_lines
+
+_PY_EXTS = frozenset({".py", ".pyw"})
+
+# Literal node types that make a mutable default argument
+_MUTABLE_LITERALS = (ast.List, ast.Dict, ast.Set)
+# Constants that are legitimately compared by identity
+_SINGLETON_CONSTANTS = (None, True, False)
+# Node types without child nodes worth visiting; index_nodes() never enqueues them
+_LEAF_TYPES = frozenset(
+    [ast.Name, ast.Constant, ast.alias]
+    + [
+        leaf
+        for base in (ast.expr_context, ast.boolop, ast.operator, ast.unaryop, ast.cmpop)
+        for leaf in base.__subclasses__()
+    ]
+)
+
+# Fixed issue text shared by every Issue that reports it
+_SPLIT_FUNCTION_FIX = "Consider breaking this function into smaller, more focused functions."
+_MUTABLE_DEFAULT_DESCRIPTION = (
+    "Using mutable objects as default arguments can lead to unexpected behavior"
+)
+_MUTABLE_DEFAULT_FIX = "Use None as default and create the mutable object inside the function"
+_BARE_EXCEPT_DESCRIPTION = (
+    "Using bare 'except:' is discouraged. Catch specific exceptions instead."
+)
+_BARE_EXCEPT_FIX = "Replace with 'except Exception:' or catch specific exceptions"
+_IS_LITERAL_DESCRIPTION = "Use '==' for value comparison, not 'is'"
+_IS_LITERAL_FIX = "Replace 'is' with '=='"
+
+
+def _loc(file_path: str, line_start: int, line_end: Optional[int] = None) -> CodeLocation:
+    """Build a line-range location, defaulting the end to the start line."""
+    return CodeLocation(file_path, line_start, line_end or line_start)
+
+
+def index_nodes(tree: ast.AST) -> Dict[type, List[ast.AST]]:
+    """
+    Bucket the nodes of a tree by their exact type in a single walk.
+
+    Visits nodes in the same breadth-first order as ast.walk() but never
+    enqueues leaf nodes (names, constants, contexts, operators), which make
+    up a large share of every tree and can never be checked.
+
+    Args:
+        tree: Parsed module
+
+    Returns:
+        Mapping of node type to the non-leaf nodes of that type, in walk order
+    """
+    nodes_by_type: Dict[type, List[ast.AST]] = defaultdict(list)
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        nodes_by_type[type(node)].append(node)
+        for name in node._fields:
+            value = getattr(node, name, None)
+            if isinstance(value, ast.AST):
+                if type(value) not in _LEAF_TYPES:
+                    todo.append(value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST) and type(item) not in _LEAF_TYPES:
+                        todo.append(item)
+    return nodes_by_type
 
 
 class PythonAnalyzer(BaseAnalyzer):
     """Analyzer for Python code."""
 
+    accepts_content = True
+
     def __init__(self, config: Optional[Config] = None):
         """Initialize Python analyzer."""
         super().__init__(config)
@@ -34,32 +104,48 @@ class PythonAnalyzer(BaseAnalyzer):
 
     def can_analyze(self, file_path: Path) -> bool:
         """Check if file is Python."""
-        return file_path.suffix in [".py", ".pyw"]
+        return file_path.suffix in _PY_EXTS
+
+    def get_extensions(self) -> FrozenSet[str]:
+        """Get Python file extensions."""
+        return _PY_EXTS
 
-    def analyze_file(self, file_path: Path) -> FileAnalysis:
+    def analyze_file(self, file_path: Path, content: Optional[str] = None) -> FileAnalysis:
         """
         Analyze a Python file.
 
         Args:
             file_path: Path to Python file
+            content: File contents if already read
 
         Returns:
             FileAnalysis with issues and metrics
         """
         self.issues = []
+        # Issue IDs hash "<path>:<type>:<line>"; encode the path part once per file
+        fp_bytes = f"{file_path}:".encode()
 
         try:
-            content = read_file(file_path)
+            if content is None:
+                content = read_file(file_path)
             tree = ast.parse(content, filename=str(file_path))
-
-            # Run various checks
-            self._check_syntax(file_path, content)
-            self._check_code_smells(file_path, tree, content)
-            self._check_best_practices(file_path, tree, content)
-            self._check_potential_bugs(file_path, tree, content)
+            # Split once; snippets and metrics all slice the same list
+            lines = content.splitlines()
+
+            # Run various checks; smell, best-practice and bug checks share one AST walk
+            nodes_by_type = index_nodes(tree)
+            UnifiedVisitor(file_path, fp_bytes, lines, self).run(nodes_by_type)
+            # Run radon's visitors on the tree we already parsed instead of its string API
+            try:
+                complexity = ComplexityVisitor.from_ast(tree)
+            except Exception as e:
+                self.logger.debug("Could not calculate complexity: %s", e)
+                complexity = None
+            complexities = complexity.blocks if complexity else []
+            self._check_complexity(file_path, fp_bytes, lines, complexities)
 
             # Calculate metrics
-            metrics = self._calculate_metrics(file_path, content, tree)
+            metrics = self._calculate_metrics(file_path, content, lines, tree, complexity)
 
             return FileAnalysis(
                 file_path=str(file_path),
@@ -72,7 +158,7 @@ class PythonAnalyzer(BaseAnalyzer):
         except SyntaxError as e:
             # Syntax error found
             issue = Issue(
-                id=self._generate_issue_id(file_path, "syntax", e.lineno or 1),
+                id=self._generate_issue_id(fp_bytes, "syntax", e.lineno or 1),
                 title="Python Syntax Error",
                 description=str(e.msg),
                 severity=IssueSeverity.CRITICAL,
@@ -96,7 +182,7 @@ class PythonAnalyzer(BaseAnalyzer):
             )
 
         except Exception as e:
-            self.logger.error(f"Error analyzing {file_path}: {e}")
+            self.logger.error("Error analyzing %s: %s", file_path, e)
             return FileAnalysis(
                 file_path=str(file_path),
                 language="python",
@@ -104,83 +190,65 @@ class PythonAnalyzer(BaseAnalyzer):
                 error=str(e),
             )
 
-    def _check_syntax(self, file_path: Path, content: str) -> None:
-        """Check for syntax issues (already handled by AST parsing)."""
-        pass
-
-    def _check_code_smells(self, file_path: Path, tree: ast.AST, content: str) -> None:
-        """Check for code smells."""
-        visitor = CodeSmellVisitor(file_path, self)
-        visitor.visit(tree)
-
-        # Check complexity using radon
-        try:
-            complexities = cc_visit(content)
-            for item in complexities:
-                if item.complexity > self.config.analysis.max_complexity:
-                    self.issues.append(
-                        Issue(
-                            id=self._generate_issue_id(file_path, "complexity", item.lineno),
-                            title=f"High Complexity: {item.name}",
-                            description=f"Cyclomatic complexity of {item.complexity} exceeds threshold of {self.config.analysis.max_complexity}",
-                            severity=IssueSeverity.MEDIUM,
-                            category=IssueCategory.COMPLEXITY,
-                            location=CodeLocation(
-                                file_path=str(file_path),
-                                line_start=item.lineno,
-                                line_end=item.endline,
-                            ),
-                            code_snippet=self.get_code_snippet(file_path, item.lineno, item.endline),
-                            suggested_fix="Consider breaking this function into smaller, more focused functions.",
-                            auto_fixable=False,
-                        )
+    def _check_complexity(
+        self, file_path: Path, fp_bytes: bytes, lines: List[str], complexities: List[Any]
+    ) -> None:
+        """Report functions whose radon complexity exceeds the threshold."""
+        path_str = str(file_path)
+        for item in complexities:
+            if item.complexity > self.config.analysis.max_complexity:
+                self.issues.append(
+                    Issue(
+                        id=self._generate_issue_id(fp_bytes, "complexity", item.lineno),
+                        title=f"High Complexity: {item.name}",
+                        description=f"Cyclomatic complexity of {item.complexity} exceeds threshold of {self.config.analysis.max_complexity}",
+                        severity=IssueSeverity.MEDIUM,
+                        category=IssueCategory.COMPLEXITY,
+                        location=_loc(path_str, item.lineno, item.endline),
+                        snippet_loader=self.defer_snippet(lines, item.lineno, item.endline),
+                        suggested_fix=_SPLIT_FUNCTION_FIX,
+                        auto_fixable=False,
                     )
-        except Exception as e:
-            self.logger.debug(f"Could not calculate complexity: {e}")
-
-    def _check_best_practices(self, file_path: Path, tree: ast.AST, content: str) -> None:
-        """Check for best practice violations."""
-        visitor = BestPracticeVisitor(file_path, self)
-        visitor.visit(tree)
-
-    def _check_potential_bugs(self, file_path: Path, tree: ast.AST, content: str) -> None:
-        """Check for potential bugs."""
-        visitor = BugDetectorVisitor(file_path, self)
-        visitor.visit(tree)
+                )
 
-    def _calculate_metrics(self, file_path: Path, content: str, tree: ast.AST) -> CodeMetrics:
-        """Calculate code metrics."""
-        lines = content.splitlines()
+    def _calculate_metrics(
+        self,
+        file_path: Path,
+        content: str,
+        lines: List[str],
+        tree: ast.AST,
+        complexity: Optional[ComplexityVisitor],
+    ) -> CodeMetrics:
+        """Calculate code metrics from the parsed tree and radon complexity visitor."""
         total_lines = len(lines)
-        blank_lines = sum(1 for line in lines if not line.strip())
-
-        # Count comment lines
-        comment_lines = 0
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("#"):
-                comment_lines += 1
+        blank_lines, comment_lines = count_blank_and_comment_lines(content, lines)
 
         source_lines = total_lines - blank_lines - comment_lines
 
         # Calculate complexity metrics
         try:
-            complexities = cc_visit(content)
+            if complexity is None:
+                raise ValueError("radon complexity visitor failed")
+            complexities = complexity.blocks
             avg_complexity = (
                 sum(c.complexity for c in complexities) / len(complexities)
                 if complexities
                 else 0
             )
 
-            # Maintainability index
-            mi_score = mi_visit(content, multi=True)
-            mi_value = mi_score if isinstance(mi_score, (int, float)) else 0
-
             # Halstead metrics
-            halstead = h_visit(content)
+            halstead = h_visit_ast(tree)
             h_difficulty = halstead.total.difficulty if halstead else 0
             h_effort = halstead.total.effort if halstead else 0
 
+            # Maintainability index, as radon's mi_visit(multi=True) computes it
+            raw = raw_analyze(content)
+            comments = (raw.comments + raw.multi) / float(raw.sloc) * 100 if raw.sloc else 0
+            mi_score = mi_compute(
+                halstead.total.volume, complexity.total_complexity, raw.lloc, comments
+            )
+            mi_value = mi_score if isinstance(mi_score, (int, float)) else 0
+
         except Exception:
             avg_complexity = 0
             mi_value = 0
@@ -198,43 +266,97 @@ class PythonAnalyzer(BaseAnalyzer):
             halstead_effort=h_effort,
         )
 
-    def _generate_issue_id(self, file_path: Path, issue_type: str, line: int) -> str:
-        """Generate unique issue ID."""
-        data = f"{file_path}:{issue_type}:{line}"
-        return hashlib.md5(data.encode()).hexdigest()[:12]
+    def _generate_issue_id(self, fp_bytes: bytes, issue_type: str, line: int) -> str:
+        """
+        Generate unique issue ID.
+
+        Args:
+            fp_bytes: UTF-8 encoded file path followed by ':'
+            issue_type: Short issue type tag
+            line: Line number of the issue
+
+        Returns:
+            12 hex character ID
+        """
+        # 6-byte BLAKE2b digest gives the same 12 hex characters without truncation
+        digest = hashlib.blake2b(fp_bytes, digest_size=6)
+        digest.update(f"{issue_type}:{line}".encode())
+        return digest.hexdigest()
+
 
+class UnifiedVisitor:
+    """
+    Runs the code smell, best practice and bug checks.
 
-class CodeSmellVisitor(ast.NodeVisitor):
-    """AST visitor for detecting code smells."""
+    Checks read the node lists they care about from an index built by
+    index_nodes(), so the tree is walked once and no per-node dispatch or
+    generic_visit recursion is needed.
+    """
 
-    def __init__(self, file_path: Path, analyzer: PythonAnalyzer):
-        """Initialize visitor."""
+    def __init__(
+        self, file_path: Path, fp_bytes: bytes, lines: List[str], analyzer: PythonAnalyzer
+    ):
+        """
+        Initialize visitor.
+
+        Args:
+            file_path: Path of the file being visited
+            fp_bytes: Encoded path prefix for issue IDs
+            lines: File contents split into lines, used for code snippets
+            analyzer: Analyzer collecting the issues
+        """
         self.file_path = file_path
+        self.path_str = str(file_path)
+        self.fp_bytes = fp_bytes
+        self.lines = lines
         self.analyzer = analyzer
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Visit function definition."""
+        # Bound once so the checks skip repeated attribute lookups per issue
+        self._report = analyzer.issues.append
+        self._issue_id = analyzer._generate_issue_id
+        self._defer_snippet = analyzer.defer_snippet
+        self._handlers: Dict[type, Callable[[Any], None]] = {
+            ast.FunctionDef: self._check_function,
+            ast.Try: self._check_try,
+            ast.ImportFrom: self._check_import_from,
+            ast.Compare: self._check_compare,
+        }
+
+    def run(self, nodes_by_type: Dict[type, List[ast.AST]]) -> None:
+        """
+        Run all checks.
+
+        Args:
+            nodes_by_type: Node index from index_nodes()
+        """
+        for node_type, handler in self._handlers.items():
+            for node in nodes_by_type.get(node_type, ()):
+                handler(node)
+
+    def _check_function(self, node: ast.FunctionDef) -> None:
+        """Run the function definition checks."""
+        self._check_function_smells(node)
+        self._check_mutable_defaults(node)
+
+    def _check_function_smells(self, node: ast.FunctionDef) -> None:
+        """Check function length and parameter count."""
         # Check function length
         func_lines = node.end_lineno - node.lineno if node.end_lineno else 0
         max_length = self.analyzer.config.analysis.max_function_length
 
         if func_lines > max_length:
-            self.analyzer.issues.append(
+            self._report(
                 Issue(
-                    id=self.analyzer._generate_issue_id(self.file_path, "long_func", node.lineno),
+                    id=self._issue_id(self.fp_bytes, "long_func", node.lineno),
                     title=f"Long Function: {node.name}",
                     description=f"Function has {func_lines} lines, exceeding the recommended {max_length} lines",
                     severity=IssueSeverity.LOW,
                     category=IssueCategory.CODE_SMELL,
-                    location=CodeLocation(
-                        file_path=str(self.file_path),
-                        line_start=node.lineno,
-                        line_end=node.end_lineno or node.lineno,
+                    location=_loc(self.path_str, node.lineno, node.end_lineno),
+                    snippet_loader=self._defer_snippet(
+                        self.lines, node.lineno, node.end_lineno or node.lineno
                     ),
-                    code_snippet=self.analyzer.get_code_snippet(
-                        self.file_path, node.lineno, node.end_lineno or node.lineno
-                    ),
-                    suggested_fix="Consider breaking this function into smaller, more focused functions.",
+                    suggested_fix=_SPLIT_FUNCTION_FIX,
                     auto_fixable=False,
                 )
             )
@@ -242,154 +364,100 @@ class CodeSmellVisitor(ast.NodeVisitor):
         # Check parameter count
         param_count = len(node.args.args)
         if param_count > 5:
-            self.analyzer.issues.append(
+            self._report(
                 Issue(
-                    id=self.analyzer._generate_issue_id(self.file_path, "many_params", node.lineno),
+                    id=self._issue_id(self.fp_bytes, "many_params", node.lineno),
                     title=f"Too Many Parameters: {node.name}",
                     description=f"Function has {param_count} parameters. Consider using a configuration object.",
                     severity=IssueSeverity.LOW,
                     category=IssueCategory.CODE_SMELL,
-                    location=CodeLocation(
-                        file_path=str(self.file_path),
-                        line_start=node.lineno,
-                        line_end=node.lineno,
-                    ),
+                    location=_loc(self.path_str, node.lineno),
                     auto_fixable=False,
                 )
             )
 
-        self.generic_visit(node)
-
-
-class BestPracticeVisitor(ast.NodeVisitor):
-    """AST visitor for checking best practices."""
-
-    def __init__(self, file_path: Path, analyzer: PythonAnalyzer):
-        """Initialize visitor."""
-        self.file_path = file_path
-        self.analyzer = analyzer
+    def _check_mutable_defaults(self, node: ast.FunctionDef) -> None:
+        """Check for mutable default arguments."""
+        for default in node.args.defaults:
+            if isinstance(default, _MUTABLE_LITERALS):
+                self._report(
+                    Issue(
+                        id=self._issue_id(
+                            self.fp_bytes, "mutable_default", node.lineno
+                        ),
+                        title=f"Mutable Default Argument: {node.name}",
+                        description=_MUTABLE_DEFAULT_DESCRIPTION,
+                        severity=IssueSeverity.HIGH,
+                        category=IssueCategory.BUG,
+                        location=_loc(self.path_str, node.lineno),
+                        snippet_loader=self._defer_snippet(self.lines, node.lineno, node.lineno),
+                        suggested_fix=_MUTABLE_DEFAULT_FIX,
+                        auto_fixable=True,
+                    )
+                )
 
-    def visit_Try(self, node: ast.Try) -> None:
+    def _check_try(self, node: ast.Try) -> None:
         """Check exception handling."""
         for handler in node.handlers:
             # Bare except clause
             if handler.type is None:
-                self.analyzer.issues.append(
+                self._report(
                     Issue(
-                        id=self.analyzer._generate_issue_id(
-                            self.file_path, "bare_except", handler.lineno
+                        id=self._issue_id(
+                            self.fp_bytes, "bare_except", handler.lineno
                         ),
                         title="Bare Except Clause",
-                        description="Using bare 'except:' is discouraged. Catch specific exceptions instead.",
+                        description=_BARE_EXCEPT_DESCRIPTION,
                         severity=IssueSeverity.MEDIUM,
                         category=IssueCategory.BEST_PRACTICE,
-                        location=CodeLocation(
-                            file_path=str(self.file_path),
-                            line_start=handler.lineno,
-                            line_end=handler.end_lineno or handler.lineno,
-                        ),
-                        code_snippet=self.analyzer.get_code_snippet(
-                            self.file_path, handler.lineno, handler.end_lineno or handler.lineno
+                        location=_loc(self.path_str, handler.lineno, handler.end_lineno),
+                        snippet_loader=self._defer_snippet(
+                            self.lines, handler.lineno, handler.end_lineno or handler.lineno
                         ),
-                        suggested_fix="Replace with 'except Exception:' or catch specific exceptions",
+                        suggested_fix=_BARE_EXCEPT_FIX,
                         auto_fixable=True,
                     )
                 )
 
-        self.generic_visit(node)
-
-    def visit_Import(self, node: ast.Import) -> None:
-        """Check imports."""
-        # Check for wildcard imports (handled in ImportFrom)
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+    def _check_import_from(self, node: ast.ImportFrom) -> None:
         """Check from imports."""
         # Check for wildcard imports
         for alias in node.names:
             if alias.name == "*":
-                self.analyzer.issues.append(
+                self._report(
                     Issue(
-                        id=self.analyzer._generate_issue_id(
-                            self.file_path, "wildcard_import", node.lineno
+                        id=self._issue_id(
+                            self.fp_bytes, "wildcard_import", node.lineno
                         ),
                         title="Wildcard Import",
                         description=f"Avoid wildcard imports from {node.module}. Import specific names instead.",
                         severity=IssueSeverity.LOW,
                         category=IssueCategory.BEST_PRACTICE,
-                        location=CodeLocation(
-                            file_path=str(self.file_path),
-                            line_start=node.lineno,
-                            line_end=node.end_lineno or node.lineno,
-                        ),
+                        location=_loc(self.path_str, node.lineno, node.end_lineno),
                         auto_fixable=False,
                     )
                 )
 
-        self.generic_visit(node)
-
-
-class BugDetectorVisitor(ast.NodeVisitor):
-    """AST visitor for detecting potential bugs."""
-
-    def __init__(self, file_path: Path, analyzer: PythonAnalyzer):
-        """Initialize visitor."""
-        self.file_path = file_path
-        self.analyzer = analyzer
-        self.defined_vars: Set[str] = set()
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Visit function definition."""
-        # Check for mutable default arguments
-        for default in node.args.defaults:
-            if isinstance(default, (ast.List, ast.Dict, ast.Set)):
-                self.analyzer.issues.append(
-                    Issue(
-                        id=self.analyzer._generate_issue_id(
-                            self.file_path, "mutable_default", node.lineno
-                        ),
-                        title=f"Mutable Default Argument: {node.name}",
-                        description="Using mutable objects as default arguments can lead to unexpected behavior",
-                        severity=IssueSeverity.HIGH,
-                        category=IssueCategory.BUG,
-                        location=CodeLocation(
-                            file_path=str(self.file_path),
-                            line_start=node.lineno,
-                            line_end=node.lineno,
-                        ),
-                        code_snippet=self.analyzer.get_code_snippet(self.file_path, node.lineno, node.lineno),
-                        suggested_fix="Use None as default and create the mutable object inside the function",
-                        auto_fixable=True,
-                    )
-                )
-
-        self.generic_visit(node)
-
-    def visit_Compare(self, node: ast.Compare) -> None:
-        """Visit comparison."""
+    def _check_compare(self, node: ast.Compare) -> None:
+        """Check comparisons."""
         # Check for 'is' used with literals
         for i, op in enumerate(node.ops):
             if isinstance(op, (ast.Is, ast.IsNot)):
                 comparator = node.comparators[i]
-                if isinstance(comparator, (ast.Constant, ast.Num, ast.Str)):
-                    if not (isinstance(comparator, ast.Constant) and comparator.value in (None, True, False)):
-                        self.analyzer.issues.append(
+                # ast.parse only emits Constant for literals (Num/Str are deprecated aliases)
+                if type(comparator) is ast.Constant:
+                    if comparator.value not in _SINGLETON_CONSTANTS:
+                        self._report(
                             Issue(
-                                id=self.analyzer._generate_issue_id(
-                                    self.file_path, "is_literal", node.lineno
+                                id=self._issue_id(
+                                    self.fp_bytes, "is_literal", node.lineno
                                 ),
                                 title="Identity Check with Literal",
-                                description="Use '==' for value comparison, not 'is'",
+                                description=_IS_LITERAL_DESCRIPTION,
                                 severity=IssueSeverity.MEDIUM,
                                 category=IssueCategory.BUG,
-                                location=CodeLocation(
-                                    file_path=str(self.file_path),
-                                    line_start=node.lineno,
-                                    line_end=node.end_lineno or node.lineno,
-                                ),
-                                suggested_fix="Replace 'is' with '=='",
+                                location=_loc(self.path_str, node.lineno, node.end_lineno),
+                                suggested_fix=_IS_LITERAL_FIX,
                                 auto_fixable=True,
                             )
                         )
-
-        self.generic_visit(node)
@@ -1,19 +1,27 @@
 """Main CLI interface for Code Sage."""
 
+import asyncio
 import click
 import sys
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TaskID,
+    TextColumn,
+)
 
 from code_sage.core.config import Config
 from code_sage.core.engine import AnalysisEngine
 from code_sage.core.logger import setup_logging
-from code_sage.core.models import IssueSeverity
-from code_sage.ai.enrichment import AIEnrichment
+from code_sage.core.models import SEVERITY_RANK, IssueSeverity
 from code_sage.security.scanner import SecurityScanner, DependencyScanner
+from code_sage.utils.json_utils import dumps_json
 from code_sage import __version__
 
 
@@ -44,76 +52,75 @@ def cli(ctx: click.Context, config: str, verbose: bool, debug: bool) -> None:
     }
 
 
-def _run_code_analysis(engine: AnalysisEngine, path_obj: Path) -> 'AnalysisResult':
-    """Run code analysis with progress indicator."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Analyzing files...", total=None)
-        result = engine.analyze_path(path_obj)
-        progress.update(task, completed=True)
+def _run_code_analysis(
+    engine: AnalysisEngine, path_obj: Path, progress: Progress, task: TaskID
+) -> 'AnalysisResult':
+    """Run code analysis, advancing the per-file progress task."""
+    progress.start_task(task)
+    result = engine.analyze_path(
+        path_obj,
+        progress_callback=lambda done, total: progress.update(
+            task, completed=done, total=total
+        ),
+    )
     return result
 
 
-def _run_security_scan(result: 'AnalysisResult', config: Config, path_obj: Path) -> None:
-    """Run security scanning with progress indicator."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Running security scan...", total=None)
-        
-        scanner = SecurityScanner(config)
-        dep_scanner = DependencyScanner(config)
-        
-        # Scan files
-        for file_analysis in result.file_analyses:
-            security_issues = scanner.scan_file(Path(file_analysis.file_path))
-            file_analysis.issues.extend(security_issues)
-        
-        # Scan dependencies
-        dep_issues = dep_scanner.scan_dependencies(path_obj)
-        if dep_issues and result.file_analyses:
-            result.file_analyses[0].issues.extend(dep_issues)
-        
-        progress.update(task, completed=True)
+def _run_security_scan(
+    result: 'AnalysisResult', config: Config, path_obj: Path, progress: Progress, task: TaskID
+) -> None:
+    """Run security scanning under its progress task."""
+    progress.start_task(task)
+    
+    scanner = SecurityScanner(config)
+    dep_scanner = DependencyScanner(config)
+    
+    # Scan files
+    for file_analysis in result.file_analyses:
+        security_issues = scanner.scan_file(Path(file_analysis.file_path))
+        file_analysis.issues.extend(security_issues)
+    
+    # Scan dependencies
+    dep_issues = dep_scanner.scan_dependencies(path_obj)
+    if dep_issues and result.file_analyses:
+        result.file_analyses[0].issues.extend(dep_issues)
+    
+    progress.update(task, total=1, completed=1)
+
 
+def _run_ai_enrichment(
+    result: 'AnalysisResult', config: Config, progress: Progress, task: TaskID
+) -> None:
+    """Run AI enrichment under its progress task, with error handling."""
+    # The AI SDKs are slow to import, so load them only when enrichment runs
+    from code_sage.ai.enrichment import AIEnrichment
 
-def _run_ai_enrichment(result: 'AnalysisResult', config: Config) -> None:
-    """Run AI enrichment with progress indicator and error handling."""
     config.ai.enabled = True
+    progress.start_task(task)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("AI analysis...", total=None)
-        
-        try:
-            enrichment = AIEnrichment(config)
-            if enrichment.provider:
-                all_issues = result.get_all_issues()
-                enrichment.enrich_issues(all_issues, max_issues=10)
-            else:
-                console.print("[yellow]⚠️  AI analysis skipped: No API key configured[/yellow]")
-                console.print("[dim]Tip: Set OPENAI_API_KEY or ANTHROPIC_API_KEY environment variable[/dim]")
-        except Exception as e:
-            console.print(f"[yellow]⚠️  AI analysis failed: {e}[/yellow]")
-        finally:
-            progress.update(task, completed=True)
+    try:
+        enrichment = AIEnrichment(config)
+        if enrichment.provider:
+            all_issues = result.get_all_issues()
+            asyncio.run(enrichment.enrich_issues_async(all_issues, max_issues=10))
+        else:
+            console.print("[yellow]⚠️  AI analysis skipped: No API key configured[/yellow]")
+            console.print("[dim]Tip: Set OPENAI_API_KEY or ANTHROPIC_API_KEY environment variable[/dim]")
+        enrichment.close()
+    except Exception as e:
+        console.print(f"[yellow]⚠️  AI analysis failed: {e}[/yellow]")
+    finally:
+        progress.update(task, total=1, completed=1)
 
 
 def _filter_by_severity(result: 'AnalysisResult', severity: str) -> None:
     """Filter analysis results by severity level."""
-    severity_enum = IssueSeverity(severity)
+    # Compare integer ranks; the severity strings do not sort by severity
+    threshold = SEVERITY_RANK[IssueSeverity(severity)]
     for file_analysis in result.file_analyses:
         file_analysis.issues = [
             issue for issue in file_analysis.issues
-            if issue.severity.value >= severity_enum.value
+            if issue.severity_rank >= threshold
         ]
 
 
@@ -138,16 +145,30 @@ def analyze(ctx: click.Context, path: str, output: str, format: str, severity: s
         border_style="cyan"
     ))
     
-    # Run analysis
+    # Run analysis and optional scans under one live display
     engine = AnalysisEngine(config)
-    result = _run_code_analysis(engine, path_obj)
-    
-    # Run optional scans
-    if security:
-        _run_security_scan(result, config, path_obj)
-    
-    if ai:
-        _run_ai_enrichment(result, config)
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        refresh_per_second=10,
+    ) as progress:
+        analysis_task = progress.add_task("Analyzing files...", total=None, start=False)
+        security_task = (
+            progress.add_task("Running security scan...", total=None, start=False)
+            if security else None
+        )
+        ai_task = progress.add_task("AI analysis...", total=None, start=False) if ai else None
+        
+        result = _run_code_analysis(engine, path_obj, progress, analysis_task)
+        
+        if security_task is not None:
+            _run_security_scan(result, config, path_obj, progress, security_task)
+        
+        if ai_task is not None:
+            _run_ai_enrichment(result, config, progress, ai_task)
     
     # Filter results
     if severity:
@@ -293,16 +314,11 @@ def display_results_rich(result) -> None:
 
 def display_results_json(result, output_path: str = None) -> None:
     """Display results in JSON format."""
-    import json
-    
-    data = result.to_dict()
-    json_str = json.dumps(data, indent=2)
-    
     if output_path:
-        Path(output_path).write_text(json_str)
+        result.dump_json(Path(output_path))
         console.print(f"[green]✓[/green] Results written to: {output_path}")
     else:
-        console.print(json_str)
+        console.print(dumps_json(result.to_dict()))
 
 
 if __name__ == "__main__":
@@ -1,123 +1,44 @@
 """Report generation for analysis results."""
 
-import json
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
-from jinja2 import Template
+from jinja2 import (
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    select_autoescape,
+)
 
-from code_sage.core.models import AnalysisResult
+from code_sage.core.aggregator import IssueAggregator
+from code_sage.core.models import AnalysisResult, Issue, IssueSeverity
 from code_sage.core.logger import get_logger
+from code_sage.utils.json_utils import WRITE_BUFFER_SIZE, write_json
 
+# Highest-priority issues listed in the HTML report
+_HTML_TOP_ISSUES = 50
 
-class ReportGenerator:
-    """Generate analysis reports in various formats."""
-
-    def __init__(self) -> None:
-        """Initialize report generator."""
-        self.logger = get_logger()
-
-    def generate_html(self, result: AnalysisResult, output_path: Path) -> None:
-        """
-        Generate HTML report.
-
-        Args:
-            result: Analysis result
-            output_path: Output file path
-        """
-        template = self._get_html_template()
-        
-        html_content = template.render(
-            result=result,
-            severity_counts=result.get_severity_counts(),
-            category_counts=result.get_category_counts(),
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        )
-        
-        output_path.write_text(html_content, encoding="utf-8")
-        self.logger.info(f"HTML report generated: {output_path}")
+# File written for each format by ReportGenerator.generate_all
+_REPORT_FILES = {
+    "html": "code-sage-report.html",
+    "json": "code-sage-report.json",
+    "sarif": "code-sage-report.sarif",
+}
 
-    def generate_json(self, result: AnalysisResult, output_path: Path) -> None:
-        """Generate JSON report."""
-        data = result.to_dict()
-        json_str = json.dumps(data, indent=2)
-        output_path.write_text(json_str, encoding="utf-8")
-        self.logger.info(f"JSON report generated: {output_path}")
+# SARIF result level for each severity
+_SARIF_LEVELS = {
+    IssueSeverity.CRITICAL: "error",
+    IssueSeverity.HIGH: "error",
+    IssueSeverity.MEDIUM: "warning",
+    IssueSeverity.LOW: "note",
+    IssueSeverity.INFO: "none",
+}
 
-    def generate_sarif(self, result: AnalysisResult, output_path: Path) -> None:
-        """Generate SARIF format report."""
-        # SARIF format specification: https://docs.oasis-open.org/sarif/sarif/v2.1.0/sarif-v2.1.0.html
-        sarif = {
-            "version": "2.1.0",
-            "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
-            "runs": [
-                {
-                    "tool": {
-                        "driver": {
-                            "name": "Code Sage",
-                            "version": "1.0.0",
-                            "informationUri": "https://github.com/stanveer/Code-Sage",
-                        }
-                    },
-                    "results": self._convert_to_sarif_results(result),
-                }
-            ],
-        }
-        
-        json_str = json.dumps(sarif, indent=2)
-        output_path.write_text(json_str, encoding="utf-8")
-        self.logger.info(f"SARIF report generated: {output_path}")
-
-    def _convert_to_sarif_results(self, result: AnalysisResult) -> list:
-        """Convert issues to SARIF results format."""
-        sarif_results = []
-        
-        level_map = {
-            "critical": "error",
-            "high": "error",
-            "medium": "warning",
-            "low": "note",
-            "info": "none",
-        }
-        
-        for issue in result.get_all_issues():
-            sarif_result = {
-                "ruleId": issue.rule_id or issue.id,
-                "level": level_map.get(issue.severity.value, "warning"),
-                "message": {
-                    "text": issue.description
-                },
-                "locations": [
-                    {
-                        "physicalLocation": {
-                            "artifactLocation": {
-                                "uri": issue.location.file_path
-                            },
-                            "region": {
-                                "startLine": issue.location.line_start,
-                                "endLine": issue.location.line_end,
-                            }
-                        }
-                    }
-                ],
-            }
-            
-            if issue.suggested_fix:
-                sarif_result["fixes"] = [
-                    {
-                        "description": {
-                            "text": issue.fix_description or "Suggested fix"
-                        }
-                    }
-                ]
-            
-            sarif_results.append(sarif_result)
-        
-        return sarif_results
-
-    def _get_html_template(self) -> Template:
-        """Get HTML template."""
-        template_str = """
+_HTML_TEMPLATE_NAME = "report.html"
+# Static document head, minified and encoded once at import (see below)
+_HTML_HEAD = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -168,7 +89,10 @@ class ReportGenerator:
         h2 { color: #2c3e50; margin-bottom: 20px; padding-bottom: 10px; border-bottom: 2px solid #ecf0f1; }
     </style>
 </head>
-<body>
+"""
+
+# Dynamic body; the only part rendered by Jinja
+_HTML_TEMPLATE = """<body>
     <div class="container">
         <h1>🧙‍♂️ Code Sage Analysis Report</h1>
         <div class="timestamp">Generated on {{ timestamp }}</div>
@@ -180,7 +104,7 @@ class ReportGenerator:
             </div>
             <div class="summary-card">
                 <h3>Total Issues</h3>
-                <div class="value">{{ result.total_issues }}</div>
+                <div class="value">{{ total_issues }}</div>
             </div>
             <div class="summary-card">
                 <h3>Analysis Time</h3>
@@ -202,7 +126,7 @@ class ReportGenerator:
         
         <div class="issues-list">
             <h2>All Issues</h2>
-            {% for issue in result.get_all_issues()[:50] %}
+            {% for issue in top_issues %}
             <div class="issue {{ issue.severity.value }}">
                 <div class="issue-header">
                     <div class="issue-title">{{ issue.title }}</div>
@@ -210,8 +134,9 @@ class ReportGenerator:
                 </div>
                 <div class="issue-location">📁 {{ issue.location }}</div>
                 <div class="issue-description">{{ issue.description }}</div>
-                {% if issue.code_snippet %}
-                <pre class="code-snippet">{{ issue.code_snippet }}</pre>
+                {% set snippet = issue.get_snippet() %}
+                {% if snippet %}
+                <pre class="code-snippet">{{ snippet }}</pre>
                 {% endif %}
             </div>
             {% endfor %}
@@ -220,4 +145,206 @@ class ReportGenerator:
 </body>
 </html>
 """
-        return Template(template_str)
+
+
+def _minify_html_head(head: str) -> str:
+    """
+    Collapse the whitespace in a static HTML head and its inline CSS.
+
+    Args:
+        head: HTML head markup with a <style> block
+
+    Returns:
+        Equivalent markup without indentation or optional CSS whitespace
+    """
+
+    def minify_css(match: "re.Match[str]") -> str:
+        css = re.sub(r"\s+", " ", match.group(2))
+        css = re.sub(r"\s*([{};:,])\s*", r"\1", css).replace(";}", "}")
+        return f"{match.group(1)}{css.strip()}{match.group(3)}"
+
+    head = re.sub(r"(<style>)(.*?)(</style>)", minify_css, head, flags=re.DOTALL)
+    return re.sub(r">\s+<", "><", head.strip())
+
+
+_HTML_HEAD_BYTES = _minify_html_head(_HTML_HEAD).encode("utf-8")
+
+
+def _create_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Create the on-disk template bytecode cache, or None if no cache dir is usable."""
+    try:
+        # Defaults to a private per-user directory under the system temp dir
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+# Shared environment: get_template() compiles once and serves the cached
+# template afterwards; auto_reload=False skips the up-to-date check per call.
+# The bytecode cache lets later CLI runs skip parsing and code generation.
+_ENV = Environment(
+    loader=DictLoader({_HTML_TEMPLATE_NAME: _HTML_TEMPLATE}),
+    autoescape=select_autoescape(["html"]),
+    bytecode_cache=_create_bytecode_cache(),
+    auto_reload=False,
+)
+
+
+class ReportGenerator:
+    """Generate analysis reports in various formats."""
+
+    def __init__(self) -> None:
+        """Initialize report generator."""
+        self.logger = get_logger()
+
+    def generate_all(
+        self, result: AnalysisResult, formats: List[str], output_dir: Path
+    ) -> Dict[str, Path]:
+        """
+        Generate several report formats from one pass over the result.
+
+        The flattened issue list and the severity/category counts are
+        computed once and shared by every requested format.
+
+        Args:
+            result: Analysis result
+            formats: Formats to write ('html', 'json', 'sarif')
+            output_dir: Directory for the report files
+
+        Returns:
+            Mapping of format to the written file path
+        """
+        unknown = set(formats) - set(_REPORT_FILES)
+        if unknown:
+            raise ValueError(f"Unsupported report format: {', '.join(sorted(unknown))}")
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        all_issues = result.get_all_issues()
+        written: Dict[str, Path] = {}
+
+        for fmt in formats:
+            output_path = output_dir / _REPORT_FILES[fmt]
+            if fmt == "html":
+                self.generate_html(
+                    result,
+                    output_path,
+                    all_issues=all_issues,
+                    severity_counts=result.get_severity_counts(),
+                    category_counts=result.get_category_counts(),
+                )
+            elif fmt == "json":
+                self.generate_json(result, output_path)
+            else:
+                self.generate_sarif(result, output_path, all_issues=all_issues)
+            written[fmt] = output_path
+
+        return written
+
+    def generate_html(
+        self,
+        result: AnalysisResult,
+        output_path: Path,
+        all_issues: Optional[List[Issue]] = None,
+        severity_counts: Optional[Dict[str, int]] = None,
+        category_counts: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Generate HTML report.
+
+        Args:
+            result: Analysis result
+            output_path: Output file path
+            all_issues: Precomputed result.get_all_issues()
+            severity_counts: Precomputed result.get_severity_counts()
+            category_counts: Precomputed result.get_category_counts()
+        """
+        template = self._get_html_template()
+        if all_issues is None:
+            all_issues = result.get_all_issues()
+        
+        # Stream encoded chunks through a large write buffer instead of
+        # building the whole page first
+        stream = template.stream(
+            result=result,
+            top_issues=IssueAggregator().rank_top_k(all_issues, _HTML_TOP_ISSUES),
+            total_issues=len(all_issues),
+            severity_counts=severity_counts or result.get_severity_counts(),
+            category_counts=category_counts or result.get_category_counts(),
+            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(_HTML_HEAD_BYTES)
+            stream.dump(f, encoding="utf-8")
+        self.logger.info(f"HTML report generated: {output_path}")
+
+    def generate_json(self, result: AnalysisResult, output_path: Path) -> None:
+        """Generate JSON report."""
+        result.dump_json(output_path)
+        self.logger.info(f"JSON report generated: {output_path}")
+
+    def generate_sarif(
+        self,
+        result: AnalysisResult,
+        output_path: Path,
+        all_issues: Optional[List[Issue]] = None,
+    ) -> None:
+        """Generate SARIF format report."""
+        # SARIF format specification: https://docs.oasis-open.org/sarif/sarif/v2.1.0/sarif-v2.1.0.html
+        sarif = {
+            "version": "2.1.0",
+            "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
+            "runs": [
+                {
+                    "tool": {
+                        "driver": {
+                            "name": "Code Sage",
+                            "version": "1.0.0",
+                            "informationUri": "https://github.com/stanveer/Code-Sage",
+                        }
+                    },
+                    "results": self._convert_to_sarif_results(result, all_issues),
+                }
+            ],
+        }
+        
+        write_json(sarif, output_path)
+        self.logger.info(f"SARIF report generated: {output_path}")
+
+    def _convert_to_sarif_results(
+        self, result: AnalysisResult, all_issues: Optional[List[Issue]] = None
+    ) -> list:
+        """Convert issues to SARIF results format."""
+        if all_issues is None:
+            all_issues = result.get_all_issues()
+        return [
+            {
+                "ruleId": issue.rule_id or issue.id,
+                "level": _SARIF_LEVELS.get(issue.severity, "warning"),
+                "message": {
+                    "text": issue.description
+                },
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {
+                                "uri": issue.location.file_path
+                            },
+                            "region": {
+                                "startLine": issue.location.line_start,
+                                "endLine": issue.location.line_end,
+                            }
+                        }
+                    }
+                ],
+                **(
+                    {"fixes": [{"description": {"text": issue.fix_description or "Suggested fix"}}]}
+                    if issue.suggested_fix
+                    else {}
+                ),
+            }
+            for issue in all_issues
+        ]
+
+    def _get_html_template(self) -> Template:
+        """Get the compiled HTML template, compiled once per process."""
+        return _ENV.get_template(_HTML_TEMPLATE_NAME)
@@ -1,5 +1,7 @@
 """Core functionality for Code Sage."""
 
+from typing import Any
+
 from code_sage.core.models import (
     Issue,
     IssueSeverity,
@@ -11,6 +13,7 @@ from code_sage.core.analyzer import BaseAnalyzer
 from code_sage.core.config import Config
 
 __all__ = [
+    "AnalysisEngine",
     "Issue",
     "IssueSeverity",
     "IssueCategory",
@@ -19,3 +22,12 @@ __all__ = [
     "BaseAnalyzer",
     "Config",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the analysis engine on first access; it pulls in the analyzers."""
+    if name == "AnalysisEngine":
+        from code_sage.core.engine import AnalysisEngine
+
+        return AnalysisEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
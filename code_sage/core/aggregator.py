@@ -1,10 +1,98 @@
 """Issue aggregation and ranking system."""
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from collections import defaultdict
 import difflib
-
-from code_sage.core.models import Issue, IssueSeverity, IssueCategory, AnalysisResult
+import heapq
+
+from code_sage.core.models import (
+    SEVERITY_RANK,
+    AnalysisResult,
+    Issue,
+    IssueCategory,
+    IssueSeverity,
+)
+
+try:
+    from rapidfuzz.fuzz import ratio as fuzz_ratio
+except ImportError:
+    fuzz_ratio = None  # type: ignore[assignment]
+
+# Priority weights used by IssueAggregator.rank_issues
+_SEVERITY_WEIGHTS: Dict[IssueSeverity, int] = {
+    IssueSeverity.CRITICAL: 100,
+    IssueSeverity.HIGH: 75,
+    IssueSeverity.MEDIUM: 50,
+    IssueSeverity.LOW: 25,
+    IssueSeverity.INFO: 10,
+}
+
+_CATEGORY_WEIGHTS: Dict[IssueCategory, int] = {
+    IssueCategory.SECURITY: 20,
+    IssueCategory.BUG: 15,
+    IssueCategory.TYPE_ERROR: 10,
+    IssueCategory.PERFORMANCE: 8,
+    IssueCategory.BEST_PRACTICE: 5,
+    IssueCategory.CODE_SMELL: 3,
+    IssueCategory.STYLE: 1,
+    IssueCategory.DUPLICATION: 2,
+    IssueCategory.COMPLEXITY: 4,
+    IssueCategory.MAINTAINABILITY: 3,
+}
+
+# Severity plus category weight for every combination, so ranking does one lookup
+_BASE_PRIORITY: Dict[Tuple[IssueSeverity, IssueCategory], int] = {
+    (severity, category): _SEVERITY_WEIGHTS[severity] + _CATEGORY_WEIGHTS[category]
+    for severity in IssueSeverity
+    for category in IssueCategory
+}
+
+
+def length_ratio_bound(len1: int, len2: int) -> float:
+    """
+    Upper bound on the similarity ratio of two strings with the given lengths.
+
+    Both difflib's ratio and RapidFuzz's ratio are 2 * matches / total length,
+    and matches can never exceed the shorter string's length.
+
+    Args:
+        len1: Length of the first string
+        len2: Length of the second string
+
+    Returns:
+        Highest ratio the strings could reach, between 0 and 1
+    """
+    total = len1 + len2
+    return 2 * min(len1, len2) / total if total else 1.0
+
+
+def text_similarity_at_least(text1: str, text2: str, threshold: float) -> bool:
+    """
+    Check whether two strings are at least ``threshold`` similar.
+
+    Uses RapidFuzz's native Indel ratio with a score cutoff when it is
+    installed; otherwise difflib, trying its cheap upper bounds before the
+    full ratio.
+
+    Args:
+        text1: First string
+        text2: Second string
+        threshold: Minimum similarity between 0 and 1
+
+    Returns:
+        True if the strings are similar enough
+    """
+    if fuzz_ratio is not None:
+        cutoff = threshold * 100
+        # Scores below the cutoff come back as 0 without finishing the computation
+        return fuzz_ratio(text1, text2, score_cutoff=cutoff) >= cutoff
+
+    matcher = difflib.SequenceMatcher(None, text1, text2)
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
 
 
 class IssueAggregator:
@@ -29,17 +117,41 @@ class IssueAggregator:
         Returns:
             Deduplicated list of issues
         """
-        unique_issues = []
-        seen_signatures = set()
+        unique_issues: List[Issue] = []
+        seen_signatures: Set[Tuple[str, int, str, IssueCategory]] = set()
+        # Bound once; this loop runs for every issue in the project
+        keep = unique_issues.append
+        mark_seen = seen_signatures.add
+        signature_of = self._get_issue_signature
 
         for issue in issues:
-            signature = self._get_issue_signature(issue)
+            signature = signature_of(issue)
             if signature not in seen_signatures:
-                unique_issues.append(issue)
-                seen_signatures.add(signature)
+                keep(issue)
+                mark_seen(signature)
 
         return unique_issues
 
+    def deduplicate_by_file(
+        self, issues_by_file: Dict[str, List[Issue]]
+    ) -> Dict[str, List[Issue]]:
+        """
+        Remove duplicate issues from per-file issue lists.
+
+        Duplicate signatures include the file path, so each file is
+        deduplicated on its own and the grouping is never rebuilt.
+
+        Args:
+            issues_by_file: Issue lists keyed by file path
+
+        Returns:
+            Deduplicated issue lists keyed by file path
+        """
+        return {
+            file_path: self.deduplicate_issues(issues)
+            for file_path, issues in issues_by_file.items()
+        }
+
     def find_similar_issues(self, issues: List[Issue]) -> Dict[str, List[Issue]]:
         """
         Group similar issues together.
@@ -53,23 +165,43 @@ class IssueAggregator:
         similar_groups: Dict[str, List[Issue]] = defaultdict(list)
         processed = set()
 
-        for i, issue1 in enumerate(issues):
-            if issue1.id in processed:
-                continue
+        # Issues of different category or severity are never similar, so only
+        # pairs within the same (category, severity) bucket are compared
+        buckets: Dict[Tuple[IssueCategory, IssueSeverity], List[Issue]] = defaultdict(list)
+        for issue in issues:
+            buckets[(issue.category, issue.severity)].append(issue)
+
+        threshold = self.similarity_threshold
+        for bucket in buckets.values():
+            # Text lengths bound the similarity ratio, so most dissimilar pairs
+            # are rejected without running the full comparison
+            lengths = [(len(issue.title), len(issue.description)) for issue in bucket]
+            for i, issue1 in enumerate(bucket):
+                if issue1.id in processed:
+                    continue
 
-            group = [issue1]
-            processed.add(issue1.id)
+                group = [issue1]
+                processed.add(issue1.id)
+                title_len1, desc_len1 = lengths[i]
 
-            for issue2 in issues[i + 1 :]:
-                if issue2.id in processed:
-                    continue
+                for j in range(i + 1, len(bucket)):
+                    issue2 = bucket[j]
+                    if issue2.id in processed:
+                        continue
+
+                    title_len2, desc_len2 = lengths[j]
+                    if not (
+                        length_ratio_bound(title_len1, title_len2) >= threshold
+                        and length_ratio_bound(desc_len1, desc_len2) >= threshold
+                    ):
+                        continue
 
-                if self._are_similar(issue1, issue2):
-                    group.append(issue2)
-                    processed.add(issue2.id)
+                    if self._texts_similar(issue1, issue2):
+                        group.append(issue2)
+                        processed.add(issue2.id)
 
-            if len(group) > 1:
-                similar_groups[issue1.id] = group
+                if len(group) > 1:
+                    similar_groups[issue1.id] = group
 
         return similar_groups
 
@@ -89,36 +221,49 @@ class IssueAggregator:
         Returns:
             Sorted list of issues by priority (highest first)
         """
-        severity_weights = {
-            IssueSeverity.CRITICAL: 100,
-            IssueSeverity.HIGH: 75,
-            IssueSeverity.MEDIUM: 50,
-            IssueSeverity.LOW: 25,
-            IssueSeverity.INFO: 10,
-        }
+        # Sort indices by precomputed score; the sort compares plain floats
+        # instead of calling a key per issue
+        priorities = self._priorities(issues)
+        order = sorted(range(len(issues)), key=priorities.__getitem__, reverse=True)
+        return [issues[i] for i in order]
 
-        category_weights = {
-            IssueCategory.SECURITY: 20,
-            IssueCategory.BUG: 15,
-            IssueCategory.TYPE_ERROR: 10,
-            IssueCategory.PERFORMANCE: 8,
-            IssueCategory.BEST_PRACTICE: 5,
-            IssueCategory.CODE_SMELL: 3,
-            IssueCategory.STYLE: 1,
-            IssueCategory.DUPLICATION: 2,
-            IssueCategory.COMPLEXITY: 4,
-            IssueCategory.MAINTAINABILITY: 3,
-        }
+    def rank_by_file(self, issues_by_file: Dict[str, List[Issue]]) -> Dict[str, List[Issue]]:
+        """
+        Rank each file's issues by priority.
 
-        def calculate_priority(issue: Issue) -> float:
-            priority = severity_weights.get(issue.severity, 0)
-            priority += category_weights.get(issue.category, 0)
-            priority *= issue.confidence
-            if issue.auto_fixable:
-                priority += 5  # Bonus for auto-fixable issues
-            return priority
+        Args:
+            issues_by_file: Issue lists keyed by file path
+
+        Returns:
+            Issue lists keyed by file path, each sorted by priority (highest first)
+        """
+        return {file_path: self.rank_issues(issues) for file_path, issues in issues_by_file.items()}
+
+    def rank_top_k(self, issues: List[Issue], k: int) -> List[Issue]:
+        """
+        Get the k highest-priority issues, in rank_issues order.
+
+        Selects with a bounded heap, O(N log k), instead of sorting everything.
+
+        Args:
+            issues: List of issues
+            k: Number of issues to return
 
-        return sorted(issues, key=calculate_priority, reverse=True)
+        Returns:
+            Up to k issues sorted by priority (highest first)
+        """
+        priorities = self._priorities(issues)
+        order = heapq.nlargest(k, range(len(issues)), key=priorities.__getitem__)
+        return [issues[i] for i in order]
+
+    def _priorities(self, issues: List[Issue]) -> List[float]:
+        """Score every issue in one pass, parallel to the input list."""
+        base = _BASE_PRIORITY
+        return [
+            base[(issue.severity, issue.category)] * issue.confidence
+            + (5 if issue.auto_fixable else 0)  # Bonus for auto-fixable issues
+            for issue in issues
+        ]
 
     def filter_issues(
         self,
@@ -139,18 +284,17 @@ class IssueAggregator:
         Returns:
             Filtered list of issues
         """
-        filtered = issues
-
-        if min_severity:
-            filtered = [i for i in filtered if i.severity >= min_severity]
-
-        if categories:
-            filtered = [i for i in filtered if i.category in categories]
-
-        if auto_fixable_only:
-            filtered = [i for i in filtered if i.auto_fixable]
-
-        return filtered
+        # Rank 0 (info) admits every severity when no minimum is given
+        min_rank = SEVERITY_RANK[min_severity] if min_severity else 0
+        allowed = frozenset(categories) if categories else None
+
+        return [
+            i
+            for i in issues
+            if i.severity_rank >= min_rank
+            and (allowed is None or i.category in allowed)
+            and (not auto_fixable_only or i.auto_fixable)
+        ]
 
     def generate_summary(self, result: AnalysisResult) -> Dict[str, any]:
         """
@@ -163,23 +307,41 @@ class IssueAggregator:
             Summary dictionary
         """
         issues = result.get_all_issues()
+        by_severity = result.get_severity_counts()
+
+        # One pass over issues for the flag count
+        auto_fixable = 0
+        for issue in issues:
+            if issue.auto_fixable:
+                auto_fixable += 1
+
+        # One pass over files for both per-file counts
+        by_file: Dict[str, int] = {}
+        files_with_issues = 0
+        for fa in result.file_analyses:
+            if fa.issues:
+                by_file[fa.file_path] = len(fa.issues)
+                files_with_issues += 1
 
         summary = {
             "total_issues": len(issues),
-            "by_severity": result.get_severity_counts(),
+            "by_severity": by_severity,
             "by_category": result.get_category_counts(),
-            "by_file": self._count_issues_by_file(result),
-            "auto_fixable": sum(1 for i in issues if i.auto_fixable),
-            "high_priority": sum(1 for i in issues if i.severity in [IssueSeverity.CRITICAL, IssueSeverity.HIGH]),
-            "files_with_issues": len([fa for fa in result.file_analyses if fa.issues]),
-            "files_without_issues": len([fa for fa in result.file_analyses if not fa.issues]),
+            "by_file": dict(sorted(by_file.items(), key=lambda x: x[1], reverse=True)),
+            "auto_fixable": auto_fixable,
+            "high_priority": (
+                by_severity[IssueSeverity.CRITICAL.value] + by_severity[IssueSeverity.HIGH.value]
+            ),
+            "files_with_issues": files_with_issues,
+            "files_without_issues": len(result.file_analyses) - files_with_issues,
         }
 
         return summary
 
-    def _get_issue_signature(self, issue: Issue) -> str:
+    def _get_issue_signature(self, issue: Issue) -> Tuple[str, int, str, IssueCategory]:
         """Get unique signature for an issue."""
-        return f"{issue.location.file_path}:{issue.location.line_start}:{issue.title}:{issue.category.value}"
+        location = issue.location
+        return (location.file_path, location.line_start, issue.title, issue.category)
 
     def _are_similar(self, issue1: Issue, issue2: Issue) -> bool:
         """Check if two issues are similar."""
@@ -187,24 +349,12 @@ class IssueAggregator:
         if issue1.category != issue2.category or issue1.severity != issue2.severity:
             return False
 
-        # Similar titles
-        title_similarity = difflib.SequenceMatcher(None, issue1.title, issue2.title).ratio()
-        if title_similarity < self.similarity_threshold:
-            return False
+        return self._texts_similar(issue1, issue2)
 
-        # Similar descriptions
-        desc_similarity = difflib.SequenceMatcher(
-            None, issue1.description, issue2.description
-        ).ratio()
-        if desc_similarity < self.similarity_threshold:
-            return False
-
-        return True
-
-    def _count_issues_by_file(self, result: AnalysisResult) -> Dict[str, int]:
-        """Count issues per file."""
-        counts = {}
-        for fa in result.file_analyses:
-            if fa.issues:
-                counts[fa.file_path] = len(fa.issues)
-        return dict(sorted(counts.items(), key=lambda x: x[1], reverse=True))
+    def _texts_similar(self, issue1: Issue, issue2: Issue) -> bool:
+        """Check if two issues have similar titles and descriptions."""
+        return text_similarity_at_least(
+            issue1.title, issue2.title, self.similarity_threshold
+        ) and text_similarity_at_least(
+            issue1.description, issue2.description, self.similarity_threshold
+        )
@@ -1,19 +1,122 @@
 """Base analyzer interface for Code Sage."""
 
+import copy
+import os
+import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
 import time
 
-from code_sage.core.models import Issue, FileAnalysis, CodeMetrics
+from code_sage.core.models import SEVERITY_RANK, Issue, FileAnalysis, CodeMetrics
 from code_sage.core.config import Config
 from code_sage.core.logger import get_logger
 from code_sage.utils.file_utils import read_file
 
+# Severity name -> rank, for threshold checks on plain strings
+_SEVERITY_ORDER: Dict[str, int] = {
+    severity.value: rank for severity, rank in SEVERITY_RANK.items()
+}
+
+# Whitespace-only lines, and lines whose first non-whitespace text opens a comment
+_BLANK_LINE = re.compile(r"^[^\S\n]*$", re.MULTILINE)
+_COMMENT_LINE = re.compile(r"^[^\S\n]*(?:#|//|--|/\*|\*)", re.MULTILINE)
+
+
+@lru_cache(maxsize=256)
+def _read_split_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Read a file and split it into lines, memoized per file version.
+
+    The modification time and size are part of the cache key, so an edited
+    file is read again instead of being served stale.
+
+    Args:
+        path_str: Path to file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Tuple of (content, lines)
+    """
+    content = read_file(Path(path_str))
+    return content, tuple(content.splitlines())
+
+
+def read_split_cached(file_path: Path) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Get a file's content and lines, reusing earlier reads of the same version.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Tuple of (content, lines)
+    """
+    stat = file_path.stat()
+    return _read_split_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+class SnippetLoader:
+    """Deferred code snippet; formats its line range the first time it is called."""
+
+    __slots__ = ("lines", "line_start", "line_end", "context")
+
+    def __init__(
+        self, lines: Sequence[str], line_start: int, line_end: int, context: int = 2
+    ) -> None:
+        """
+        Initialize the loader.
+
+        Args:
+            lines: File contents split into lines
+            line_start: Starting line number
+            line_end: Ending line number
+            context: Number of context lines before and after
+        """
+        self.lines = lines
+        self.line_start = line_start
+        self.line_end = line_end
+        self.context = context
+
+    def __call__(self) -> str:
+        """Format the snippet."""
+        return BaseAnalyzer.format_snippet(
+            self.lines, self.line_start, self.line_end, self.context
+        )
+
+
+# Per-process analyzer used by BaseAnalyzer.analyze_files pool workers
+_worker_analyzer: Optional["BaseAnalyzer"] = None
+
+
+def _init_analyzer_worker(analyzer: "BaseAnalyzer") -> None:
+    """Install the analyzer once per worker process."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_with_worker(file_path: Path) -> FileAnalysis:
+    """Analyze one file with the worker's analyzer."""
+    analyzer = _worker_analyzer
+    assert analyzer is not None, "worker used before _init_analyzer_worker ran"
+    return analyzer.analyze_with_timing(file_path)
+
 
 class BaseAnalyzer(ABC):
     """Abstract base class for all language analyzers."""
 
+    # Analyzers dominated by I/O rather than CPU run analyze_files on threads
+    io_bound: bool = False
+    # Analyzers whose analyze_file() takes already-read ``content``; others are
+    # called with the path alone and read the file themselves
+    accepts_content: bool = False
+
     def __init__(self, config: Optional[Config] = None):
         """
         Initialize analyzer.
@@ -48,45 +151,109 @@ class BaseAnalyzer(ABC):
         """
         pass
 
+    def get_extensions(self) -> FrozenSet[str]:
+        """
+        Get the file extensions this analyzer handles.
+
+        Declaring extensions lets the registry find the analyzer with one dict
+        lookup; analyzers that return none are matched through can_analyze().
+
+        Returns:
+            File suffixes including the dot (e.g., '.py')
+        """
+        return frozenset()
+
     @abstractmethod
-    def analyze_file(self, file_path: Path) -> FileAnalysis:
+    def analyze_file(self, file_path: Path, content: Optional[str] = None) -> FileAnalysis:
         """
         Analyze a single file.
 
         Args:
             file_path: Path to file to analyze
+            content: File contents if already read; only passed to analyzers
+                that set ``accepts_content``
 
         Returns:
             FileAnalysis object containing results
         """
         pass
 
-    def analyze_with_timing(self, file_path: Path) -> FileAnalysis:
+    def analyze_with_timing(self, file_path: Path, content: Optional[str] = None) -> FileAnalysis:
         """
         Analyze file with timing information.
 
         Args:
             file_path: Path to file
+            content: File contents if already read; passed on only to
+                analyzers that set ``accepts_content``
 
         Returns:
             FileAnalysis with timing data
         """
-        start_time = time.time()
+        # Monotonic integer clock; converted to seconds once per file
+        start_ns = time.perf_counter_ns()
         
         try:
-            result = self.analyze_file(file_path)
-            result.analysis_time = time.time() - start_time
+            if content is not None and self.accepts_content:
+                result = self.analyze_file(file_path, content)
+            else:
+                result = self.analyze_file(file_path)
+            result.analysis_time = (time.perf_counter_ns() - start_ns) / 1e9
             return result
         except Exception as e:
-            self.logger.error(f"Error analyzing {file_path}: {e}")
+            self.logger.error("Error analyzing %s: %s", file_path, e)
             return FileAnalysis(
                 file_path=str(file_path),
                 language=self.language,
                 success=False,
                 error=str(e),
-                analysis_time=time.time() - start_time,
+                analysis_time=(time.perf_counter_ns() - start_ns) / 1e9,
             )
 
+    def analyze_files(
+        self, file_paths: List[Path], max_workers: Optional[int] = None
+    ) -> List[FileAnalysis]:
+        """
+        Analyze several files in parallel.
+
+        CPU-bound analyzers are shipped once to each worker process and fed
+        files in batches; I/O-bound analyzers run on threads, each file on a
+        shallow copy since analyzers keep per-file state. Falls back to
+        sequential analysis if a process pool cannot be started.
+
+        Args:
+            file_paths: Files to analyze
+            max_workers: Worker limit (defaults to the CPU count)
+
+        Returns:
+            FileAnalysis for each file, in input order
+        """
+        if len(file_paths) < 2:
+            return [self.analyze_with_timing(path) for path in file_paths]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+        if self.io_bound:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(
+                    executor.map(lambda path: copy.copy(self).analyze_with_timing(path), file_paths)
+                )
+
+        results: List[FileAnalysis] = []
+        chunksize = max(1, len(file_paths) // (4 * workers))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_analyzer_worker, initargs=(self,)
+            ) as executor:
+                for result in executor.map(_analyze_with_worker, file_paths, chunksize=chunksize):
+                    results.append(result)
+        except (OSError, BrokenProcessPool) as e:
+            self.logger.warning("Process pool unavailable (%s); analyzing sequentially", e)
+            # Resume after the last file the pool delivered
+            for path in file_paths[len(results):]:
+                results.append(self.analyze_with_timing(path))
+
+        return results
+
     def get_code_snippet(self, file_path: Path, line_start: int, line_end: int, context: int = 2) -> str:
         """
         Get code snippet with context.
@@ -101,23 +268,55 @@ class BaseAnalyzer(ABC):
             Code snippet as string
         """
         try:
-            content = read_file(file_path)
-            lines = content.splitlines()
-            
-            # Calculate bounds with context
-            start = max(0, line_start - 1 - context)
-            end = min(len(lines), line_end + context)
-            
-            snippet_lines = []
-            for i in range(start, end):
-                prefix = "→ " if line_start - 1 <= i < line_end else "  "
-                snippet_lines.append(f"{prefix}{i + 1:4d} | {lines[i]}")
-            
-            return "\n".join(snippet_lines)
+            _, lines = read_split_cached(file_path)
+            return self.format_snippet(lines, line_start, line_end, context)
         except Exception as e:
-            self.logger.warning(f"Failed to get code snippet: {e}")
+            self.logger.warning("Failed to get code snippet: %s", e)
             return ""
 
+    @staticmethod
+    def format_snippet(lines: Sequence[str], line_start: int, line_end: int, context: int = 2) -> str:
+        """
+        Format a code snippet with context from already-split lines.
+
+        Args:
+            lines: File contents split into lines
+            line_start: Starting line number
+            line_end: Ending line number
+            context: Number of context lines before and after
+
+        Returns:
+            Code snippet as string
+        """
+        # Calculate bounds with context
+        start = max(0, line_start - 1 - context)
+        end = min(len(lines), line_end + context)
+
+        snippet_lines = []
+        for i in range(start, end):
+            prefix = "→ " if line_start - 1 <= i < line_end else "  "
+            snippet_lines.append(f"{prefix}{i + 1:4d} | {lines[i]}")
+
+        return "\n".join(snippet_lines)
+
+    @staticmethod
+    def defer_snippet(
+        lines: List[str], line_start: int, line_end: int, context: int = 2
+    ) -> SnippetLoader:
+        """
+        Build a loader that formats a snippet only when it is first needed.
+
+        Args:
+            lines: File contents split into lines
+            line_start: Starting line number
+            line_end: Ending line number
+            context: Number of context lines before and after
+
+        Returns:
+            Zero-argument callable suitable for Issue.snippet_loader
+        """
+        return SnippetLoader(lines, line_start, line_end, context)
+
     def calculate_basic_metrics(self, file_path: Path) -> CodeMetrics:
         """
         Calculate basic code metrics.
@@ -129,18 +328,16 @@ class BaseAnalyzer(ABC):
             CodeMetrics object
         """
         try:
-            content = read_file(file_path)
-            lines = content.splitlines()
+            content, lines = read_split_cached(file_path)
             
             total_lines = len(lines)
-            blank_lines = sum(1 for line in lines if not line.strip())
+            # An empty match after a trailing newline (or in empty content) is not a line
+            blank_lines = len(_BLANK_LINE.findall(content))
+            if not content or content.endswith("\n"):
+                blank_lines -= 1
             
             # Simple comment detection
-            comment_lines = 0
-            for line in lines:
-                stripped = line.strip()
-                if stripped.startswith(("#", "//", "--", "/*", "*", "*/")):
-                    comment_lines += 1
+            comment_lines = len(_COMMENT_LINE.findall(content))
             
             source_lines = total_lines - blank_lines - comment_lines
             
@@ -151,7 +348,7 @@ class BaseAnalyzer(ABC):
                 blank_lines=blank_lines,
             )
         except Exception as e:
-            self.logger.warning(f"Failed to calculate metrics: {e}")
+            self.logger.warning("Failed to calculate metrics: %s", e)
             return CodeMetrics()
 
     def should_analyze_category(self, category: str) -> bool:
@@ -176,13 +373,13 @@ class BaseAnalyzer(ABC):
         Returns:
             True if issue should be reported
         """
-        severity_levels = ["info", "low", "medium", "high", "critical"]
-        min_level = self.config.analysis.min_severity
+        level = _SEVERITY_ORDER.get(severity)
+        min_level = _SEVERITY_ORDER.get(self.config.analysis.min_severity)
         
-        try:
-            return severity_levels.index(severity) >= severity_levels.index(min_level)
-        except ValueError:
+        # Unknown severities are always reported
+        if level is None or min_level is None:
             return True
+        return level >= min_level
 
 
 class AnalyzerRegistry:
@@ -191,6 +388,8 @@ class AnalyzerRegistry:
     def __init__(self) -> None:
         """Initialize analyzer registry."""
         self._analyzers: List[BaseAnalyzer] = []
+        self._by_extension: Dict[str, BaseAnalyzer] = {}
+        self._undeclared: List[BaseAnalyzer] = []
 
     def register(self, analyzer: BaseAnalyzer) -> None:
         """
@@ -200,18 +399,30 @@ class AnalyzerRegistry:
             analyzer: Analyzer instance to register
         """
         self._analyzers.append(analyzer)
+        extensions = analyzer.get_extensions()
+        if not extensions:
+            self._undeclared.append(analyzer)
+        for extension in extensions:
+            # The first analyzer registered for an extension keeps it
+            self._by_extension.setdefault(extension, analyzer)
 
     def get_analyzer(self, file_path: Path) -> Optional[BaseAnalyzer]:
         """
         Get appropriate analyzer for a file.
 
+        Analyzers that declare extensions are found by suffix; the rest are
+        asked in registration order through can_analyze().
+
         Args:
             file_path: Path to file
 
         Returns:
             Analyzer instance or None if no suitable analyzer found
         """
-        for analyzer in self._analyzers:
+        analyzer = self._by_extension.get(file_path.suffix)
+        if analyzer is not None:
+            return analyzer
+        for analyzer in self._undeclared:
             if analyzer.can_analyze(file_path):
                 return analyzer
         return None
@@ -1,14 +1,86 @@
 """Configuration management for Code Sage."""
 
+import copy
 import os
+import sys
 import yaml
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, Any, Optional, List, Pattern, Tuple
+from dataclasses import dataclass, field, fields
 
+from code_sage.utils.file_utils import compile_globs
+from code_sage.utils.json_utils import loads_json, write_json
 
-@dataclass
+# libyaml bindings parse and emit much faster than the pure-Python fallback
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
+# Slotted sections drop the per-instance __dict__ (dataclass slots need 3.10+)
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Environment read by Config.load_from_env(); refreshed only by Config.reload()
+_ENV_SNAPSHOT: Dict[str, str] = dict(os.environ)
+
+
+def _load_yaml(config_path: Path) -> Any:
+    """Parse a YAML config file."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _load_json(config_path: Path) -> Any:
+    """Parse a JSON config file."""
+    return loads_json(config_path.read_bytes())
+
+
+def _save_yaml(data: Dict[str, Any], config_path: Path) -> None:
+    """Write config data as YAML."""
+    with open(config_path, "w", encoding="utf-8") as f:
+        yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False)
+
+
+# Config file readers and writers by suffix
+_LOADERS: Dict[str, Callable[[Path], Any]] = {
+    ".yaml": _load_yaml,
+    ".yml": _load_yaml,
+    ".json": _load_json,
+}
+_SAVERS: Dict[str, Callable[[Dict[str, Any], Path], None]] = {
+    ".yaml": _save_yaml,
+    ".yml": _save_yaml,
+    ".json": write_json,
+}
+
+
+@lru_cache(maxsize=8)
+def _read_config_data(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a config file, memoized on its path and modification time.
+
+    Args:
+        path_str: Path to the config file
+        mtime_ns: File modification time; a new value forces a re-parse
+
+    Returns:
+        Parsed config data (shared between callers, do not mutate)
+    """
+    config_path = Path(path_str)
+    loader = _LOADERS.get(config_path.suffix)
+    if loader is None:
+        raise ValueError(f"Unsupported config file format: {config_path.suffix}")
+
+    return loader(config_path) or {}
+
+
+def _fields_dict(section: Any) -> Dict[str, Any]:
+    """Map a config section's fields to their values without copying them."""
+    return {f.name: getattr(section, f.name) for f in fields(section)}
+
+
+@dataclass(**_SLOTS)
 class AIConfig:
     """AI provider configuration."""
 
@@ -19,11 +91,19 @@ class AIConfig:
     anthropic_model: str = "claude-3-5-sonnet-20241022"  # Latest Claude model
     temperature: float = 0.3
     max_tokens: int = 2000
+    max_snippet_tokens: int = 800  # Longer code snippets are truncated in prompts (0 disables)
     timeout: int = 30
     enabled: bool = False  # AI is opt-in, not opt-out
+    concurrency: int = 8  # Parallel in-flight requests during enrichment
+    batch_token_budget: int = 4000  # Approximate prompt tokens per batched request
+    requests_per_minute: int = 500  # Client-side request quota (0 disables throttling)
+    tokens_per_minute: int = 200000  # Client-side token quota (0 disables throttling)
+    cache_ttl: int = 86400  # Seconds to keep cached deterministic responses
+    semantic_cache: bool = False  # Reuse responses for near-duplicate prompts
+    similarity_threshold: float = 0.92  # Minimum cosine similarity for a semantic hit
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnalysisConfig:
     """Analysis configuration."""
 
@@ -50,7 +130,7 @@ class AnalysisConfig:
     max_workers: int = 4
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SecurityConfig:
     """Security scanning configuration."""
 
@@ -62,7 +142,7 @@ class SecurityConfig:
     secret_patterns: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OutputConfig:
     """Output and reporting configuration."""
 
@@ -76,7 +156,7 @@ class OutputConfig:
     verbose: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GitConfig:
     """Git integration configuration."""
 
@@ -88,7 +168,7 @@ class GitConfig:
     github_token: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CacheConfig:
     """Caching configuration."""
 
@@ -98,7 +178,7 @@ class CacheConfig:
     max_size_mb: int = 500
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Config:
     """Main configuration class for Code Sage."""
 
@@ -145,21 +225,32 @@ class Config:
         ]
     )
 
+    def compile_pattern_matcher(self) -> Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]:
+        """
+        Compile the include and ignore globs into one regex each.
+
+        Compiled regexes are memoized on the pattern contents, so edits to
+        the pattern lists are picked up on the next call.
+
+        Returns:
+            Tuple of (include regex, ignore regex); None where a list is empty
+        """
+        return (
+            compile_globs(tuple(self.include_patterns)),
+            compile_globs(tuple(self.ignore_patterns)),
+        )
+
     @classmethod
     def from_file(cls, config_path: Path) -> "Config":
         """Load configuration from a file (YAML or JSON)."""
-        if not config_path.exists():
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return cls()
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            if config_path.suffix in [".yaml", ".yml"]:
-                data = yaml.safe_load(f)
-            elif config_path.suffix == ".json":
-                data = json.load(f)
-            else:
-                raise ValueError(f"Unsupported config file format: {config_path.suffix}")
-
-        return cls.from_dict(data or {})
+        # The parsed data is cached; copy it so configs never share lists
+        data = _read_config_data(str(config_path), mtime_ns)
+        return cls.from_dict(copy.deepcopy(data))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
@@ -188,24 +279,30 @@ class Config:
 
     @classmethod
     def load_from_env(cls) -> "Config":
-        """Load configuration from environment variables."""
+        """Load configuration from the environment snapshot taken at import."""
         config = cls()
+        env = _ENV_SNAPSHOT
 
         # AI configuration from environment
-        if os.getenv("OPENAI_API_KEY"):
-            config.ai.openai_api_key = os.getenv("OPENAI_API_KEY")
-        if os.getenv("ANTHROPIC_API_KEY"):
-            config.ai.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
-        if os.getenv("AI_PROVIDER"):
-            config.ai.provider = os.getenv("AI_PROVIDER", "openai")
+        openai_api_key = env.get("OPENAI_API_KEY")
+        if openai_api_key:
+            config.ai.openai_api_key = openai_api_key
+        anthropic_api_key = env.get("ANTHROPIC_API_KEY")
+        if anthropic_api_key:
+            config.ai.anthropic_api_key = anthropic_api_key
+        provider = env.get("AI_PROVIDER")
+        if provider:
+            config.ai.provider = provider
 
         # Git configuration
-        if os.getenv("GITHUB_TOKEN"):
-            config.git.github_token = os.getenv("GITHUB_TOKEN")
+        github_token = env.get("GITHUB_TOKEN")
+        if github_token:
+            config.git.github_token = github_token
 
         # Analysis configuration
-        if os.getenv("CODE_SAGE_MIN_SEVERITY"):
-            config.analysis.min_severity = os.getenv("CODE_SAGE_MIN_SEVERITY", "info")
+        min_severity = env.get("CODE_SAGE_MIN_SEVERITY")
+        if min_severity:
+            config.analysis.min_severity = min_severity
 
         return config
 
@@ -243,19 +340,48 @@ class Config:
 
         return config
 
+    @classmethod
+    def reload(cls, config_path: Optional[Path] = None) -> "Config":
+        """
+        Load configuration after discarding parsed files and the environment snapshot.
+
+        Args:
+            config_path: Optional path to a config file
+
+        Returns:
+            Freshly loaded configuration
+        """
+        global _ENV_SNAPSHOT
+        _ENV_SNAPSHOT = dict(os.environ)
+        _read_config_data.cache_clear()
+        return cls.load(config_path)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary."""
-        return asdict(self)
+        """
+        Convert configuration to dictionary.
+
+        Sections are flattened field by field without the deep copy asdict()
+        makes; list values are shared with the config, so callers serialize
+        the result rather than mutate it.
+        """
+        return {
+            "ai": _fields_dict(self.ai),
+            "analysis": _fields_dict(self.analysis),
+            "security": _fields_dict(self.security),
+            "output": _fields_dict(self.output),
+            "git": _fields_dict(self.git),
+            "cache": _fields_dict(self.cache),
+            "ignore_patterns": self.ignore_patterns,
+            "include_patterns": self.include_patterns,
+        }
 
     def save(self, config_path: Path) -> None:
         """Save configuration to file."""
-        with open(config_path, "w", encoding="utf-8") as f:
-            if config_path.suffix in [".yaml", ".yml"]:
-                yaml.dump(self.to_dict(), f, default_flow_style=False)
-            elif config_path.suffix == ".json":
-                json.dump(self.to_dict(), f, indent=2)
-            else:
-                raise ValueError(f"Unsupported config file format: {config_path.suffix}")
+        saver = _SAVERS.get(config_path.suffix)
+        if saver is None:
+            raise ValueError(f"Unsupported config file format: {config_path.suffix}")
+
+        saver(self.to_dict(), config_path)
 
     def validate(self) -> List[str]:
         """Validate configuration and return list of errors."""
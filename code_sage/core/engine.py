@@ -1,17 +1,61 @@
 """Main analysis engine for Code Sage."""
 
 from pathlib import Path
-from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import itertools
 import time
 
 from code_sage.core.config import Config
 from code_sage.core.models import AnalysisResult, FileAnalysis
-from code_sage.core.analyzer import BaseAnalyzer, get_analyzer_registry
+from code_sage.core.analyzer import AnalyzerRegistry, BaseAnalyzer
 from code_sage.core.aggregator import IssueAggregator
 from code_sage.core.pattern_matcher import PatternMatcher
+from code_sage.core.exceptions import CacheError, FileAccessError
 from code_sage.core.logger import get_logger
-from code_sage.utils.file_utils import FileDiscovery, read_file
+from code_sage.core.result_cache import ResultCache
+from code_sage.utils.file_utils import FileDiscovery, decode_text, read_file_bytes
+
+# Reports (completed, total) as files finish analyzing
+ProgressCallback = Callable[[int, int], None]
+
+# Repository config files, in the order Config.load() prefers them
+_CONFIG_FILENAMES = (".codesage.yaml", ".codesage.yml", ".codesage.json")
+
+# Seconds a directory without any config file above it is remembered as such
+_CONFIG_MISS_TTL = 2.0
+
+# Per-process engine used by pool workers
+_worker_engine: Optional["AnalysisEngine"] = None
+
+
+def _init_worker(config_data: Dict[str, Any]) -> None:
+    """Build the analysis engine once per worker process from plain config data."""
+    global _worker_engine
+    _worker_engine = AnalysisEngine(Config.from_dict(config_data))
+
+
+def _analyze_in_worker(file_path: Path) -> FileAnalysis:
+    """Analyze one file with the worker's engine."""
+    engine = _worker_engine
+    assert engine is not None, "worker used before _init_worker ran"
+    try:
+        return engine.analyze_file(file_path)
+    except Exception as e:
+        # An exception here would abort the whole map; report it per file instead
+        engine.logger.error("Error analyzing %s: %s", file_path, e)
+        return FileAnalysis(
+            file_path=str(file_path),
+            language="unknown",
+            success=False,
+            error=str(e),
+        )
+
+
+def _analyze_batch_in_worker(file_paths: List[Path]) -> List[FileAnalysis]:
+    """Analyze a batch of files with the worker's engine."""
+    return [_analyze_in_worker(file_path) for file_path in file_paths]
 
 
 class AnalysisEngine:
@@ -22,38 +66,134 @@ class AnalysisEngine:
         Initialize analysis engine.
 
         Args:
-            config: Configuration object
+            config: Configuration object; without one, each analyzed path uses
+                the nearest .codesage.* file of its repository
         """
         self.config = config or Config()
+        self._base_config = self.config
+        self._discover_config = config is None
+        # Directory -> (config file, its mtime_ns, loaded config)
+        self._config_cache: Dict[Path, Tuple[Path, int, Config]] = {}
+        # Directory -> monotonic time its upward walk last found no config file
+        self._config_misses: Dict[Path, float] = {}
         self.logger = get_logger()
-        self.registry = get_analyzer_registry()
+        # Per-engine registry: analyzers follow this engine's config, which may
+        # be switched per repository, so they must not be shared between engines
+        self.registry = AnalyzerRegistry()
         self.aggregator = IssueAggregator()
         self.pattern_matcher = PatternMatcher()
-        
-        # Register default analyzers
-        self._register_default_analyzers()
+        self.result_cache = self._create_result_cache()
+        # Default analyzers are imported and registered on first use
+        self._analyzers_registered = False
+        self._analyzers: List[BaseAnalyzer] = []
 
     def _register_default_analyzers(self) -> None:
         """Register default language analyzers."""
+        if self._analyzers_registered:
+            return
+        self._analyzers_registered = True
+
         from code_sage.analyzers.python_analyzer import PythonAnalyzer
         from code_sage.analyzers.javascript_analyzer import JavaScriptAnalyzer, TypeScriptAnalyzer
 
-        self.registry.register(PythonAnalyzer(self.config))
-        self.registry.register(JavaScriptAnalyzer(self.config))
-        self.registry.register(TypeScriptAnalyzer(self.config))
+        self._analyzers = [
+            PythonAnalyzer(self.config),
+            JavaScriptAnalyzer(self.config),
+            TypeScriptAnalyzer(self.config),
+        ]
+        for analyzer in self._analyzers:
+            self.registry.register(analyzer)
+
+    def config_for_path(self, path: Path) -> Config:
+        """
+        Get the configuration of the repository containing a path.
+
+        The nearest .codesage.* file at or above the path is loaded with
+        Config.load(). The result is cached per directory and revalidated with
+        a single stat of that file, so repeated analyses of a repository skip
+        the upward walk until the file changes or disappears. Directories with
+        no config file are remembered for _CONFIG_MISS_TTL seconds, after which
+        the walk runs again to pick up newly created files.
+
+        Args:
+            path: File or directory being analyzed
 
-    def analyze_path(self, path: Path) -> AnalysisResult:
+        Returns:
+            The repository's configuration, or the engine's own configuration
+            if no config file is found
+        """
+        directory = path if path.is_dir() else path.parent
+        cached = self._config_cache.get(directory)
+        if cached is not None:
+            config_file, mtime_ns, config = cached
+            try:
+                if config_file.stat().st_mtime_ns == mtime_ns:
+                    return config
+            except OSError:
+                pass
+            del self._config_cache[directory]
+
+        missed_at = self._config_misses.get(directory)
+        if missed_at is not None:
+            if time.monotonic() - missed_at < _CONFIG_MISS_TTL:
+                return self._base_config
+            del self._config_misses[directory]
+
+        resolved = directory.resolve()
+        for candidate_dir in (resolved, *resolved.parents):
+            for name in _CONFIG_FILENAMES:
+                config_file = candidate_dir / name
+                try:
+                    mtime_ns = config_file.stat().st_mtime_ns
+                except OSError:
+                    continue
+                config = Config.load(config_file)
+                self._config_cache[directory] = (config_file, mtime_ns, config)
+                return config
+
+        self._config_misses[directory] = time.monotonic()
+        return self._base_config
+
+    def _use_config(self, config: Config) -> None:
+        """Switch the engine and its analyzers to another configuration."""
+        if config is self.config:
+            return
+
+        self.config = config
+        self.result_cache = self._create_result_cache()
+        for analyzer in self._analyzers:
+            analyzer.config = config
+
+    def _create_result_cache(self) -> Optional[ResultCache]:
+        """Create the on-disk result cache if caching is enabled."""
+        if not self.config.cache.enabled:
+            return None
+
+        try:
+            return ResultCache.from_config(self.config)
+        except CacheError as e:
+            self.logger.warning("Result cache disabled: %s", e)
+            return None
+
+    def analyze_path(
+        self, path: Path, progress_callback: Optional[ProgressCallback] = None
+    ) -> AnalysisResult:
         """
         Analyze a file or directory.
 
         Args:
             path: Path to file or directory
+            progress_callback: Optional callable receiving (completed, total)
+                after each file is analyzed
 
         Returns:
             AnalysisResult with findings
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = AnalysisResult(project_path=str(path))
+        self._register_default_analyzers()
+        if self._discover_config:
+            self._use_config(self.config_for_path(path))
 
         # Discover files to analyze
         discovery = FileDiscovery(
@@ -62,33 +202,44 @@ class AnalysisEngine:
             respect_gitignore=True,
         )
 
-        files = discovery.discover_files(path, recursive=True)
-        self.logger.info(f"Found {len(files)} files to analyze")
+        file_iter = discovery.iter_files(path, recursive=True)
+        # Two files are enough to know whether a worker pool is worth starting
+        head = list(itertools.islice(file_iter, 2))
 
-        # Analyze files
-        if self.config.analysis.parallel_analysis and len(files) > 1:
-            file_analyses = self._analyze_parallel(files)
+        # Analyze files; the pool starts on files while discovery is still walking
+        if self.config.analysis.parallel_analysis and len(head) > 1:
+            files, file_analyses = self._analyze_parallel(
+                itertools.chain(head, file_iter), progress_callback
+            )
+            # Keep the sorted order discover_files() would have produced
+            order = sorted(range(len(files)), key=files.__getitem__)
+            file_analyses = [file_analyses[i] for i in order]
         else:
-            file_analyses = self._analyze_sequential(files)
+            files = sorted(itertools.chain(head, file_iter))
+            self.logger.info("Found %d files to analyze", len(files))
+            file_analyses = self._analyze_sequential(files, progress_callback)
+
+        if self.result_cache is not None:
+            self.result_cache.prune()
 
         # Add results
         for file_analysis in file_analyses:
             result.add_file_analysis(file_analysis)
 
-        # Deduplicate and rank issues
-        all_issues = result.get_all_issues()
-        unique_issues = self.aggregator.deduplicate_issues(all_issues)
-        ranked_issues = self.aggregator.rank_issues(unique_issues)
-
-        # Update file analyses with ranked issues
-        self._update_file_analyses_with_ranked_issues(result, ranked_issues)
+        # Deduplicate and rank issues file by file, keeping the grouping
+        unique_issues = self.aggregator.deduplicate_by_file(result.issues_by_file)
+        result.issues_by_file = self.aggregator.rank_by_file(unique_issues)
+        for file_analysis in result.file_analyses:
+            file_analysis.issues = result.issues_by_file[file_analysis.file_path]
 
         # Generate summary
-        result.total_time = time.time() - start_time
+        result.total_time = (time.perf_counter_ns() - start_ns) / 1e9
         result.generate_summary()
 
-        self.logger.info(f"Analysis completed in {result.total_time:.2f}s")
-        self.logger.info(f"Found {result.total_issues} issues across {result.total_files} files")
+        self.logger.info("Analysis completed in %.2fs", result.total_time)
+        self.logger.info(
+            "Found %d issues across %d files", result.total_issues, result.total_files
+        )
 
         return result
 
@@ -102,9 +253,10 @@ class AnalysisEngine:
         Returns:
             FileAnalysis with findings
         """
+        self._register_default_analyzers()
         analyzer = self.registry.get_analyzer(file_path)
         if not analyzer:
-            self.logger.warning(f"No analyzer found for {file_path}")
+            self.logger.warning("No analyzer found for %s", file_path)
             return FileAnalysis(
                 file_path=str(file_path),
                 language="unknown",
@@ -112,71 +264,110 @@ class AnalysisEngine:
                 error="No analyzer available for this file type",
             )
 
+        # Read once; the cache key, the analyzer and pattern matching share the contents
+        try:
+            data = read_file_bytes(file_path)
+        except FileAccessError as e:
+            # Let the analyzer report the failure as it would for its own read
+            self.logger.warning("Cannot read %s: %s", file_path, e)
+            return analyzer.analyze_with_timing(file_path)
+
+        content = decode_text(data, file_path)
+
+        # Unchanged files are served from the result cache
+        result_cache = self.result_cache
+        cache_key = None
+        if result_cache is not None:
+            # Pattern rules can be added at any time, so they are keyed per lookup
+            cache_key = result_cache.make_key(
+                file_path, data, self.pattern_matcher.fingerprint()
+            )
+            cached = result_cache.get(cache_key, content)
+            if cached is not None:
+                return cached
+
         # Analyze with the appropriate analyzer
-        file_analysis = analyzer.analyze_with_timing(file_path)
+        file_analysis = analyzer.analyze_with_timing(file_path, content)
 
         # Also run pattern matching
         try:
-            content = read_file(file_path)
             pattern_issues = self.pattern_matcher.match_file(
                 file_path, content, file_analysis.language
             )
             file_analysis.issues.extend(pattern_issues)
         except Exception as e:
-            self.logger.warning(f"Pattern matching failed for {file_path}: {e}")
+            self.logger.warning("Pattern matching failed for %s: %s", file_path, e)
+
+        if result_cache is not None and cache_key is not None and file_analysis.success:
+            result_cache.set(cache_key, file_analysis)
 
         return file_analysis
 
-    def _analyze_sequential(self, files: List[Path]) -> List[FileAnalysis]:
+    def _analyze_sequential(
+        self, files: List[Path], progress_callback: Optional[ProgressCallback] = None
+    ) -> List[FileAnalysis]:
         """Analyze files sequentially."""
         results = []
+        # Progress goes to the callback; a log line per file costs more than it tells
         for i, file_path in enumerate(files, 1):
-            self.logger.info(f"Analyzing {i}/{len(files)}: {file_path.name}")
             result = self.analyze_file(file_path)
             results.append(result)
+            if progress_callback:
+                progress_callback(i, len(files))
         return results
 
-    def _analyze_parallel(self, files: List[Path]) -> List[FileAnalysis]:
-        """Analyze files in parallel."""
-        results = []
-        max_workers = min(self.config.analysis.max_workers, len(files))
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_file = {
-                executor.submit(self.analyze_file, file_path): file_path for file_path in files
-            }
+    def _analyze_parallel(
+        self, file_iter: Iterable[Path], progress_callback: Optional[ProgressCallback] = None
+    ) -> Tuple[List[Path], List[FileAnalysis]]:
+        """
+        Analyze files in parallel worker processes as they are discovered.
 
-            for i, future in enumerate(as_completed(future_to_file), 1):
-                file_path = future_to_file[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    self.logger.info(f"Completed {i}/{len(files)}: {file_path.name}")
-                except Exception as e:
-                    self.logger.error(f"Error analyzing {file_path}: {e}")
-                    results.append(
-                        FileAnalysis(
-                            file_path=str(file_path),
-                            language="unknown",
-                            success=False,
-                            error=str(e),
-                        )
-                    )
+        Analysis is CPU-bound Python, so processes are used to sidestep the
+        GIL. Files are submitted in batches while discovery is still walking
+        the tree. Falls back to sequential analysis if a pool cannot be
+        started.
 
-        return results
+        Returns:
+            Tuple of (files in discovery order, their analyses in the same order)
+        """
+        files: List[Path] = []
+        results: List[FileAnalysis] = []
+        max_workers = self.config.analysis.max_workers
 
-    def _update_file_analyses_with_ranked_issues(
-        self, result: AnalysisResult, ranked_issues: List
-    ) -> None:
-        """Update file analyses with ranked and deduplicated issues."""
-        # Group issues by file
-        issues_by_file = {}
-        for issue in ranked_issues:
-            file_path = issue.location.file_path
-            if file_path not in issues_by_file:
-                issues_by_file[file_path] = []
-            issues_by_file[file_path].append(issue)
-
-        # Update file analyses
-        for file_analysis in result.file_analyses:
-            file_analysis.issues = issues_by_file.get(file_analysis.file_path, [])
+        try:
+            # Workers rebuild Config from a plain dict, which pickles the same
+            # under fork and spawn start methods
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self.config.to_dict(),),
+            ) as executor:
+                # Batches grow with the files found so far, approximating four
+                # batches per worker without knowing the total up front
+                futures = []
+                batch: List[Path] = []
+                for file_path in file_iter:
+                    files.append(file_path)
+                    batch.append(file_path)
+                    if len(batch) >= len(files) // (4 * max_workers):
+                        futures.append(executor.submit(_analyze_batch_in_worker, batch))
+                        batch = []
+                if batch:
+                    futures.append(executor.submit(_analyze_batch_in_worker, batch))
+                self.logger.info("Found %d files to analyze", len(files))
+
+                # Progress is reported once per batch rather than logged per file
+                for future in futures:
+                    results.extend(future.result())
+                    if progress_callback:
+                        progress_callback(len(results), len(files))
+        except (OSError, BrokenProcessPool) as e:
+            self.logger.warning("Process pool unavailable (%s); analyzing sequentially", e)
+            # Finish discovery, then resume after the last file the pool delivered
+            files.extend(file_iter)
+            for i in range(len(results), len(files)):
+                results.append(self.analyze_file(files[i]))
+                if progress_callback:
+                    progress_callback(i + 1, len(files))
+
+        return files, results
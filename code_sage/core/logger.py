@@ -3,10 +3,8 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from datetime import datetime
-from rich.console import Console
-from rich.logging import RichHandler
 
 
 class CodeSageLogger:
@@ -25,7 +23,11 @@ class CodeSageLogger:
         self.logger.setLevel(level)
         self.logger.handlers.clear()
 
-        # Rich console handler for beautiful terminal output
+        # Rich console handler for beautiful terminal output; rich is imported
+        # here so that importing the library does not load it
+        from rich.console import Console
+        from rich.logging import RichHandler
+
         console = Console(stderr=True)
         rich_handler = RichHandler(
             console=console,
@@ -49,29 +51,30 @@ class CodeSageLogger:
             file_handler.setFormatter(formatter)
             self.logger.addHandler(file_handler)
 
-    def debug(self, message: str) -> None:
+    # Messages take %-style args, which logging formats only for enabled levels
+    def debug(self, message: str, *args: Any) -> None:
         """Log debug message."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """Log info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Log warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         """Log critical message."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
 
-    def exception(self, message: str) -> None:
+    def exception(self, message: str, *args: Any) -> None:
         """Log exception with traceback."""
-        self.logger.exception(message)
+        self.logger.exception(message, *args)
 
     def set_level(self, level: int) -> None:
         """Set logging level."""
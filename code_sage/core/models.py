@@ -1,9 +1,19 @@
 """Core data models for Code Sage."""
 
+import sys
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Optional, Any
+from typing import Callable, List, Dict, Optional, Any
 from datetime import datetime
+from pathlib import Path
+
+from code_sage.utils.json_utils import write_json_records
+
+
+# Per-instance __slots__ for the high-volume models where supported (Python 3.10+)
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class IssueSeverity(Enum):
@@ -17,14 +27,17 @@ class IssueSeverity(Enum):
 
     def __lt__(self, other: "IssueSeverity") -> bool:
         """Allow severity comparison."""
-        severity_order = [
-            IssueSeverity.INFO,
-            IssueSeverity.LOW,
-            IssueSeverity.MEDIUM,
-            IssueSeverity.HIGH,
-            IssueSeverity.CRITICAL,
-        ]
-        return severity_order.index(self) < severity_order.index(other)
+        return SEVERITY_RANK[self] < SEVERITY_RANK[other]
+
+
+# Integer rank of each severity, lowest first, for cheap threshold checks
+SEVERITY_RANK: Dict[IssueSeverity, int] = {
+    IssueSeverity.INFO: 0,
+    IssueSeverity.LOW: 1,
+    IssueSeverity.MEDIUM: 2,
+    IssueSeverity.HIGH: 3,
+    IssueSeverity.CRITICAL: 4,
+}
 
 
 class IssueCategory(Enum):
@@ -42,7 +55,7 @@ class IssueCategory(Enum):
     MAINTAINABILITY = "maintainability"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CodeLocation:
     """Location of code in a file."""
 
@@ -59,7 +72,7 @@ class CodeLocation:
         return f"{self.file_path}:{self.line_start}-{self.line_end}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Issue:
     """Represents a code issue found during analysis."""
 
@@ -78,9 +91,33 @@ class Issue:
     rule_id: Optional[str] = None
     references: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert issue to dictionary."""
+    # Deferred snippet builder; most issues are never rendered with their snippet
+    snippet_loader: Optional[Callable[[], str]] = field(default=None, repr=False, compare=False)
+    severity_rank: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the integer severity rank used by filters and sorts."""
+        self.severity_rank = SEVERITY_RANK[self.severity]
+
+    def get_snippet(self) -> Optional[str]:
+        """
+        Get the code snippet, building it on first access if it was deferred.
+
+        Returns:
+            Code snippet or None if the issue has none
+        """
+        if self.code_snippet is None and self.snippet_loader is not None:
+            self.code_snippet = self.snippet_loader()
+            self.snippet_loader = None
+        return self.code_snippet
+
+    def to_dict(self, resolve_snippet: bool = True) -> Dict[str, Any]:
+        """
+        Convert issue to dictionary.
+
+        Args:
+            resolve_snippet: Build a deferred snippet; otherwise it is left as None
+        """
         return {
             "id": self.id,
             "title": self.title,
@@ -94,7 +131,7 @@ class Issue:
                 "column_start": self.location.column_start,
                 "column_end": self.location.column_end,
             },
-            "code_snippet": self.code_snippet,
+            "code_snippet": self.get_snippet() if resolve_snippet else self.code_snippet,
             "suggested_fix": self.suggested_fix,
             "fix_description": self.fix_description,
             "ai_explanation": self.ai_explanation,
@@ -105,8 +142,36 @@ class Issue:
             "metadata": self.metadata,
         }
 
-
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Issue":
+        """Create issue from the dictionary produced by to_dict()."""
+        location = data["location"]
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            description=data["description"],
+            severity=IssueSeverity(data["severity"]),
+            category=IssueCategory(data["category"]),
+            location=CodeLocation(
+                file_path=location["file"],
+                line_start=location["line_start"],
+                line_end=location["line_end"],
+                column_start=location["column_start"],
+                column_end=location["column_end"],
+            ),
+            code_snippet=data["code_snippet"],
+            suggested_fix=data["suggested_fix"],
+            fix_description=data["fix_description"],
+            ai_explanation=data["ai_explanation"],
+            confidence=data["confidence"],
+            auto_fixable=data["auto_fixable"],
+            rule_id=data["rule_id"],
+            references=data["references"],
+            metadata=data["metadata"],
+        )
+
+
+@dataclass(**_SLOTS)
 class CodeMetrics:
     """Code quality metrics."""
 
@@ -134,8 +199,13 @@ class CodeMetrics:
             "halstead_effort": self.halstead_effort,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CodeMetrics":
+        """Create metrics from the dictionary produced by to_dict()."""
+        return cls(**data)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class FileAnalysis:
     """Analysis results for a single file."""
 
@@ -155,18 +225,57 @@ class FileAnalysis:
         """Get issues filtered by category."""
         return [issue for issue in self.issues if issue.category == category]
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert file analysis to dictionary."""
+    def to_dict(self, resolve_snippets: bool = True) -> Dict[str, Any]:
+        """
+        Convert file analysis to dictionary.
+
+        Args:
+            resolve_snippets: Build deferred issue snippets; otherwise they are left as None
+        """
         return {
             "file_path": self.file_path,
             "language": self.language,
-            "issues": [issue.to_dict() for issue in self.issues],
+            "issues": [issue.to_dict(resolve_snippets) for issue in self.issues],
             "metrics": self.metrics.to_dict() if self.metrics else None,
             "analysis_time": self.analysis_time,
             "success": self.success,
             "error": self.error,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FileAnalysis":
+        """Create file analysis from the dictionary produced by to_dict()."""
+        metrics = data["metrics"]
+        return cls(
+            file_path=data["file_path"],
+            language=data["language"],
+            issues=[Issue.from_dict(issue) for issue in data["issues"]],
+            metrics=CodeMetrics.from_dict(metrics) if metrics is not None else None,
+            analysis_time=data["analysis_time"],
+            success=data["success"],
+            error=data["error"],
+        )
+
+
+# Stable small-int code per category for the issue index's category column
+_CATEGORY_CODE: Dict[IssueCategory, int] = {
+    category: code for code, category in enumerate(IssueCategory)
+}
+
+
+@dataclass
+class _IssueIndex:
+    """Flattened issues with parallel severity-rank and category-code columns."""
+
+    sources: List[List[Issue]]
+    sizes: List[int]
+    issues: List[Issue]
+    severity_ranks: array
+    category_codes: array
+    # Count dicts, filled on first request and dropped with the index
+    severity_counts: Optional[Dict[str, int]] = None
+    category_counts: Optional[Dict[str, int]] = None
+
 
 @dataclass
 class AnalysisResult:
@@ -180,10 +289,46 @@ class AnalysisResult:
     total_time: float = 0.0
     languages: Dict[str, int] = field(default_factory=dict)
     summary: Dict[str, Any] = field(default_factory=dict)
+    # Per-file issue lists keyed by file path, shared with file_analyses
+    issues_by_file: Dict[str, List[Issue]] = field(default_factory=dict, repr=False)
+    _index: Optional[_IssueIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    def _issue_index(self) -> _IssueIndex:
+        """
+        Get the flat issue index, rebuilding it if any file's issues changed.
+
+        Per-file issue lists are replaced or extended after analysis (dedupe,
+        security scan, severity filter), so the index is validated against
+        the identity and length of every list. That check costs one step per
+        file rather than one per issue.
+        """
+        sources = [file_analysis.issues for file_analysis in self.file_analyses]
+        sizes = [len(issues) for issues in sources]
+        index = self._index
+        if (
+            index is not None
+            and index.sizes == sizes
+            and all(cached is current for cached, current in zip(index.sources, sources))
+        ):
+            return index
+
+        issues: List[Issue] = []
+        for file_issues in sources:
+            issues.extend(file_issues)
+        index = _IssueIndex(
+            sources=sources,
+            sizes=sizes,
+            issues=issues,
+            severity_ranks=array("b", [issue.severity_rank for issue in issues]),
+            category_codes=array("b", [_CATEGORY_CODE[issue.category] for issue in issues]),
+        )
+        self._index = index
+        return index
 
     def add_file_analysis(self, file_analysis: FileAnalysis) -> None:
         """Add a file analysis result."""
         self.file_analyses.append(file_analysis)
+        self.issues_by_file[file_analysis.file_path] = file_analysis.issues
         self.total_files += 1
         self.total_issues += len(file_analysis.issues)
         self.total_time += file_analysis.analysis_time
@@ -194,35 +339,44 @@ class AnalysisResult:
 
     def get_all_issues(self) -> List[Issue]:
         """Get all issues across all files."""
-        issues = []
-        for file_analysis in self.file_analyses:
-            issues.extend(file_analysis.issues)
-        return issues
+        return list(self._issue_index().issues)
 
     def get_issues_by_severity(self, severity: IssueSeverity) -> List[Issue]:
         """Get all issues of a specific severity."""
-        return [issue for issue in self.get_all_issues() if issue.severity == severity]
+        index = self._issue_index()
+        rank = SEVERITY_RANK[severity]
+        return [issue for issue, r in zip(index.issues, index.severity_ranks) if r == rank]
 
     def get_issues_by_category(self, category: IssueCategory) -> List[Issue]:
         """Get all issues of a specific category."""
-        return [issue for issue in self.get_all_issues() if issue.category == category]
+        index = self._issue_index()
+        code = _CATEGORY_CODE[category]
+        return [issue for issue, c in zip(index.issues, index.category_codes) if c == code]
 
     def get_severity_counts(self) -> Dict[str, int]:
         """Get count of issues by severity."""
-        counts = {severity.value: 0 for severity in IssueSeverity}
-        for issue in self.get_all_issues():
-            counts[issue.severity.value] += 1
-        return counts
+        index = self._issue_index()
+        if index.severity_counts is None:
+            # One counting pass over the rank column instead of a count() per severity
+            counts = Counter(index.severity_ranks)
+            index.severity_counts = {
+                severity.value: counts[SEVERITY_RANK[severity]] for severity in IssueSeverity
+            }
+        return dict(index.severity_counts)
 
     def get_category_counts(self) -> Dict[str, int]:
         """Get count of issues by category."""
-        counts = {category.value: 0 for category in IssueCategory}
-        for issue in self.get_all_issues():
-            counts[issue.category.value] += 1
-        return counts
+        index = self._issue_index()
+        if index.category_counts is None:
+            counts = Counter(index.category_codes)
+            index.category_counts = {
+                category.value: counts[_CATEGORY_CODE[category]] for category in IssueCategory
+            }
+        return dict(index.category_counts)
 
     def generate_summary(self) -> None:
         """Generate analysis summary."""
+        index = self._issue_index()
         self.summary = {
             "project_path": self.project_path,
             "timestamp": self.timestamp.isoformat(),
@@ -232,15 +386,37 @@ class AnalysisResult:
             "languages": self.languages,
             "severity_counts": self.get_severity_counts(),
             "category_counts": self.get_category_counts(),
-            "auto_fixable_count": len([i for i in self.get_all_issues() if i.auto_fixable]),
+            "auto_fixable_count": sum(issue.auto_fixable for issue in index.issues),
         }
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert analysis result to dictionary."""
+        return self._to_dict([fa.to_dict() for fa in self.file_analyses])
+
+    def dump_json(self, output_path: Path) -> None:
+        """
+        Write the result as indented JSON.
+
+        The document matches ``write_json(self.to_dict(), output_path)``, but
+        file analyses are converted and encoded one at a time instead of
+        building the full nested dict first.
+
+        Args:
+            output_path: Destination file
+        """
+        write_json_records(
+            self._to_dict(None),
+            "file_analyses",
+            (fa.to_dict() for fa in self.file_analyses),
+            output_path,
+        )
+
+    def _to_dict(self, file_analyses: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Build the result dictionary around already converted file analyses."""
         return {
             "project_path": self.project_path,
             "timestamp": self.timestamp.isoformat(),
-            "file_analyses": [fa.to_dict() for fa in self.file_analyses],
+            "file_analyses": file_analyses,
             "total_files": self.total_files,
             "total_issues": self.total_issues,
             "total_time": self.total_time,
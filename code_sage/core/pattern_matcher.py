@@ -1,13 +1,38 @@
 """Pattern matching engine for detecting code issues."""
 
+import mmap
+import os
 import re
 import hashlib
+import threading
+from bisect import bisect_right
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Pattern
-from dataclasses import dataclass
+from typing import List, Dict, Any, FrozenSet, Optional, Pattern, Sequence, Tuple
+from dataclasses import astuple, dataclass, field
 
+from code_sage.core.exceptions import FileAccessError
 from code_sage.core.models import Issue, IssueSeverity, IssueCategory, CodeLocation
 from code_sage.core.logger import get_logger
+from code_sage.utils.file_utils import read_file
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None  # type: ignore[assignment]
+
+# Line breaks other than "\n" that str.splitlines() also splits on
+_OTHER_LINE_BREAKS = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+# Lookarounds, conditionals and \A/\Z read differently at a line boundary
+# when the pattern runs over a whole buffer instead of a single line
+_LINE_SENSITIVE = re.compile(r"\(\?<?[=!]|\(\?\(|\\[AZ]")
+# Python and PCRE read "{,n}" and "[:...:]" differently
+_PCRE_DIVERGENT = re.compile(r"\{,|\[:")
+# Rule flags with a Hyperscan equivalent; MULTILINE is always set for buffer scans
+_HYPERSCAN_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE
+# Bytes that keep a mapped file off the Hyperscan path: non-ASCII, other line
+# breaks, and \x1f, which re counts as whitespace
+_UNSCANNABLE_BYTES = re.compile(rb"[^\x00-\x7f]|[\r\x0b\x0c\x1c-\x1f]")
+_NEWLINE = ord("\n")
 
 
 @dataclass
@@ -27,6 +52,46 @@ class PatternRule:
     flags: int = 0
 
 
+@dataclass
+class _LanguageRules:
+    """Compiled rules for one language."""
+
+    # (rule, compiled pattern, MULTILINE variant for whole-buffer scans or None)
+    rules: List[Tuple[PatternRule, Pattern, Optional[Pattern]]]
+    # Hyperscan database reporting matches by index into rules, if available
+    hs_db: Any = None
+    hs_indexes: FrozenSet[int] = field(default_factory=frozenset)
+
+
+class _MappedLines(Sequence[str]):
+    """Lines of a mapped ASCII file, decoded on access as str.splitlines() would split them."""
+
+    def __init__(self, data: Any, line_starts: List[int]) -> None:
+        self._data = data
+        self._starts = line_starts
+        # splitlines() yields no empty line after a trailing "\n"
+        self._count = len(line_starts) - (line_starts[-1] == len(data))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:  # type: ignore[override]
+        start = self._starts[index]
+        if index + 1 < len(self._starts):
+            end = self._starts[index + 1] - 1
+        else:
+            end = len(self._data)
+        line: str = self._data[start:end].decode("ascii")
+        return line
+
+
+def _add_candidate(candidates: Dict[int, List[int]], index: int, line_num: int) -> None:
+    """Record a candidate line for a rule, given lines in ascending order."""
+    rule_lines = candidates.setdefault(index, [])
+    if not rule_lines or rule_lines[-1] != line_num:
+        rule_lines.append(line_num)
+
+
 class PatternMatcher:
     """Pattern matching engine for code analysis."""
 
@@ -35,6 +100,10 @@ class PatternMatcher:
         self.logger = get_logger()
         self.rules: List[PatternRule] = []
         self._compiled_patterns: Dict[str, Pattern] = {}
+        self._by_language: Dict[str, _LanguageRules] = {}
+        self._fingerprint: Optional[str] = None
+        # Hyperscan scratch space cannot be shared across threads
+        self._hs_local = threading.local()
         self._load_default_rules()
 
     def _load_default_rules(self) -> None:
@@ -148,10 +217,29 @@ class PatternMatcher:
             rule: PatternRule to add
         """
         self.rules.append(rule)
+        self._fingerprint = None
+        # Only the rule's own languages need their compiled rules rebuilt
+        for language in rule.languages:
+            self._by_language.pop(language, None)
         try:
             self._compiled_patterns[rule.id] = re.compile(rule.pattern, rule.flags)
         except re.error as e:
-            self.logger.error(f"Invalid regex pattern in rule {rule.id}: {e}")
+            self.logger.error("Invalid regex pattern in rule %s: %s", rule.id, e)
+
+    def fingerprint(self) -> str:
+        """
+        Hash the active rules, so cached results can be tied to the rule set.
+
+        Returns:
+            Hex digest of every rule's definition, in rule order
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for rule in self.rules:
+                digest.update(repr(astuple(rule)).encode("utf-8"))
+                digest.update(b"\0")
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
 
     def match_file(self, file_path: Path, content: str, language: str) -> List[Issue]:
         """
@@ -165,36 +253,153 @@ class PatternMatcher:
         Returns:
             List of issues found
         """
-        issues = []
         lines = content.splitlines()
 
-        for rule in self.rules:
-            # Skip if language not supported by this rule
-            if language not in rule.languages:
-                continue
+        # Lines end only in "\n", so a whole-buffer scan sees the same lines
+        whole_buffer = not _OTHER_LINE_BREAKS.search(content)
+        language_rules = self._rules_for_language(language)
 
-            pattern = self._compiled_patterns.get(rule.id)
-            if not pattern:
-                continue
+        # Hyperscan sees bytes; on ASCII text they line up with characters and
+        # its classes agree with re, except that re also counts \x1f as \s
+        hs_lines: Optional[Dict[int, List[int]]] = None
+        if (
+            language_rules.hs_db is not None
+            and whole_buffer
+            and content.isascii()
+            and "\x1f" not in content
+        ):
+            hs_lines = {}
+            line_num = 1
+            pos = 0
+            for at, index in self._scan_hyperscan(
+                language, language_rules.hs_db, content.encode("ascii")
+            ):
+                line_num += content.count("\n", pos, at)
+                pos = at
+                if line_num > len(lines):
+                    break
+                _add_candidate(hs_lines, index, line_num)
+
+        rule_candidates = []
+        for index, (rule, pattern, buffer_pattern) in enumerate(language_rules.rules):
+            if hs_lines is not None and index in language_rules.hs_indexes:
+                candidates = hs_lines.get(index, [])
+            elif whole_buffer and buffer_pattern is not None:
+                candidates = self._candidate_lines(buffer_pattern, content, len(lines))
+            else:
+                search = pattern.search
+                candidates = [n for n, line in enumerate(lines, start=1) if search(line)]
+            rule_candidates.append((rule, pattern, candidates))
+
+        return self._build_issues(file_path, lines, rule_candidates)
+
+    def match_mmap(self, file_path: Path, language: str) -> List[Issue]:
+        """
+        Match patterns in a file without decoding all of it.
+
+        The file is memory-mapped and scanned in place by Hyperscan, and only
+        the candidate lines and their snippet context are decoded. Files and
+        rule sets the Hyperscan path cannot handle exactly (non-ASCII bytes,
+        line breaks other than "\n", rules Hyperscan does not cover) are
+        read and passed to match_file() instead, so results are the same.
+
+        Args:
+            file_path: Path to file
+            language: Programming language
+
+        Returns:
+            List of issues found
+
+        Raises:
+            FileAccessError: If file cannot be read
+        """
+        language_rules = self._rules_for_language(language)
+        if language_rules.hs_db is not None and len(language_rules.hs_indexes) == len(
+            language_rules.rules
+        ):
+            try:
+                with open(file_path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                            if not _UNSCANNABLE_BYTES.search(data):
+                                return self._match_mapped(file_path, data, language)
+            except OSError as e:
+                raise FileAccessError(f"Cannot read file: {e}", str(file_path))
+
+        return self.match_file(file_path, read_file(file_path), language)
+
+    def _match_mapped(self, file_path: Path, data: Any, language: str) -> List[Issue]:
+        """
+        Match the rules of a language against a mapped ASCII file.
+
+        Args:
+            file_path: Path to file
+            data: Non-empty bytes-like file contents accepted by match_mmap()
+            language: Programming language
+
+        Returns:
+            List of issues found
+        """
+        language_rules = self._rules_for_language(language)
+        line_starts = [0]
+        line_starts.extend(match.end() for match in re.finditer(b"\n", data))
+        lines = _MappedLines(data, line_starts)
+
+        hs_lines: Dict[int, List[int]] = {}
+        for at, index in self._scan_hyperscan(language, language_rules.hs_db, data):
+            line_num = bisect_right(line_starts, at)
+            if line_num <= len(lines):
+                _add_candidate(hs_lines, index, line_num)
+
+        rule_candidates = [
+            (rule, pattern, hs_lines.get(index, []))
+            for index, (rule, pattern, _) in enumerate(language_rules.rules)
+        ]
+        return self._build_issues(file_path, lines, rule_candidates)
+
+    def _build_issues(
+        self,
+        file_path: Path,
+        lines: Sequence[str],
+        rule_candidates: List[Tuple[PatternRule, Pattern, List[int]]],
+    ) -> List[Issue]:
+        """
+        Run each rule over its candidate lines and build the issues.
+
+        Args:
+            file_path: Path to file
+            lines: Lines of the file
+            rule_candidates: Rules with their pattern and candidate line numbers
+
+        Returns:
+            Issues ordered by rule, then line and column
+        """
+        issues = []
+        fp_str = str(file_path)
+        fp_bytes = f"{fp_str}:".encode()
+        # Several rules often hit the same line, which shares one snippet
+        snippet_cache: Dict[int, str] = {}
 
-            # Search each line
-            for line_num, line in enumerate(lines, start=1):
-                matches = pattern.finditer(line)
-                for match in matches:
+        for rule, pattern, candidates in rule_candidates:
+            for line_num in candidates:
+                for match in pattern.finditer(lines[line_num - 1]):
+                    snippet = snippet_cache.get(line_num)
+                    if snippet is None:
+                        snippet = snippet_cache[line_num] = self._get_snippet(lines, line_num)
                     issue = Issue(
-                        id=self._generate_issue_id(file_path, rule.id, line_num),
+                        id=self._generate_issue_id(fp_bytes, rule.id, line_num),
                         title=rule.name,
                         description=rule.message,
                         severity=rule.severity,
                         category=rule.category,
                         location=CodeLocation(
-                            file_path=str(file_path),
+                            file_path=fp_str,
                             line_start=line_num,
                             line_end=line_num,
                             column_start=match.start(),
                             column_end=match.end(),
                         ),
-                        code_snippet=self._get_snippet(lines, line_num),
+                        code_snippet=snippet,
                         suggested_fix=rule.fix_suggestion,
                         auto_fixable=rule.auto_fixable,
                         rule_id=rule.id,
@@ -203,7 +408,172 @@ class PatternMatcher:
 
         return issues
 
-    def _get_snippet(self, lines: List[str], line_num: int, context: int = 2) -> str:
+    def _rules_for_language(self, language: str) -> _LanguageRules:
+        """
+        Get the compiled rules for a language, building them on first use.
+
+        Each rule carries a MULTILINE variant of its pattern for whole-buffer
+        scans, or None when the pattern must run line by line.
+
+        Args:
+            language: Programming language
+
+        Returns:
+            Rules that apply to the language, in definition order
+        """
+        cached = self._by_language.get(language)
+        if cached is not None:
+            return cached
+
+        rules: List[Tuple[PatternRule, Pattern, Optional[Pattern]]] = []
+        for rule in self.rules:
+            pattern = self._compiled_patterns.get(rule.id)
+            if language not in rule.languages or not pattern:
+                continue
+            buffer_pattern = None
+            if not _LINE_SENSITIVE.search(rule.pattern):
+                buffer_pattern = re.compile(rule.pattern, rule.flags | re.MULTILINE)
+            rules.append((rule, pattern, buffer_pattern))
+
+        language_rules = _LanguageRules(rules=rules)
+        if hyperscan is not None:
+            language_rules.hs_db, language_rules.hs_indexes = self._compile_hyperscan(rules)
+        self._by_language[language] = language_rules
+        return language_rules
+
+    def _compile_hyperscan(
+        self, rules: List[Tuple[PatternRule, Pattern, Optional[Pattern]]]
+    ) -> Tuple[Any, FrozenSet[int]]:
+        """
+        Compile the rules Hyperscan can run into one database.
+
+        Rules need a buffer pattern, an ASCII pattern and flags Hyperscan can
+        express. Hyperscan rejects the rest itself (e.g. backreferences), in
+        which case each rule is tried alone and the ones it accepts are
+        compiled together.
+
+        Args:
+            rules: Rules of one language as built by _rules_for_language()
+
+        Returns:
+            Database (or None) and the indexes of the rules it covers
+        """
+        expressions: Dict[int, Tuple[bytes, int]] = {}
+        for index, (rule, _, buffer_pattern) in enumerate(rules):
+            if (
+                buffer_pattern is None
+                or rule.flags & ~_HYPERSCAN_FLAGS
+                or _PCRE_DIVERGENT.search(rule.pattern)
+                or not rule.pattern.isascii()
+            ):
+                continue
+            # re reports empty matches, so Hyperscan must as well
+            hs_flags = hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_ALLOWEMPTY
+            if rule.flags & re.IGNORECASE:
+                hs_flags |= hyperscan.HS_FLAG_CASELESS
+            if rule.flags & re.DOTALL:
+                hs_flags |= hyperscan.HS_FLAG_DOTALL
+            expressions[index] = (rule.pattern.encode("ascii"), hs_flags)
+
+        def compile_db(indexes: List[int]) -> Any:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[expressions[i][0] for i in indexes],
+                ids=indexes,
+                flags=[expressions[i][1] for i in indexes],
+            )
+            return db
+
+        indexes = list(expressions)
+        if not indexes:
+            return None, frozenset()
+        try:
+            return compile_db(indexes), frozenset(indexes)
+        except hyperscan.error:
+            pass
+
+        accepted = []
+        for index in indexes:
+            try:
+                compile_db([index])
+            except hyperscan.error as e:
+                self.logger.debug("Rule %s runs without Hyperscan: %s", rules[index][0].id, e)
+                continue
+            accepted.append(index)
+        if not accepted:
+            return None, frozenset()
+        return compile_db(accepted), frozenset(accepted)
+
+    def _scan_hyperscan(self, language: str, db: Any, data: Any) -> List[Tuple[int, int]]:
+        """
+        Find where every rule can match in one Hyperscan pass.
+
+        Hyperscan reports each offset at which any match of a rule ends, so a
+        match within a line always reports a position on that line; matches
+        running across a newline only add extra candidates.
+
+        Args:
+            language: Programming language the database belongs to
+            db: Database from _compile_hyperscan()
+            data: ASCII bytes-like content with "\n" line endings only
+
+        Returns:
+            Ascending (offset, rule index) pairs, where the offset is the last
+            matched byte or, for an empty match at the start of a line, the
+            match position
+        """
+        ends: List[Tuple[int, int]] = []
+
+        def on_match(index: int, start: int, end: int, flags: int, context: Any) -> None:
+            ends.append((end, index))
+
+        db.scan(data, match_event_handler=on_match, scratch=self._hs_scratch(language, db))
+        ends.sort()
+        return [
+            (end - 1 if end and data[end - 1] != _NEWLINE else end, index) for end, index in ends
+        ]
+
+    def _hs_scratch(self, language: str, db: Any) -> Any:
+        """Get this thread's Hyperscan scratch space for a language's database."""
+        scratches = self._hs_local.__dict__.setdefault("scratches", {})
+        cached = scratches.get(language)
+        # A database rebuilt after add_rule() needs scratch sized for it
+        if cached is not None and cached[0] is db:
+            return cached[1]
+        scratch = hyperscan.Scratch(db)
+        scratches[language] = (db, scratch)
+        return scratch
+
+    def _candidate_lines(self, pattern: Pattern, content: str, line_count: int) -> List[int]:
+        """
+        Find the lines a pattern can match by scanning the whole buffer once.
+
+        Every line a match touches is returned. A match within a single line
+        either is found by the buffer scan or lies inside a longer match that
+        crosses into it, so the result covers every line the per-line search
+        would match; callers confirm each candidate line by line.
+
+        Args:
+            pattern: MULTILINE variant of a rule pattern
+            content: File content with "\n" line endings only
+            line_count: Number of lines in the content
+
+        Returns:
+            Ascending 1-based line numbers
+        """
+        candidates: List[int] = []
+        line_num = 1
+        pos = 0
+        for match in pattern.finditer(content):
+            start, end = match.span()
+            line_num += content.count("\n", pos, start)
+            pos = start
+            last = line_num + content.count("\n", start, max(start, end - 1))
+            first = candidates[-1] + 1 if candidates else 1
+            candidates.extend(range(max(first, line_num), min(last, line_count) + 1))
+        return candidates
+
+    def _get_snippet(self, lines: Sequence[str], line_num: int, context: int = 2) -> str:
         """Get code snippet with context."""
         start = max(0, line_num - 1 - context)
         end = min(len(lines), line_num + context)
@@ -215,10 +585,22 @@ class PatternMatcher:
 
         return "\n".join(snippet_lines)
 
-    def _generate_issue_id(self, file_path: Path, rule_id: str, line: int) -> str:
-        """Generate unique issue ID."""
-        data = f"{file_path}:{rule_id}:{line}"
-        return hashlib.md5(data.encode()).hexdigest()[:12]
+    def _generate_issue_id(self, fp_bytes: bytes, rule_id: str, line: int) -> str:
+        """
+        Generate unique issue ID.
+
+        Args:
+            fp_bytes: UTF-8 encoded file path followed by ':'
+            rule_id: ID of the matched rule
+            line: Line number of the issue
+
+        Returns:
+            12 hex character ID
+        """
+        # 6-byte BLAKE2b digest gives the same 12 hex characters without truncation
+        digest = hashlib.blake2b(fp_bytes, digest_size=6)
+        digest.update(f"{rule_id}:{line}".encode())
+        return digest.hexdigest()
 
     def load_custom_rules(self, rules_file: Path) -> None:
         """
@@ -252,7 +634,7 @@ class PatternMatcher:
                 )
                 self.add_rule(rule)
 
-            self.logger.info(f"Loaded custom rules from {rules_file}")
+            self.logger.info("Loaded custom rules from %s", rules_file)
 
         except Exception as e:
-            self.logger.error(f"Failed to load custom rules: {e}")
+            self.logger.error("Failed to load custom rules: %s", e)
@@ -0,0 +1,248 @@
+"""On-disk cache of per-file analysis results."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from code_sage import __version__
+from code_sage.core.analyzer import SnippetLoader
+from code_sage.core.config import Config
+from code_sage.core.exceptions import CacheError
+from code_sage.core.logger import get_logger
+from code_sage.core.models import FileAnalysis
+from code_sage.utils.json_utils import dumps_json_compact, loads_json
+
+
+def config_fingerprint(config: Config) -> str:
+    """
+    Hash the configuration sections that influence analysis results.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Hex digest of the analysis settings
+    """
+    payload = json.dumps(asdict(config.analysis), sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _to_record(analysis: FileAnalysis) -> Dict[str, Any]:
+    """Convert an analysis to its cache entry, keeping deferred snippets deferred."""
+    record = analysis.to_dict(resolve_snippets=False)
+    for issue, issue_record in zip(analysis.issues, record["issues"]):
+        loader = issue.snippet_loader
+        if issue.code_snippet is not None or loader is None:
+            continue
+        if isinstance(loader, SnippetLoader):
+            issue_record["snippet_range"] = [loader.line_start, loader.line_end, loader.context]
+        else:
+            issue_record["code_snippet"] = issue.get_snippet()
+    return record
+
+
+def _from_record(record: Dict[str, Any], content: str) -> FileAnalysis:
+    """Rebuild an analysis from its cache entry, deferring snippets over ``content``."""
+    analysis = FileAnalysis.from_dict(record)
+    lines: Optional[List[str]] = None
+    for issue, issue_record in zip(analysis.issues, record["issues"]):
+        snippet_range = issue_record.get("snippet_range")
+        if snippet_range is not None:
+            if lines is None:
+                lines = content.splitlines()
+            line_start, line_end, context = snippet_range
+            issue.snippet_loader = SnippetLoader(lines, line_start, line_end, context)
+    return analysis
+
+
+class ResultCache:
+    """
+    Cache of FileAnalysis results in a sharded directory of JSON files.
+
+    Entries live at ``<cache_dir>/<key[:2]>/<key>.json`` and hold the
+    FileAnalysis.to_dict() form, with deferred snippets stored as the line range
+    to format on demand rather than as text. They are plain data rather than pickles, so a
+    cache directory planted in an analyzed checkout cannot run code when read.
+    A file's mtime marks
+    when the entry was written (for TTL expiry) and its atime when it was last
+    served (for LRU eviction by prune()).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        fingerprint: str,
+        ttl_seconds: int = 3600,
+        max_size_mb: int = 500,
+    ):
+        """
+        Initialize the result cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries
+            fingerprint: Configuration fingerprint from config_fingerprint()
+            ttl_seconds: Time-to-live for cached results
+            max_size_mb: Size limit enforced by prune()
+
+        Raises:
+            CacheError: If the cache directory cannot be created
+        """
+        self.cache_dir = cache_dir
+        self.fingerprint = fingerprint
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.logger = get_logger()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise CacheError(f"Cannot create result cache in {cache_dir}: {e}")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ResultCache":
+        """
+        Create a result cache from the cache settings of a configuration.
+
+        Args:
+            config: Configuration object
+
+        Returns:
+            ResultCache stored under ``<cache_dir>/results``
+        """
+        return cls(
+            Path(config.cache.cache_dir) / "results",
+            config_fingerprint(config),
+            ttl_seconds=config.cache.ttl_seconds,
+            max_size_mb=config.cache.max_size_mb,
+        )
+
+    def make_key(self, file_path: Path, content: bytes, rules_fingerprint: str = "") -> str:
+        """
+        Build the cache key for a file.
+
+        The path is hashed along with the bytes because results carry the
+        file path and path-derived issue IDs.
+
+        Args:
+            file_path: Path to file
+            content: Raw file contents
+            rules_fingerprint: Fingerprint of rules applied on top of the
+                configuration, such as PatternMatcher.fingerprint()
+
+        Returns:
+            Key of the form
+            ``<content digest>:<version>:<config fingerprint>:<rules fingerprint>``
+        """
+        digest = hashlib.blake2b(str(file_path).encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(content)
+        return f"{digest.hexdigest()}:{__version__}:{self.fingerprint}:{rules_fingerprint}"
+
+    def _entry_path(self, key: str) -> Path:
+        """Map a key to its entry file."""
+        name = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / name[:2] / f"{name}.json"
+
+    def get(self, key: str, content: str) -> Optional[FileAnalysis]:
+        """
+        Look up a cached analysis.
+
+        Args:
+            key: Cache key from make_key()
+            content: Decoded contents of the file, for deferred snippets
+
+        Returns:
+            Cached FileAnalysis or None on miss/expiry
+        """
+        path = self._entry_path(key)
+        try:
+            stat = path.stat()
+            if time.time() - stat.st_mtime > self.ttl_seconds:
+                path.unlink()
+                self.stats["misses"] += 1
+                return None
+            analysis = _from_record(loads_json(path.read_bytes()), content)
+            # Record the use for LRU eviction without touching the write time
+            os.utime(path, (time.time(), stat.st_mtime))
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning("Result cache read failed for %s: %s", path, e)
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return analysis
+
+    def set(self, key: str, analysis: FileAnalysis) -> None:
+        """
+        Store an analysis.
+
+        Entries are written to a temporary file and renamed into place, so
+        concurrent workers never observe a partial entry.
+
+        Args:
+            key: Cache key from make_key()
+            analysis: Analysis result to store
+        """
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(dumps_json_compact(_to_record(analysis)))
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning("Result cache write failed for %s: %s", path, e)
+
+    def prune(self) -> int:
+        """
+        Drop expired entries, then evict least recently used ones until the
+        cache fits within its size limit.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        entries = []
+        total_size = 0
+        removed = 0
+
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+                if now - stat.st_mtime > self.ttl_seconds:
+                    path.unlink()
+                    removed += 1
+                    continue
+            except OSError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+            total_size += stat.st_size
+
+        if total_size > self.max_size_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                if total_size <= self.max_size_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total_size -= size
+                removed += 1
+
+        if removed:
+            self.logger.debug("Pruned %d result cache entries", removed)
+        return removed
@@ -2,10 +2,59 @@
 
 import os
 import fnmatch
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Iterator, List, Optional, Pattern, Set, Tuple
 from code_sage.core.exceptions import FileAccessError
 
+try:
+    import pathspec
+except ImportError:
+    pathspec = None  # type: ignore[assignment]
+
+# Path substrings that always exclude a file (and every file below a matching directory)
+_COMMON_IGNORES = (
+    "__pycache__",
+    ".git",
+    ".svn",
+    "node_modules",
+    "venv",
+    "env",
+    ".env",
+    "build",
+    "dist",
+    ".pytest_cache",
+    ".tox",
+    "*.pyc",
+    "*.pyo",
+    "*.so",
+    "*.dylib",
+    "*.min.js",
+    "*.bundle.js",
+)
+
+
+@lru_cache(maxsize=32)
+def compile_globs(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """
+    Compile glob patterns into a single regex matching any of them.
+
+    Matching a path against the combined regex is equivalent to calling
+    ``fnmatch.fnmatch`` with each pattern, but takes one regex call.
+
+    Args:
+        patterns: Glob patterns
+
+    Returns:
+        Compiled regex, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)
+    )
+
 
 class FileDiscovery:
     """File discovery and filtering utility."""
@@ -50,6 +99,12 @@ class FileDiscovery:
         self.ignore_patterns = ignore_patterns or []
         self.respect_gitignore = respect_gitignore
         self.gitignore_patterns: Set[str] = set()
+        # Same patterns in file order; negations depend on what precedes them
+        self._gitignore_lines: List[str] = []
+        # Compiled .gitignore with git's matching rules when pathspec is installed
+        self._gitignore_spec: Optional["pathspec.GitIgnoreSpec"] = None
+        self._include_re = compile_globs(tuple(self.include_patterns))
+        self._ignore_re = compile_globs(tuple(self.ignore_patterns))
 
     def discover_files(self, root_path: Path, recursive: bool = True) -> List[Path]:
         """
@@ -60,101 +115,131 @@ class FileDiscovery:
             recursive: Whether to search recursively
 
         Returns:
-            List of file paths to analyze
+            Sorted list of file paths to analyze
+        """
+        return sorted(self.iter_files(root_path, recursive))
+
+    def iter_files(self, root_path: Path, recursive: bool = True) -> Iterator[Path]:
+        """
+        Yield files to analyze as the directory walk finds them.
+
+        Args:
+            root_path: Root directory to search
+            recursive: Whether to search recursively
+
+        Yields:
+            File paths to analyze, in directory walk order
+
+        Raises:
+            FileAccessError: If the root path does not exist
         """
         if not root_path.exists():
             raise FileAccessError(f"Path does not exist", str(root_path))
 
-        # If it's a file, return it directly
+        # If it's a file, yield it directly
         if root_path.is_file():
             if self._should_include_file(root_path):
-                return [root_path]
-            return []
+                yield root_path
+            return
 
         # Load .gitignore patterns if needed
         if self.respect_gitignore:
             self._load_gitignore(root_path)
 
-        # Discover files
-        files = []
-        if recursive:
-            for file_path in root_path.rglob("*"):
-                if file_path.is_file() and self._should_include_file(file_path):
-                    files.append(file_path)
-        else:
-            for file_path in root_path.iterdir():
-                if file_path.is_file() and self._should_include_file(file_path):
-                    files.append(file_path)
+        # Walk with scandir; its cached entry types avoid a stat per file, and
+        # ignored directories are pruned instead of descended into
+        stack = [(str(root_path), "")]
+        while stack:
+            directory, rel_dir = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue  # Unreadable directories are skipped, as rglob does
+
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and not self._is_dir_ignored(entry.path, rel_path + "/"):
+                            stack.append((entry.path, rel_path + "/"))
+                        continue
+                    is_file = entry.is_file()
+                except OSError:
+                    continue
+                if is_file:
+                    file_path = Path(entry.path)
+                    if self._should_include_file(file_path, rel_path):
+                        yield file_path
+
+    def _is_dir_ignored(self, dir_path: str, rel_dir: str) -> bool:
+        """
+        Check if every file below a directory would be ignored.
 
-        return sorted(files)
+        Args:
+            dir_path: Directory path
+            rel_dir: Directory path relative to the root, with a trailing slash
+
+        Returns:
+            True if the directory can be skipped without walking it
+        """
+        # Every file path below contains the directory path as a prefix
+        if any(ignore in dir_path for ignore in _COMMON_IGNORES):
+            return True
+        # Git does not re-include files below an excluded directory
+        return self._gitignore_spec is not None and self._gitignore_spec.match_file(rel_dir)
 
-    def _should_include_file(self, file_path: Path) -> bool:
+    def _should_include_file(self, file_path: Path, rel_path: Optional[str] = None) -> bool:
         """
         Check if a file should be included in analysis.
 
         Args:
             file_path: Path to check
+            rel_path: Path relative to the discovery root, for .gitignore matching
 
         Returns:
             True if file should be included
         """
         # Check ignore patterns
-        if self._is_ignored(file_path):
+        if self._is_ignored(file_path, rel_path):
             return False
 
         # Check include patterns
-        if self.include_patterns:
-            return any(fnmatch.fnmatch(file_path.name, pattern) for pattern in self.include_patterns)
+        if self._include_re is not None:
+            return self._include_re.match(os.path.normcase(file_path.name)) is not None
 
         return True
 
-    def _is_ignored(self, file_path: Path) -> bool:
+    def _is_ignored(self, file_path: Path, rel_path: Optional[str] = None) -> bool:
         """
         Check if a file should be ignored.
 
         Args:
             file_path: Path to check
+            rel_path: Path relative to the discovery root, for .gitignore matching
 
         Returns:
             True if file should be ignored
         """
-        # Check explicit ignore patterns
-        relative_path = str(file_path)
-        for pattern in self.ignore_patterns:
-            if fnmatch.fnmatch(relative_path, pattern) or fnmatch.fnmatch(file_path.name, pattern):
-                return True
-
-        # Check gitignore patterns
-        for pattern in self.gitignore_patterns:
-            if fnmatch.fnmatch(relative_path, pattern) or fnmatch.fnmatch(file_path.name, pattern):
-                return True
+        # Check explicit patterns (and gitignore ones without pathspec) on the path and the name
+        path_str = str(file_path)
+        ignore_re = self._ignore_re
+        if ignore_re is not None and (
+            ignore_re.match(os.path.normcase(path_str))
+            or ignore_re.match(os.path.normcase(file_path.name))
+        ):
+            return True
+
+        # Check gitignore patterns with git's rules, relative to the root
+        if (
+            self._gitignore_spec is not None
+            and rel_path is not None
+            and self._gitignore_spec.match_file(rel_path)
+        ):
+            return True
 
         # Ignore common patterns
-        common_ignores = [
-            "__pycache__",
-            ".git",
-            ".svn",
-            "node_modules",
-            "venv",
-            "env",
-            ".env",
-            "build",
-            "dist",
-            ".pytest_cache",
-            ".tox",
-            "*.pyc",
-            "*.pyo",
-            "*.so",
-            "*.dylib",
-            "*.min.js",
-            "*.bundle.js",
-        ]
-        
-        for ignore in common_ignores:
-            if ignore in str(file_path):
-                return True
-
-        return False
+        return any(ignore in path_str for ignore in _COMMON_IGNORES)
 
     def _load_gitignore(self, root_path: Path) -> None:
         """
@@ -163,6 +248,8 @@ class FileDiscovery:
         Args:
             root_path: Root directory to search for .gitignore
         """
+        # The spec reflects this root only; rediscovery must not repeat lines
+        self._gitignore_lines = []
         gitignore_path = root_path / ".gitignore"
         if gitignore_path.exists():
             try:
@@ -171,9 +258,17 @@ class FileDiscovery:
                         line = line.strip()
                         if line and not line.startswith("#"):
                             self.gitignore_patterns.add(line)
+                            self._gitignore_lines.append(line)
             except Exception:
                 pass  # Ignore errors reading .gitignore
 
+        if pathspec is not None:
+            self._gitignore_spec = pathspec.GitIgnoreSpec.from_lines(self._gitignore_lines)
+        else:
+            self._ignore_re = compile_globs(
+                tuple(self.ignore_patterns) + tuple(sorted(self.gitignore_patterns))
+            )
+
     @staticmethod
     def detect_language(file_path: Path) -> Optional[str]:
         """
@@ -202,32 +297,85 @@ class FileDiscovery:
         return list(FileDiscovery.LANGUAGE_EXTENSIONS.keys())
 
 
-def read_file(file_path: Path, encoding: str = "utf-8") -> str:
+def read_file_bytes(file_path: Path) -> bytes:
     """
-    Read file contents safely.
+    Read raw file contents safely.
 
     Args:
         file_path: Path to file
-        encoding: File encoding
 
     Returns:
-        File contents as string
+        File contents as bytes
 
     Raises:
         FileAccessError: If file cannot be read
     """
+    # One sized os.read skips the buffered/text layers and their extra syscalls
     try:
-        with open(file_path, "r", encoding=encoding) as f:
-            return f.read()
-    except UnicodeDecodeError:
-        # Try with different encoding
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
         try:
-            with open(file_path, "r", encoding="latin-1") as f:
-                return f.read()
-        except Exception as e:
-            raise FileAccessError(f"Cannot read file: {e}", str(file_path))
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size) if size else b""
+            if len(data) < size or not size:
+                # Short read or no size reported: read the rest until EOF
+                chunks = [data]
+                while True:
+                    chunk = os.read(fd, 1 << 16)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                data = b"".join(chunks)
+        finally:
+            os.close(fd)
     except Exception as e:
         raise FileAccessError(f"Cannot read file: {e}", str(file_path))
+    return data
+
+
+def decode_text(data: bytes, file_path: Path, encoding: str = "utf-8") -> str:
+    """
+    Decode raw file contents the way read_file() does.
+
+    Args:
+        data: Raw file contents
+        file_path: Path the contents were read from (for error reporting)
+        encoding: File encoding
+
+    Returns:
+        Decoded text with newlines normalized to "\\n"
+
+    Raises:
+        FileAccessError: If the encoding is unknown
+    """
+    try:
+        text = data.decode(encoding)
+    except UnicodeDecodeError:
+        # Try with different encoding
+        text = data.decode("latin-1")
+    except LookupError as e:
+        raise FileAccessError(f"Cannot read file: {e}", str(file_path))
+
+    # Match text-mode reads, which translate all newline styles to "\n"
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_file(file_path: Path, encoding: str = "utf-8") -> str:
+    """
+    Read file contents safely.
+
+    Args:
+        file_path: Path to file
+        encoding: File encoding
+
+    Returns:
+        File contents as string
+
+    Raises:
+        FileAccessError: If file cannot be read
+    """
+    return decode_text(read_file_bytes(file_path), file_path, encoding)
 
 
 def write_file(file_path: Path, content: str, encoding: str = "utf-8") -> None:
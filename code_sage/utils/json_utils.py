@@ -0,0 +1,119 @@
+"""JSON serialization helpers using orjson when it is installed."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Buffer size for report files, so large documents go out in few write calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Stands in for a streamed list while the rest of the document is encoded
+_RECORDS_PLACEHOLDER = "\0records\0"
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text, as bytes or str
+
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_indented(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, as write_json() lays it out."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def dumps_json(data: Any) -> str:
+    """
+    Serialize data to an indented JSON string.
+
+    Args:
+        data: JSON-compatible data
+
+    Returns:
+        JSON text indented by two spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+def dumps_json_compact(data: Any) -> bytes:
+    """
+    Serialize data to compact JSON bytes, for machine-read files.
+
+    Args:
+        data: JSON-compatible data
+
+    Returns:
+        UTF-8 encoded JSON without indentation
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def write_json(data: Any, output_path: Path) -> None:
+    """
+    Write data to a file as indented JSON.
+
+    With orjson the document is encoded in C straight to bytes; otherwise the
+    stdlib encoder streams chunks to the file instead of building one string.
+
+    Args:
+        data: JSON-compatible data
+        output_path: Destination file
+    """
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(json.JSONEncoder(indent=2).iterencode(data))
+
+
+def write_json_records(
+    data: Dict[str, Any], key: str, records: Iterable[Any], output_path: Path
+) -> None:
+    """
+    Write a top-level object as indented JSON, streaming one list member.
+
+    The output matches write_json() for ``{**data, key: list(records)}``,
+    but records are encoded and written one at a time, so the whole list
+    never has to exist as Python objects at once.
+
+    Args:
+        data: JSON-compatible top-level object, in output key order
+        key: Key of data whose value is replaced by the records
+        records: JSON-compatible records, consumed lazily
+        output_path: Destination file
+    """
+    document = dict(data)
+    document[key] = _RECORDS_PLACEHOLDER
+    head, _, tail = _dumps_indented(document).partition(_dumps_indented(_RECORDS_PLACEHOLDER))
+
+    with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(head)
+        empty = True
+        for record in records:
+            f.write(b"[\n    " if empty else b",\n    ")
+            # Members of the top-level object sit two spaces deep, list items four
+            f.write(_dumps_indented(record).replace(b"\n", b"\n    "))
+            empty = False
+        f.write(b"[]" if empty else b"\n  ]")
+        f.write(tail)
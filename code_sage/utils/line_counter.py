@@ -0,0 +1,85 @@
+"""Blank and comment line counting with an optional Numba-compiled kernel."""
+
+from typing import List, Tuple
+
+
+def _count_ascii(buf: bytes) -> Tuple[int, int]:
+    """
+    Count blank and '#'-comment lines in an ASCII buffer.
+
+    Line breaks and whitespace follow str.splitlines() and str.strip() for
+    ASCII input, so the counts match the pure-Python loop exactly.
+
+    Args:
+        buf: ASCII-encoded file contents
+
+    Returns:
+        Tuple of (blank lines, comment lines)
+    """
+    blank = 0
+    comment = 0
+    in_line = False  # Any byte seen since the last line break
+    first = 0  # First non-whitespace byte of the current line (0 if none yet)
+    n = len(buf)
+    i = 0
+    while i < n:
+        b = buf[i]
+        # \n \v \f \r and the \x1c-\x1e separators end a line
+        if b == 10 or b == 11 or b == 12 or b == 13 or b == 28 or b == 29 or b == 30:
+            if first == 0:
+                blank += 1
+            elif first == 35:
+                comment += 1
+            if b == 13 and i + 1 < n and buf[i + 1] == 10:
+                i += 1
+            in_line = False
+            first = 0
+        else:
+            in_line = True
+            # \t, \x1f and space are whitespace that does not break lines
+            if first == 0 and b != 9 and b != 31 and b != 32:
+                first = b
+        i += 1
+
+    if in_line:
+        if first == 0:
+            blank += 1
+        elif first == 35:
+            comment += 1
+    return blank, comment
+
+
+try:
+    from numba import njit
+except ImportError:
+    _count_ascii_native = None
+else:
+    _count_ascii_native = njit(cache=True, nogil=True)(_count_ascii)
+
+
+def count_blank_and_comment_lines(content: str, lines: List[str]) -> Tuple[int, int]:
+    """
+    Count blank lines and lines starting with '#'.
+
+    Uses the compiled kernel when numba is installed and the content is
+    ASCII; otherwise classifies the already-split lines in Python.
+
+    Args:
+        content: File contents
+        lines: ``content.splitlines()``
+
+    Returns:
+        Tuple of (blank lines, comment lines)
+    """
+    if _count_ascii_native is not None and content.isascii():
+        counts: Tuple[int, int] = _count_ascii_native(content.encode("ascii"))
+        return counts
+
+    blank_lines = comment_lines = 0
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            blank_lines += 1
+        elif stripped[0] == "#":
+            comment_lines += 1
+    return blank_lines, comment_lines
@@ -1,4 +1,5 @@
 """Setup script for Code Sage."""
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -6,6 +7,21 @@ from pathlib import Path
 readme_file = Path(__file__).parent / "README.md"
 long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
 
+# Opt-in native build of the Python AST analyzer (requires mypy):
+#   CODE_SAGE_MYPYC=1 pip install .
+# The pure-Python module is used whenever the extension is not built.
+ext_modules = []
+if os.environ.get("CODE_SAGE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "--ignore-missing-imports",
+            "--follow-imports=silent",
+            "code_sage/analyzers/python_analyzer.py",
+        ]
+    )
+
 setup(
     name="code-sage-ai",
     version="1.0.0",
@@ -17,6 +33,7 @@ setup(
     url="https://github.com/stanveer/Code-Sage",
     packages=find_packages(exclude=["tests", "tests.*"]),
     include_package_data=True,
+    ext_modules=ext_modules,
     python_requires=">=3.8",
     install_requires=[
         "click>=8.1.0",
@@ -54,6 +71,18 @@ setup(
             "mypy>=1.8.0",
             "tox>=4.12.0",
         ],
+        "speedups": [
+            "tiktoken>=0.5.0",
+            "hyperscan>=0.4.0",
+            "numba>=0.57.0",
+            "orjson>=3.9.0",
+            "pathspec>=0.10.0",
+            "rapidfuzz>=3.0.0",
+        ],
+        "semantic-cache": [
+            "numpy>=1.24.0",
+            "sentence-transformers>=2.2.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,83 @@
+"""Tests for AI response caching."""
+
+import tempfile
+from pathlib import Path
+
+from code_sage.ai.cache import LLMCache
+from code_sage.ai.provider import AIProvider
+from code_sage.core.config import AIConfig
+
+
+class FakeProvider(AIProvider):
+    """Provider that counts calls instead of hitting an API."""
+
+    name = "fake"
+
+    def __init__(self, config: AIConfig, cache: LLMCache):
+        super().__init__(config, cache)
+        self.model = "fake-model"
+        self.calls = 0
+
+    def _create(self, system_prompt: str, prompt: str, json_mode: bool = False) -> str:
+        self.calls += 1
+        return f"response to {prompt}"
+
+    def analyze_code(self, code: str, context: str, language: str) -> str:
+        return self._complete("system", code)
+
+    def explain_issue(self, issue_description: str, code: str, language: str) -> str:
+        return self._complete("system", issue_description)
+
+    def suggest_fix(self, issue_description: str, code: str, language: str) -> dict:
+        return {}
+
+
+class TestLLMCache:
+    """Test LLM response cache."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = LLMCache(Path(self.tmpdir.name))
+
+    def teardown_method(self) -> None:
+        """Clean up test fixtures."""
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_set_and_get(self) -> None:
+        """Test storing and retrieving a response."""
+        key = LLMCache.make_key("openai", "gpt", 0, "system", "prompt")
+
+        assert self.cache.get(key) is None
+        self.cache.set(key, "answer")
+        assert self.cache.get(key) == "answer"
+        assert self.cache.stats == {"hits": 1, "misses": 1}
+
+    def test_expired_entries_miss(self) -> None:
+        """Test that entries past their TTL are not served."""
+        self.cache.ttl_seconds = -1
+        key = LLMCache.make_key("openai", "gpt", 0, "system", "prompt")
+        self.cache.set(key, "answer")
+
+        assert self.cache.get(key) is None
+
+    def test_provider_caches_deterministic_requests(self) -> None:
+        """Test that temperature 0 requests are served from the cache."""
+        provider = FakeProvider(AIConfig(temperature=0), self.cache)
+
+        first = provider.explain_issue("issue", "code", "python")
+        second = provider.explain_issue("issue", "code", "python")
+
+        assert first == second
+        assert provider.calls == 1
+        assert provider.stats["hits"] == 1
+
+    def test_provider_skips_cache_when_sampling(self) -> None:
+        """Test that non-zero temperature bypasses the cache."""
+        provider = FakeProvider(AIConfig(temperature=0.3), self.cache)
+
+        provider.explain_issue("issue", "code", "python")
+        provider.explain_issue("issue", "code", "python")
+
+        assert provider.calls == 2
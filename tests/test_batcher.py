@@ -0,0 +1,75 @@
+"""Tests for background batching of enriched issues."""
+
+import threading
+from typing import List
+
+from code_sage.ai.batcher import EnrichmentBatcher
+from code_sage.core.models import CodeLocation, Issue, IssueCategory, IssueSeverity
+
+
+def _issue(issue_id: str) -> Issue:
+    return Issue(
+        id=issue_id,
+        title="title",
+        description="description",
+        severity=IssueSeverity.LOW,
+        category=IssueCategory.BUG,
+        location=CodeLocation(file_path="a.py", line_start=1, line_end=1),
+    )
+
+
+class TestEnrichmentBatcher:
+    """Test enrichment batcher flushing and shutdown."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.batches: List[List[str]] = []
+        self.flushed = threading.Event()
+
+    def _sink(self, batch: List[Issue]) -> None:
+        self.batches.append([issue.id for issue in batch])
+        self.flushed.set()
+
+    def test_full_batches_are_flushed(self) -> None:
+        """Test that a batch is flushed as soon as it reaches batch_size."""
+        batcher = EnrichmentBatcher(self._sink, batch_size=2, flush_interval=10.0)
+        for i in range(5):
+            batcher.submit(_issue(str(i)))
+        batcher.close(timeout=5.0)
+
+        assert self.batches == [["0", "1"], ["2", "3"], ["4"]]
+
+    def test_partial_batch_is_flushed_after_interval(self) -> None:
+        """Test that a partial batch is flushed once no more issues arrive."""
+        batcher = EnrichmentBatcher(self._sink, batch_size=100, flush_interval=0.01)
+        batcher.submit(_issue("0"))
+
+        assert self.flushed.wait(timeout=5.0)
+        assert self.batches == [["0"]]
+        batcher.close(timeout=5.0)
+
+    def test_close_flushes_pending_issues_and_stops_worker(self) -> None:
+        """Test that close() persists queued issues and joins the worker thread."""
+        batcher = EnrichmentBatcher(self._sink, batch_size=100, flush_interval=10.0)
+        batcher.submit(_issue("0"))
+        batcher.submit(_issue("1"))
+        batcher.close(timeout=5.0)
+
+        assert self.batches == [["0", "1"]]
+        assert not batcher._thread.is_alive()
+
+    def test_sink_failure_does_not_stop_worker(self) -> None:
+        """Test that a failing sink is logged and later batches still flush."""
+        calls: List[int] = []
+
+        def sink(batch: List[Issue]) -> None:
+            calls.append(len(batch))
+            if len(calls) == 1:
+                raise OSError("disk full")
+
+        batcher = EnrichmentBatcher(sink, batch_size=1, flush_interval=10.0)
+        batcher.submit(_issue("0"))
+        batcher.submit(_issue("1"))
+        batcher.close(timeout=5.0)
+
+        assert calls == [1, 1]
@@ -41,6 +41,18 @@ class TestConfig:
             assert config.ai.provider == "openai"
             assert config.analysis.min_severity == "medium"
 
+    def test_cached_load_returns_independent_configs(self) -> None:
+        """Test that configs loaded from the parse cache do not share state."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text("analysis:\n  enabled_languages: [python]\n")
+
+            first = Config.from_file(config_path)
+            first.analysis.enabled_languages.append("go")
+            second = Config.from_file(config_path)
+
+            assert second.analysis.enabled_languages == ["python"]
+
     def test_validation(self) -> None:
         """Test configuration validation."""
         config = Config()
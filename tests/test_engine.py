@@ -0,0 +1,143 @@
+"""Tests for the analysis engine."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+import yaml
+
+from code_sage.core import engine as engine_module
+from code_sage.core.config import Config
+from code_sage.core.engine import AnalysisEngine
+from code_sage.core.models import IssueCategory, IssueSeverity
+from code_sage.core.pattern_matcher import PatternRule
+
+
+class TestConfigForPath:
+    """Test per-repository config discovery."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.source = self.root / "a.py"
+        self.source.write_text("x = 1\n")
+        self.engine = AnalysisEngine()
+
+    def teardown_method(self) -> None:
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def _write_config(self, min_severity: str) -> Path:
+        config_file = self.root / ".codesage.yaml"
+        config_file.write_text(yaml.dump({"analysis": {"min_severity": min_severity}}))
+        return config_file
+
+    def test_cached_config_is_reused(self) -> None:
+        """Test that an unchanged config file is loaded only once."""
+        self._write_config("high")
+
+        config = self.engine.config_for_path(self.source)
+
+        assert config.analysis.min_severity == "high"
+        assert self.engine.config_for_path(self.source) is config
+
+    def test_changed_config_is_reloaded(self) -> None:
+        """Test that editing the config file invalidates the cached config."""
+        config_file = self._write_config("high")
+        first = self.engine.config_for_path(self.source)
+
+        self._write_config("low")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second = self.engine.config_for_path(self.source)
+
+        assert second is not first
+        assert second.analysis.min_severity == "low"
+
+    def test_missing_config_is_cached_until_expiry(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that directories without a config skip the walk until the miss expires."""
+        base_config = self.engine.config_for_path(self.source)
+        self._write_config("high")
+
+        assert self.engine.config_for_path(self.source) is base_config
+
+        monkeypatch.setattr(engine_module, "_CONFIG_MISS_TTL", 0.0)
+
+        assert self.engine.config_for_path(self.source).analysis.min_severity == "high"
+
+
+class TestEngineIsolation:
+    """Test that engines do not share analyzer configuration."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.source = self.root / "a.py"
+        self.source.write_text("def f():\n    a = 1\n    b = 2\n    c = 3\n    return a + b + c\n")
+        (self.root / ".codesage.yaml").write_text(
+            yaml.dump({"analysis": {"max_function_length": 3}, "cache": {"enabled": False}})
+        )
+
+    def teardown_method(self) -> None:
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def _titles(engine: AnalysisEngine, path: Path) -> list:
+        result = engine.analyze_path(path)
+        return [issue.title for analysis in result.file_analyses for issue in analysis.issues]
+
+    def test_repository_config_applies_to_second_engine(self) -> None:
+        """Test that per-repo settings win even after another engine was created."""
+        config = Config()
+        config.cache.enabled = False
+        default_engine = AnalysisEngine(config)
+        discovering_engine = AnalysisEngine()
+
+        assert "Long Function: f" not in self._titles(default_engine, self.source)
+        assert "Long Function: f" in self._titles(discovering_engine, self.source)
+        assert "Long Function: f" not in self._titles(default_engine, self.source)
+        assert default_engine.config.analysis.max_function_length == 50
+
+
+class TestResultCaching:
+    """Test the engine's use of the result cache."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.source = self.root / "a.py"
+        self.source.write_text("foo = 1\n")
+        config = Config()
+        config.cache.cache_dir = str(self.root / "cache")
+        self.engine = AnalysisEngine(config)
+
+    def teardown_method(self) -> None:
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_added_pattern_rules_invalidate_cached_results(self) -> None:
+        """Test that results cached before a rule was added are not served after."""
+        assert self.engine.analyze_file(self.source).issues == []
+
+        self.engine.pattern_matcher.add_rule(
+            PatternRule(
+                id="no-foo",
+                name="Foo",
+                description="",
+                pattern=r"\bfoo\b",
+                severity=IssueSeverity.LOW,
+                category=IssueCategory.CODE_SMELL,
+                languages=["python"],
+                message="Avoid foo",
+            )
+        )
+        analysis = self.engine.analyze_file(self.source)
+
+        assert [issue.rule_id for issue in analysis.issues] == ["no-foo"]
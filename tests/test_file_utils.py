@@ -0,0 +1,48 @@
+"""Tests for file discovery."""
+
+import tempfile
+from pathlib import Path
+
+from code_sage.utils.file_utils import FileDiscovery
+
+
+class TestFileDiscovery:
+    """Test file discovery and filtering."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        for name in ["main.py", "notes.txt", "build/out.py", "src/app.py", "src/skip.py"]:
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n")
+
+    def teardown_method(self) -> None:
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_include_and_ignore_patterns(self) -> None:
+        """Test that include and ignore globs select files."""
+        discovery = FileDiscovery(include_patterns=["*.py"], ignore_patterns=["skip.py"])
+        files = discovery.discover_files(self.root)
+
+        assert [f.relative_to(self.root).as_posix() for f in files] == ["main.py", "src/app.py"]
+
+    def test_gitignore_is_respected(self) -> None:
+        """Test that .gitignore patterns exclude files and directories."""
+        (self.root / ".gitignore").write_text("src/\n")
+        discovery = FileDiscovery(include_patterns=["*.py"])
+        files = discovery.discover_files(self.root)
+
+        assert [f.relative_to(self.root).as_posix() for f in files] == ["main.py"]
+
+    def test_rediscovery_does_not_repeat_gitignore_lines(self) -> None:
+        """Test that discovering the same root again reloads .gitignore from scratch."""
+        (self.root / ".gitignore").write_text("src/\n")
+        discovery = FileDiscovery(include_patterns=["*.py"])
+        first = discovery.discover_files(self.root)
+        second = discovery.discover_files(self.root)
+
+        assert first == second
+        assert discovery._gitignore_lines == ["src/"]
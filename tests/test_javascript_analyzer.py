@@ -0,0 +1,110 @@
+"""Tests for JavaScript analyzer."""
+
+from pathlib import Path
+
+import pytest
+
+from code_sage.analyzers.javascript_analyzer import JavaScriptAnalyzer, _get_hyperscan_db
+
+CONSOLE_LOG, LOOSE_EQ, VAR, EVAL = range(4)
+
+# One-line sources and the rules expected to fire on them
+RULE_CASES = [
+    ("if (a == b) {}", {LOOSE_EQ}),
+    ("if (a==b) {}", {LOOSE_EQ}),
+    ("if (a === b && c == d) {}", {LOOSE_EQ}),
+    ("if (a === b) {}", set()),
+    ("if (a !== b || a != c) {}", set()),
+    ("var x = 1;", {VAR}),
+    ("\tvar\tx = 1;", {VAR}),
+    ("let variable = avar;", set()),
+    ("console.log(x);", {CONSOLE_LOG}),
+    ("myconsole.log(x); console.logger(x);", set()),
+    ("eval(code);", {EVAL}),
+    ("eval (code);", {EVAL}),
+    ("evaluate(code); myeval(code);", set()),
+    ("  // var x = eval(y); console.log(a == b);", set()),
+    ("run(); // console.log(x)", {CONSOLE_LOG}),
+    ("const needle = 'eval(';", set()),
+    ("var ok = a == b; eval(s); console.log(ok);", {VAR, LOOSE_EQ, EVAL, CONSOLE_LOG}),
+]
+
+
+class TestJavaScriptAnalyzer:
+    """Test JavaScript analyzer."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.analyzer = JavaScriptAnalyzer()
+
+    def test_rule_semantics(self) -> None:
+        """Test which lines each common-issue rule reports."""
+        for line, rules in RULE_CASES:
+            assert self.analyzer._scan_regex(line) == {(1, rule) for rule in rules}, line
+
+    def test_comment_lines_are_skipped_per_line(self) -> None:
+        """Test that only lines starting with // are skipped."""
+        content = "// var a;\nvar b;\n    // eval(c)\neval(d);\n"
+
+        assert self.analyzer._scan_regex(content) == {(2, VAR), (4, EVAL)}
+
+    def test_eval_pattern_checks_are_exempt(self) -> None:
+        """Test that code looking for eval( is not reported as eval usage."""
+        assert self.analyzer._is_eval_pattern_check("if (src.includes('eval(')) {")
+        assert not self.analyzer._is_eval_pattern_check("eval(src);")
+        assert self.analyzer._scan_regex('const hit = "eval(" in line;') == set()
+
+    def test_scanners_agree(self) -> None:
+        """Test that the Hyperscan scanner reports exactly what the regex scanner does."""
+        db = _get_hyperscan_db()
+        if db is None:
+            pytest.skip("hyperscan not installed")
+
+        lines = [line for line, _ in RULE_CASES]
+        for content in lines + ["\n".join(lines), "\n".join(lines) + "\n"]:
+            assert self.analyzer._scan_hyperscan(db, content.encode()) == (
+                self.analyzer._scan_regex(content)
+            ), content
+
+    def test_issues_are_ordered_by_line_then_rule(self) -> None:
+        """Test the per-line order of reported issues."""
+        content = "var ok = a == b; eval(s); console.log(ok);\nvar c;\n"
+        analysis = self.analyzer.analyze_file(Path("example.js"), content)
+
+        assert [(i.location.line_start, i.title) for i in analysis.issues] == [
+            (1, "Console.log Statement"),
+            (1, "Loose Equality Comparison"),
+            (1, "Use of 'var' Keyword"),
+            (1, "Use of eval()"),
+            (2, "Use of 'var' Keyword"),
+        ]
+
+    def test_regex_lines_follow_splitlines(self) -> None:
+        """Test that every line break splitlines() knows advances the line number."""
+        for line_break in ("\r\n", "\r", "\x0b", "\x0c", "\x1c", "\x85", "\u2028", "\u2029"):
+            content = f"var a = 1;{line_break}\nconsole.log(a);\n"
+            line_num = content.splitlines().index("console.log(a);") + 1
+
+            assert self.analyzer._scan_regex(content) == {(1, VAR), (line_num, CONSOLE_LOG)}
+
+    def test_hyperscan_lines_follow_splitlines(self) -> None:
+        """Test that the Hyperscan scanner numbers lines like the regex scanner."""
+        db = _get_hyperscan_db()
+        if db is None:
+            pytest.skip("hyperscan not installed")
+
+        for line_break in ("\r\n", "\r", "\x0b", "\x0c", "\x1c", "\x85", "\u2028", "\u2029"):
+            content = f"var a = 1;{line_break}\nconsole.log(a);\n"
+
+            assert self.analyzer._scan_hyperscan(db, content.encode()) == (
+                self.analyzer._scan_regex(content)
+            )
+
+    def test_snippet_points_at_reported_line(self) -> None:
+        """Test that issues after a form feed point their snippet at the right line."""
+        content = "var a = 1;\x0c\nconsole.log(a);\n"
+        analysis = self.analyzer.analyze_file(Path("example.js"), content)
+        issue = next(i for i in analysis.issues if i.title == "Console.log Statement")
+
+        assert issue.location.line_start == 3
+        assert "\u2192    3 | console.log(a);" in (issue.get_snippet() or "")
@@ -0,0 +1,27 @@
+"""Tests for blank and comment line counting."""
+
+from code_sage.utils.line_counter import _count_ascii, count_blank_and_comment_lines
+
+
+class TestLineCounter:
+    """Test line classification."""
+
+    def test_counts_blank_and_comment_lines(self) -> None:
+        """Test counting on ordinary source."""
+        content = "# header\n\nx = 1\n    # indented\n   \ny = 2  # trailing\n"
+
+        assert count_blank_and_comment_lines(content, content.splitlines()) == (2, 2)
+
+    def test_kernel_matches_splitlines_semantics(self) -> None:
+        """Test that the ASCII kernel agrees with str.splitlines() and str.strip()."""
+        samples = [
+            "",
+            "#",
+            "a\r\n\r\n# c\r",
+            "\x0c# form feed\x0b\x1c\x1f\n",
+            "\t \n#x\ny",
+            "no newline at end  ",
+        ]
+        for content in samples:
+            expected = count_blank_and_comment_lines(content, content.splitlines())
+            assert _count_ascii(content.encode("ascii")) == expected, repr(content)
@@ -0,0 +1,59 @@
+"""Tests for core data models."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from code_sage.core.models import (
+    AnalysisResult,
+    CodeLocation,
+    FileAnalysis,
+    Issue,
+    IssueCategory,
+    IssueSeverity,
+)
+
+
+def _issue(severity: IssueSeverity) -> Issue:
+    return Issue(
+        id="id",
+        title="title",
+        description="description",
+        severity=severity,
+        category=IssueCategory.BUG,
+        location=CodeLocation(file_path="a.py", line_start=1, line_end=1),
+    )
+
+
+class TestAnalysisResult:
+    """Test analysis result aggregation."""
+
+    def test_counts_follow_replaced_issue_lists(self) -> None:
+        """Test that cached counts are refreshed when a file's issues change."""
+        result = AnalysisResult(project_path=".")
+        file_analysis = FileAnalysis(file_path="a.py", language="python")
+        file_analysis.issues = [_issue(IssueSeverity.HIGH), _issue(IssueSeverity.LOW)]
+        result.add_file_analysis(file_analysis)
+
+        assert result.get_severity_counts()["high"] == 1
+        assert result.get_category_counts()["bug"] == 2
+
+        file_analysis.issues = [_issue(IssueSeverity.LOW)]
+
+        assert result.get_severity_counts()["high"] == 0
+        assert result.get_category_counts()["bug"] == 1
+
+    def test_dump_json_matches_to_dict(self) -> None:
+        """Test that the streamed JSON document equals the dict form."""
+        result = AnalysisResult(project_path=".")
+        for name in ("a.py", "b.py"):
+            file_analysis = FileAnalysis(file_path=name, language="python")
+            file_analysis.issues = [_issue(IssueSeverity.MEDIUM)]
+            result.add_file_analysis(file_analysis)
+        result.generate_summary()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "result.json"
+            result.dump_json(output_path)
+
+            assert json.loads(output_path.read_text()) == result.to_dict()
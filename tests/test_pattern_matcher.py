@@ -0,0 +1,80 @@
+"""Tests for the pattern matching engine."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from code_sage.core.exceptions import FileAccessError
+from code_sage.core.models import IssueCategory, IssueSeverity
+from code_sage.core.pattern_matcher import PatternMatcher, PatternRule
+
+
+class TestPatternMatcher:
+    """Test pattern matching."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.matcher = PatternMatcher()
+
+    def _matches(self, content: str) -> list:
+        issues = self.matcher.match_file(Path("example.py"), content, "python")
+        return [(issue.rule_id, issue.location.line_start) for issue in issues]
+
+    def test_matches_are_reported_per_line(self) -> None:
+        """Test that patterns never match across line breaks."""
+        content = "try:\n    x()\nexcept ValueError:\n    pass\nexcept KeyError: pass\n"
+
+        assert self._matches(content) == [("except-pass", 5)]
+
+    def test_other_line_breaks_match_like_newlines(self) -> None:
+        """Test that files with \\r\\n endings report the same lines."""
+        content = "x = 1\nprint(x)  # TODO\n"
+
+        assert self._matches(content.replace("\n", "\r\n")) == self._matches(content)
+        assert self._matches(content) == [("debug-print", 2), ("todo-comment", 2)]
+
+    def test_match_mmap_matches_match_file(self) -> None:
+        """Test that scanning a mapped file reports the same issues."""
+        content = 'password = "hunter2"\nprint(1)\n\n# TODO: tidy\n'
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "example.py"
+            file_path.write_text(content)
+
+            mapped = self.matcher.match_mmap(file_path, "python")
+            expected = self.matcher.match_file(file_path, content, "python")
+
+        assert mapped == expected
+        assert len(mapped) == 3
+
+    def test_match_mmap_reports_unreadable_files(self) -> None:
+        """Test that a missing file raises FileAccessError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "missing.py"
+
+            with pytest.raises(FileAccessError) as excinfo:
+                self.matcher.match_mmap(file_path, "python")
+
+        assert excinfo.value.file_path == str(file_path)
+
+    def test_fingerprint_follows_rules(self) -> None:
+        """Test that adding a rule changes the rule set fingerprint."""
+        before = self.matcher.fingerprint()
+
+        assert PatternMatcher().fingerprint() == before
+
+        self.matcher.add_rule(
+            PatternRule(
+                id="no-foo",
+                name="Foo",
+                description="",
+                pattern=r"\bfoo\b",
+                severity=IssueSeverity.LOW,
+                category=IssueCategory.CODE_SMELL,
+                languages=["python"],
+                message="Avoid foo",
+            )
+        )
+
+        assert self.matcher.fingerprint() != before
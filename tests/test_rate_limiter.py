@@ -0,0 +1,36 @@
+"""Tests for AI request rate limiting."""
+
+from code_sage.ai.rate_limiter import RateLimiter, get_rate_limiter
+
+
+class TestRateLimiter:
+    """Test token bucket rate limiter."""
+
+    def test_admits_within_capacity(self) -> None:
+        """Test that requests within quota are admitted immediately."""
+        limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=1000)
+
+        assert limiter.try_acquire(100) == 0.0
+        assert limiter.try_acquire(100) == 0.0
+
+    def test_waits_when_requests_exhausted(self) -> None:
+        """Test that exceeding the request quota returns a wait time."""
+        limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=1000)
+
+        assert limiter.try_acquire(10) == 0.0
+        assert limiter.try_acquire(10) > 0
+
+    def test_waits_when_tokens_exhausted(self) -> None:
+        """Test that exceeding the token quota returns a wait time."""
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=1000)
+
+        assert limiter.try_acquire(900) == 0.0
+        assert limiter.try_acquire(500) > 0
+
+    def test_shared_per_model(self) -> None:
+        """Test that limiters are shared per provider model."""
+        first = get_rate_limiter("openai", "test-model", 10, 1000)
+        second = get_rate_limiter("openai", "test-model", 10, 1000)
+
+        assert first is second
+        assert get_rate_limiter("anthropic", "test-model", 10, 1000) is not first
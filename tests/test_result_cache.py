@@ -0,0 +1,119 @@
+"""Tests for the on-disk analysis result cache."""
+
+import tempfile
+from pathlib import Path
+
+from code_sage.core.analyzer import SnippetLoader
+from code_sage.core.models import (
+    CodeLocation,
+    CodeMetrics,
+    FileAnalysis,
+    Issue,
+    IssueCategory,
+    IssueSeverity,
+)
+from code_sage.core.result_cache import ResultCache
+
+
+class TestResultCache:
+    """Test analysis result cache."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(Path(self.tmpdir.name), "fingerprint")
+
+    def teardown_method(self) -> None:
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_set_and_get(self) -> None:
+        """Test storing and retrieving an analysis."""
+        key = self.cache.make_key(Path("a.py"), b"x = 1\n")
+
+        assert self.cache.get(key, "") is None
+        self.cache.set(key, FileAnalysis(file_path="a.py", language="python"))
+        cached = self.cache.get(key, "")
+
+        assert cached is not None
+        assert cached.file_path == "a.py"
+        assert self.cache.stats == {"hits": 1, "misses": 1}
+
+    def test_round_trip_preserves_analysis(self) -> None:
+        """Test that issues and metrics survive being stored as JSON."""
+        analysis = FileAnalysis(
+            file_path="a.py",
+            language="python",
+            issues=[
+                Issue(
+                    id="id",
+                    title="title",
+                    description="description",
+                    severity=IssueSeverity.HIGH,
+                    category=IssueCategory.SECURITY,
+                    location=CodeLocation(file_path="a.py", line_start=1, line_end=2),
+                    code_snippet="x = 1",
+                    metadata={"cwe": "CWE-798"},
+                )
+            ],
+            metrics=CodeMetrics(lines_of_code=3, cyclomatic_complexity=1.5),
+        )
+        key = self.cache.make_key(Path("a.py"), b"x = 1\n")
+        self.cache.set(key, analysis)
+
+        assert self.cache.get(key, "") == analysis
+
+    def test_deferred_snippets_stay_deferred(self) -> None:
+        """Test that storing an analysis does not build its deferred snippets."""
+        content = "a = 1\nb = 2\nc = 3\n"
+        loader = SnippetLoader(content.splitlines(), 2, 2)
+        issue = Issue(
+            id="id",
+            title="title",
+            description="description",
+            severity=IssueSeverity.LOW,
+            category=IssueCategory.STYLE,
+            location=CodeLocation(file_path="a.py", line_start=2, line_end=2),
+            snippet_loader=loader,
+        )
+        key = self.cache.make_key(Path("a.py"), content.encode())
+        self.cache.set(key, FileAnalysis(file_path="a.py", language="python", issues=[issue]))
+
+        assert issue.code_snippet is None
+        cached = self.cache.get(key, content)
+        assert cached is not None
+        assert cached.issues[0].code_snippet is None
+        assert cached.issues[0].get_snippet() == loader()
+
+    def test_corrupt_entries_miss(self) -> None:
+        """Test that unreadable entries are treated as misses."""
+        key = self.cache.make_key(Path("a.py"), b"x = 1\n")
+        self.cache.set(key, FileAnalysis(file_path="a.py", language="python"))
+        self.cache._entry_path(key).write_bytes(b"not json")
+
+        assert self.cache.get(key, "") is None
+
+    def test_key_changes_with_content(self) -> None:
+        """Test that edited files do not hit stale entries."""
+        key = self.cache.make_key(Path("a.py"), b"x = 1\n")
+        self.cache.set(key, FileAnalysis(file_path="a.py", language="python"))
+
+        assert self.cache.get(self.cache.make_key(Path("a.py"), b"x = 2\n"), "") is None
+
+    def test_expired_entries_miss(self) -> None:
+        """Test that entries past their TTL are not served."""
+        self.cache.ttl_seconds = -1
+        key = self.cache.make_key(Path("a.py"), b"x = 1\n")
+        self.cache.set(key, FileAnalysis(file_path="a.py", language="python"))
+
+        assert self.cache.get(key, "") is None
+
+    def test_prune_evicts_to_size_limit(self) -> None:
+        """Test that pruning keeps the cache within its size limit."""
+        for i in range(3):
+            key = self.cache.make_key(Path(f"{i}.py"), b"")
+            self.cache.set(key, FileAnalysis(file_path=f"{i}.py", language="python"))
+        self.cache.max_size_bytes = 0
+
+        assert self.cache.prune() == 3
+        assert not list(Path(self.tmpdir.name).glob("*/*.json"))